@@ -3,7 +3,45 @@ import { MetricsCard } from './components/MetricsCard';
 import { RevenueChart } from './components/RevenueChart';
 import { TopProductsTable } from './components/TopProductsTable';
 import { apiService } from './services/api';
-import type { DashboardData } from './types/dashboard';
+import type { DashboardData, DashboardDelta } from './types/dashboard';
+
+const applyDelta = (data: DashboardData, delta: DashboardDelta): DashboardData => {
+    if (delta.type === 'refresh') return data;
+
+    const metrics_history = data.metrics_history.map((day) => {
+        if (delta.type === 'sale' && day.date === delta.date) {
+            return { ...day, total_revenue: day.total_revenue + delta.revenue_delta };
+        }
+        if (delta.type === 'appointment' && delta.date !== delta.previous_date) {
+            if (day.date === delta.date) {
+                return { ...day, total_appointments: day.total_appointments + 1 };
+            }
+            if (day.date === delta.previous_date) {
+                return { ...day, total_appointments: day.total_appointments - 1 };
+            }
+        }
+        return day;
+    });
+
+    let status_distribution = data.status_distribution;
+    if (delta.type === 'appointment') {
+        const inWindow = (date: string | null) =>
+            date !== null && date >= data.period_start && date <= data.period_end;
+        const counts = new Map(status_distribution.map((s) => [s.status, s.count]));
+        if (delta.previous_status && inWindow(delta.previous_date)) {
+            counts.set(delta.previous_status, (counts.get(delta.previous_status) ?? 0) - 1);
+        }
+        if (delta.status && inWindow(delta.date)) {
+            counts.set(delta.status, (counts.get(delta.status) ?? 0) + 1);
+        }
+        status_distribution = [...counts]
+            .filter(([, count]) => count > 0)
+            .map(([status, count]) => ({ status, count }))
+            .sort((a, b) => b.count - a.count);
+    }
+
+    return { ...data, metrics_history, status_distribution };
+};
 
 function App() {
     const [data, setData] = useState<DashboardData | null>(null);
@@ -27,6 +65,17 @@ function App() {
         };
 
         fetchData();
+
+        // Live deltas only apply to daily data; bulk changes trigger a refetch.
+        return apiService.subscribeToDashboardEvents((delta) => {
+            if (delta.type === 'refresh') {
+                fetchData();
+                return;
+            }
+            setData((current) =>
+                current && current.granularity === 'day' ? applyDelta(current, delta) : current
+            );
+        });
     }, [days]);
 
     const getTotalRevenue = (): number => {
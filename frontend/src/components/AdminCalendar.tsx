@@ -1,6 +1,6 @@
-import React, { useEffect, useState } from 'react';
+import React, { useCallback, useEffect, useRef, useState } from 'react';
 import { Calendar, dateFnsLocalizer, Event as CalendarEvent, EventProps } from 'react-big-calendar';
-import { format, parse, startOfWeek, getDay, addMinutes } from 'date-fns';
+import { format, parse, startOfWeek, getDay, addMinutes, addDays, startOfMonth, endOfMonth, endOfWeek } from 'date-fns';
 import { ptBR } from 'date-fns/locale';
 import 'react-big-calendar/lib/css/react-big-calendar.css';
 import './AdminCalendar.css';
@@ -17,15 +17,27 @@ const localizer = dateFnsLocalizer({
     locales,
 });
 
+// Compact row returned by /api/v1/schedule/appointments/calendar/
 interface Appointment {
     id: number;
-    pet_name: string;
-    service_name: string;
-    schedule_time: string; // ISO string
-    service_duration: number; // minutes
-    status: 'pending' | 'confirmed' | 'completed' | 'canceled';
+    pet: string;
+    service: string;
+    start: string; // ISO string
+    duration: number; // minutes
+    status: 'PENDING' | 'CONFIRMED' | 'COMPLETED' | 'CANCELED';
 }
 
+interface DateRange {
+    start: Date;
+    end: Date;
+}
+
+// Visible range of the month view, padded to whole weeks like the calendar grid
+const monthRange = (date: Date): DateRange => ({
+    start: startOfWeek(startOfMonth(date)),
+    end: addDays(endOfWeek(endOfMonth(date)), 1),
+});
+
 interface MyEvent extends CalendarEvent {
     id: number;
     title: string;
@@ -38,10 +50,10 @@ interface MyEvent extends CalendarEvent {
 const DayEvent = ({ event }: EventProps<MyEvent>) => {
     const timeRange = `${format(event.start, 'HH:mm')} - ${format(event.end, 'HH:mm')}`;
     return (
-        <div className="event-content day-layout" title={`${timeRange} | ${event.resource.pet_name} | ${event.resource.service_name}`}>
+        <div className="event-content day-layout" title={`${timeRange} | ${event.resource.pet} | ${event.resource.service}`}>
             <span className="event-time-range">{timeRange}</span>
             <span className="event-details">
-                <strong>{event.resource.pet_name}</strong> - <i>{event.resource.service_name}</i>
+                <strong>{event.resource.pet}</strong> - <i>{event.resource.service}</i>
             </span>
         </div>
     );
@@ -51,8 +63,8 @@ const DayEvent = ({ event }: EventProps<MyEvent>) => {
 const StackedEvent = ({ event }: EventProps<MyEvent>) => {
     return (
         <div className="event-content stacked-layout">
-            <div className="event-pet">{event.resource.pet_name}</div>
-            <div className="event-service">{event.resource.service_name}</div>
+            <div className="event-pet">{event.resource.pet}</div>
+            <div className="event-service">{event.resource.service}</div>
         </div>
     );
 };
@@ -63,16 +75,16 @@ const eventStyleGetter = (event: MyEvent) => {
     let color = 'white';
 
     switch (event.resource.status) {
-        case 'confirmed':
+        case 'CONFIRMED':
             backgroundColor = '#10b981';
             break;
-        case 'pending':
+        case 'PENDING':
             backgroundColor = '#f59e0b';
             break;
-        case 'canceled':
+        case 'CANCELED':
             backgroundColor = '#ef4444';
             break;
-        case 'completed':
+        case 'COMPLETED':
             backgroundColor = '#6b7280';
             break;
     }
@@ -99,39 +111,64 @@ const AdminCalendar: React.FC = () => {
         setCurrentView(view);
     };
 
-    useEffect(() => {
-        const fetchAppointments = async () => {
-            try {
-                const response = await fetch('/api/v1/schedule/appointments/');
-                if (!response.ok) {
-                    throw new Error('Falha ao buscar agendamentos');
-                }
-                const data: Appointment[] = await response.json();
-
-                const calendarEvents: MyEvent[] = data.map((appt) => {
-                    const startDate = new Date(appt.schedule_time);
-                    const endDate = addMinutes(startDate, appt.service_duration || 30);
-
-                    return {
-                        id: appt.id,
-                        title: `${appt.service_name} - ${appt.pet_name}`,
-                        start: startDate,
-                        end: endDate,
-                        resource: appt,
-                    };
-                });
-
-                setEvents(calendarEvents);
-            } catch (error) {
-                console.error("Error fetching appointments:", error);
-            } finally {
-                setLoading(false);
+    // Last response per window, revalidated with If-None-Match
+    const cacheRef = useRef<Map<string, { etag: string | null; events: MyEvent[] }>>(new Map());
+
+    const fetchAppointments = useCallback(async (range: DateRange) => {
+        const params = new URLSearchParams({
+            start: range.start.toISOString(),
+            end: range.end.toISOString(),
+        });
+        const url = `/api/v1/schedule/appointments/calendar/?${params.toString()}`;
+        const cached = cacheRef.current.get(url);
+
+        try {
+            const response = await fetch(url, {
+                headers: cached?.etag ? { 'If-None-Match': cached.etag } : {},
+            });
+            if (response.status === 304 && cached) {
+                setEvents(cached.events);
+                return;
             }
-        };
-
-        fetchAppointments();
+            if (!response.ok) {
+                throw new Error('Falha ao buscar agendamentos');
+            }
+            const data: Appointment[] = await response.json();
+
+            const calendarEvents: MyEvent[] = data.map((appt) => {
+                const startDate = new Date(appt.start);
+                const endDate = addMinutes(startDate, appt.duration || 30);
+
+                return {
+                    id: appt.id,
+                    title: `${appt.service} - ${appt.pet}`,
+                    start: startDate,
+                    end: endDate,
+                    resource: appt,
+                };
+            });
+
+            cacheRef.current.set(url, { etag: response.headers.get('ETag'), events: calendarEvents });
+            setEvents(calendarEvents);
+        } catch (error) {
+            console.error("Error fetching appointments:", error);
+        } finally {
+            setLoading(false);
+        }
     }, []);
 
+    const handleRangeChange = (range: Date[] | { start: Date; end: Date }) => {
+        if (Array.isArray(range)) {
+            fetchAppointments({ start: range[0], end: addDays(range[range.length - 1], 1) });
+        } else {
+            fetchAppointments({ start: range.start, end: addDays(range.end, 1) });
+        }
+    };
+
+    useEffect(() => {
+        fetchAppointments(monthRange(new Date()));
+    }, [fetchAppointments]);
+
     if (loading) {
         return <div className="p-4 text-center text-gray-500">Carregando calendário...</div>;
     }
@@ -154,6 +191,7 @@ const AdminCalendar: React.FC = () => {
                 culture='pt-BR'
                 components={components}
                 onView={handleViewChange}
+                onRangeChange={handleRangeChange}
                 defaultView='month'
                 eventPropGetter={eventStyleGetter}
                 onSelectEvent={handleSelectEvent}
@@ -1,5 +1,5 @@
 import axios, { AxiosInstance } from 'axios';
-import type { DashboardData } from '../types/dashboard';
+import type { DashboardData, DashboardDelta } from '../types/dashboard';
 
 class ApiService {
     private client: AxiosInstance;
@@ -24,6 +24,20 @@ class ApiService {
         );
         return response.data;
     }
+
+    /**
+     * Subscribes to live dashboard deltas. EventSource reconnects by itself
+     * when the server closes the stream. Returns an unsubscribe function.
+     */
+    subscribeToDashboardEvents(onDelta: (delta: DashboardDelta) => void): () => void {
+        const source = new EventSource('/api/v1/analytics/dashboard/events/', {
+            withCredentials: true,
+        });
+        source.addEventListener('delta', (event) => {
+            onDelta(JSON.parse((event as MessageEvent<string>).data));
+        });
+        return () => source.close();
+    }
 }
 
 export const apiService = new ApiService();
@@ -19,6 +19,7 @@ export interface TopProduct {
 }
 
 export interface DashboardData {
+    granularity: 'day' | 'week' | 'month';
     period_start: string;
     period_end: string;
     metrics_history: DailyMetric[];
@@ -26,6 +27,28 @@ export interface DashboardData {
     top_products: TopProduct[];
 }
 
+export interface SaleDelta {
+    type: 'sale';
+    date: string;
+    revenue_delta: number;
+    sales_delta: number;
+}
+
+export interface AppointmentDelta {
+    type: 'appointment';
+    date: string | null;
+    status: string | null;
+    previous_date: string | null;
+    previous_status: string | null;
+}
+
+export interface RefreshDelta {
+    type: 'refresh';
+    dates: string[];
+}
+
+export type DashboardDelta = SaleDelta | AppointmentDelta | RefreshDelta;
+
 export interface ApiError {
     error: string;
     detail?: string;
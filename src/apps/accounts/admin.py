@@ -1,13 +1,8 @@
-from datetime import timedelta
-
 from allauth.account.models import EmailAddress
 from allauth.socialaccount.models import SocialAccount, SocialApp, SocialToken
 from django.contrib import admin
 from django.contrib.auth.admin import GroupAdmin, UserAdmin
 from django.contrib.auth.models import Group, User
-from django.db.models import DecimalField, F, Sum
-from django.db.models.functions import TruncDay
-from django.utils import timezone
 from django_celery_beat.models import (
     ClockedSchedule,
     CrontabSchedule,
@@ -17,12 +12,18 @@ from django_celery_beat.models import (
 )
 from rest_framework.authtoken.models import TokenProxy
 
+from src.apps.analytics.services import AnalyticsService
 from src.apps.health.admin import HealthRecordAdmin
 from src.apps.health.models import HealthRecord
 from src.apps.pets.admin import BreedAdmin, PetAdmin
 from src.apps.pets.models import Breed, Pet
-from src.apps.schedule.admin import AppointmentAdmin, ServiceAdmin, TimeSlotAdmin
-from src.apps.schedule.models import Appointment, Service, TimeSlot
+from src.apps.schedule.admin import (
+    AppointmentAdmin,
+    ResourceAdmin,
+    ServiceAdmin,
+    TimeSlotAdmin,
+)
+from src.apps.schedule.models import Appointment, Resource, Service, TimeSlot
 from src.apps.store.admin import (
     AutoPromotionAdmin,
     BrandAdmin,
@@ -30,6 +31,7 @@ from src.apps.store.admin import (
     ProductAdmin,
     ProductLotAdmin,
     PromotionAdmin,
+    ReorderSuggestionAdmin,
     SaleAdmin,
 )
 from src.apps.store.models import (
@@ -39,8 +41,8 @@ from src.apps.store.models import (
     Product,
     ProductLot,
     Promotion,
+    ReorderSuggestion,
     Sale,
-    SaleItem,
 )
 
 from .models import Customer
@@ -84,74 +86,10 @@ class PetCareAdminSite(admin.AdminSite):
     index_template = "admin/dashboard.html"
 
     def index(self, request, extra_context=None):
-        today = timezone.localdate()
-        now = timezone.localtime()
-        start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = start_of_day + timedelta(days=1)
-        start_of_week = today - timedelta(days=6)
-
-        sales_today = Sale.objects.filter(created_at__range=(start_of_day, end_of_day))
-        revenue_today = sales_today.aggregate(total=Sum("total_value"))["total"] or 0
-
-        appointments_today = Appointment.objects.filter(
-            schedule_time__date=today, status=Appointment.Status.CONFIRMED
-        ).count()
-
-        monthly_sales = Sale.objects.filter(
-            created_at__year=today.year, created_at__month=today.month
-        )
-        revenue_monthly = (
-            monthly_sales.aggregate(total=Sum("total_value"))["total"] or 0
-        )
-
-        new_customers_monthly = Customer.objects.filter(
-            user__date_joined__year=today.year, user__date_joined__month=today.month
-        ).count()
-
-        low_stock_threshold = 5
-        low_stock_lots = (
-            ProductLot.objects.filter(quantity__lte=low_stock_threshold, quantity__gt=0)
-            .select_related("product")
-            .order_by("quantity")[:5]
-        )
-
-        revenue_by_day = (
-            Sale.objects.filter(created_at__date__gte=start_of_week)
-            .annotate(day=TruncDay("created_at"))
-            .values("day")
-            .annotate(total=Sum("total_value"))
-            .order_by("day")
-        )
-
-        chart_data = {
-            (start_of_week + timedelta(days=i)).strftime("%d/%m"): 0 for i in range(7)
-        }
-        for entry in revenue_by_day:
-            chart_data[entry["day"].strftime("%d/%m")] = float(entry["total"])
-
-        top_products_today = (
-            SaleItem.objects.filter(sale__in=sales_today)
-            .values("lot__product__name")
-            .annotate(
-                total_sold=Sum("quantity"),
-                revenue=Sum(
-                    F("quantity") * F("unit_price"), output_field=DecimalField()
-                ),
-            )
-            .order_by("-revenue")[:5]
-        )
-
         context = {
             **self.each_context(request),
             "title": "Dashboard",
-            "revenue_today": revenue_today,
-            "appointments_today": appointments_today,
-            "revenue_monthly": revenue_monthly,
-            "new_customers_monthly": new_customers_monthly,
-            "chart_labels": list(chart_data.keys()),
-            "chart_values": list(chart_data.values()),
-            "top_products": top_products_today,
-            "low_stock_lots": low_stock_lots,
+            **AnalyticsService.get_admin_home(),
         }
 
         return super().index(request, extra_context=context)
@@ -250,6 +188,7 @@ petcare_admin_site.register(Pet, PetAdmin)
 petcare_admin_site.register(Breed, BreedAdmin)
 petcare_admin_site.register(Appointment, AppointmentAdmin)
 petcare_admin_site.register(Service, ServiceAdmin)
+petcare_admin_site.register(Resource, ResourceAdmin)
 petcare_admin_site.register(TimeSlot, TimeSlotAdmin)
 petcare_admin_site.register(Sale, SaleAdmin)
 petcare_admin_site.register(Product, ProductAdmin)
@@ -258,3 +197,4 @@ petcare_admin_site.register(Category, CategoryAdmin)
 petcare_admin_site.register(Brand, BrandAdmin)
 petcare_admin_site.register(Promotion, PromotionAdmin)
 petcare_admin_site.register(AutoPromotion, AutoPromotionAdmin)
+petcare_admin_site.register(ReorderSuggestion, ReorderSuggestionAdmin)
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:28
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0005_alter_customer_options"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    # auth.User belongs to django.contrib.auth, so its index on date_joined
+    # (used by the dashboard's new-customers range scan) is created here.
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS auth_user_date_joined_idx "
+            "ON auth_user (date_joined);",
+            reverse_sql="DROP INDEX IF EXISTS auth_user_date_joined_idx;",
+        ),
+    ]
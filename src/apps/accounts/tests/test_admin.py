@@ -24,6 +24,17 @@ class TestPetCareAdminSite:
         assert response.status_code == 200
         assert "Faturamento de Hoje" in str(response.content)
 
+    def test_dashboard_index_view_is_served_from_cache(
+        self, admin_client, django_assert_max_num_queries
+    ):
+        url = reverse("petcare_admin:index")
+        admin_client.get(url)
+
+        with django_assert_max_num_queries(4):
+            response = admin_client.get(url)
+
+        assert response.status_code == 200
+
     def test_get_app_list_customization(self, admin_client):
         """
         Tests if the app list is correctly customized and ordered.
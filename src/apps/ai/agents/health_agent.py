@@ -10,6 +10,7 @@ from django.utils import timezone
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 
+from src.apps.ai.clients import get_client
 from src.apps.ai.models import AIGeneratedContent, HealthPattern
 from src.apps.ai.prompts import health_prompts
 
@@ -46,11 +47,14 @@ class HealthAssistantService:
     """
 
     def __init__(self):
-        """Initialize LLM."""
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.GEMINI_MODEL_NAME,
-            temperature=0.5,  # Lower temperature for health analysis
-            google_api_key=settings.GOOGLE_API_KEY,
+        """Attach the process-wide LLM client."""
+        self.llm = get_client(
+            ("llm", settings.GEMINI_MODEL_NAME, 0.5),
+            lambda: ChatGoogleGenerativeAI(
+                model=settings.GEMINI_MODEL_NAME,
+                temperature=0.5,  # Lower temperature for health analysis
+                google_api_key=settings.GOOGLE_API_KEY,
+            ),
         )
 
     def analyze_pet_health(
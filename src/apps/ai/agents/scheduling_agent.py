@@ -16,6 +16,7 @@ from src.apps.ai.agents.tools import (
     check_availability,
     search_customer_pets,
 )
+from src.apps.ai.clients import get_client
 from src.apps.ai.prompts import scheduling_prompts
 from src.apps.ai.services import retry_on_rate_limit
 
@@ -61,11 +62,14 @@ class SchedulingAgentService:
     """
 
     def __init__(self):
-        """Initialize LLM and bind tools."""
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.GEMINI_MODEL_NAME,
-            temperature=0.3,
-            google_api_key=settings.GOOGLE_API_KEY,
+        """Attach the process-wide LLM client and bind tools."""
+        self.llm = get_client(
+            ("llm", settings.GEMINI_MODEL_NAME, 0.3),
+            lambda: ChatGoogleGenerativeAI(
+                model=settings.GEMINI_MODEL_NAME,
+                temperature=0.3,
+                google_api_key=settings.GOOGLE_API_KEY,
+            ),
         )
 
         self.tools = [
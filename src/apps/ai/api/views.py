@@ -20,6 +20,7 @@ from src.apps.ai.api.serializers import (
     SchedulingIntentRequestSerializer,
     SchedulingIntentResponseSerializer,
 )
+from src.apps.ai.clients import get_service
 from src.apps.ai.services import ProductDescriptionRequest, ProductIntelligenceService
 
 
@@ -39,7 +40,7 @@ def generate_product_description_ajax(request):
         if not product_name:
             return JsonResponse({"success": False, "error": "Product name is required"})
 
-        service = ProductIntelligenceService()
+        service = get_service(ProductIntelligenceService)
         request_dto = ProductDescriptionRequest(
             product_name=product_name,
             category=category,
@@ -76,7 +77,7 @@ def analyze_pet_health_ajax(request):
         if not pet_id:
             return JsonResponse({"success": False, "error": "Pet ID is required"})
 
-        service = HealthAssistantService()
+        service = get_service(HealthAssistantService)
         request_dto = HealthInsightRequest(pet_id=int(pet_id), analysis_period_days=180)
 
         result = service.analyze_pet_health(request_dto, user=request.user)
@@ -174,7 +175,7 @@ class ScheduleIntentView(APIView):
         serializer = SchedulingIntentRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        service = SchedulingAgentService()
+        service = get_service(SchedulingAgentService)
         request_dto = SchedulingIntentRequest(
             user_input=serializer.validated_data["user_input"],
             customer_id=serializer.validated_data.get("customer_id"),
@@ -0,0 +1,75 @@
+"""
+Process-wide registry of shared AI clients.
+
+Building a Gemini chat model, binding tools or opening the Chroma client is
+far more expensive than a model call, so every worker process builds each
+client once, on first use, and reuses it (and its open connections) for
+all later requests. The registry is emptied in forked children so clients
+are never shared across processes.
+"""
+
+import os
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_clients: dict[Hashable, Any] = {}
+_lock = threading.Lock()
+
+
+def get_client(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Returns the client registered under ``key``, building it on first use."""
+    try:
+        return _clients[key]
+    except KeyError:
+        pass
+
+    with _lock:
+        if key not in _clients:
+            _clients[key] = factory()
+            logger.info("ai_client_initialized", client=str(key))
+        return _clients[key]
+
+
+def get_service(service_class: type) -> Any:
+    """Shared instance of a stateless AI service class."""
+    return get_client(("service", service_class), service_class)
+
+
+def reset_clients() -> None:
+    """Drops every shared client; the next use builds a fresh one."""
+    with _lock:
+        _clients.clear()
+
+
+def warm_up() -> list[str]:
+    """
+    Builds the shared services and the clients they use, so the first real
+    request only pays for the model call. Returns the warmed services.
+    """
+    from src.apps.ai.agents.health_agent import HealthAssistantService
+    from src.apps.ai.agents.scheduling_agent import SchedulingAgentService
+    from src.apps.ai.services import ProductIntelligenceService
+
+    services = [
+        ProductIntelligenceService,
+        HealthAssistantService,
+        SchedulingAgentService,
+    ]
+    for service_class in services:
+        get_service(service_class)
+    return [service_class.__name__ for service_class in services]
+
+
+def _reset_after_fork() -> None:
+    global _lock
+    _lock = threading.Lock()
+    _clients.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -3,6 +3,7 @@
 import structlog
 from django.core.management.base import BaseCommand
 
+from src.apps.ai.clients import get_service
 from src.apps.ai.services import ProductIntelligenceService
 from src.apps.store.models import Product
 
@@ -20,7 +21,7 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        service = ProductIntelligenceService()
+        service = get_service(ProductIntelligenceService)
         products = Product.objects.all()
 
         self.stdout.write(f"Indexing {products.count()} products...")
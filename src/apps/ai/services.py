@@ -9,6 +9,7 @@ from django.conf import settings
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 
+from src.apps.ai.clients import get_client
 from src.apps.ai.embeddings.embeddings_service import EmbeddingsService
 from src.apps.ai.embeddings.vector_store import VectorStore
 from src.apps.ai.models import AIGeneratedContent, ProductEmbedding
@@ -88,14 +89,20 @@ class ProductIntelligenceService:
     """
 
     def __init__(self):
-        """Initialize LLM, embeddings, and vector store."""
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.GEMINI_MODEL_NAME,
-            temperature=0.7,
-            google_api_key=settings.GOOGLE_API_KEY,
+        """Attach the process-wide LLM, embeddings, and vector store clients."""
+        self.llm = get_client(
+            ("llm", settings.GEMINI_MODEL_NAME, 0.7),
+            lambda: ChatGoogleGenerativeAI(
+                model=settings.GEMINI_MODEL_NAME,
+                temperature=0.7,
+                google_api_key=settings.GOOGLE_API_KEY,
+            ),
+        )
+        self.embeddings_service = get_client("embeddings", EmbeddingsService)
+        self.vector_store = get_client(
+            ("vector_store", "products"),
+            lambda: VectorStore(collection_name="products"),
         )
-        self.embeddings_service = EmbeddingsService()
-        self.vector_store = VectorStore(collection_name="products")
 
     def generate_description(
         self, request: ProductDescriptionRequest, user=None
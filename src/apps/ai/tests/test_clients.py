@@ -0,0 +1,67 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+from src.apps.ai.agents.scheduling_agent import SchedulingAgentService
+from src.apps.ai.clients import get_client, get_service, reset_clients, warm_up
+
+
+class TestClientRegistry:
+    """Test suite for the process-wide AI client registry."""
+
+    def test_client_is_built_once(self):
+        factory = MagicMock(side_effect=object)
+
+        first = get_client("llm", factory)
+        second = get_client("llm", factory)
+
+        assert first is second
+        factory.assert_called_once()
+
+    def test_concurrent_first_use_builds_one_client(self):
+        factory = MagicMock(side_effect=object)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_client("x", factory)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert factory.call_count == 1
+        assert all(result is results[0] for result in results)
+
+    def test_reset_clients_rebuilds(self):
+        first = get_client("llm", object)
+        reset_clients()
+
+        assert get_client("llm", object) is not first
+
+    def test_services_share_llm_and_bind_tools_once(self):
+        with patch(
+            "src.apps.ai.agents.scheduling_agent.ChatGoogleGenerativeAI"
+        ) as mock_llm:
+            service = get_service(SchedulingAgentService)
+
+            assert get_service(SchedulingAgentService) is service
+            assert SchedulingAgentService().llm is service.llm
+
+        mock_llm.assert_called_once()
+        mock_llm.return_value.bind_tools.assert_called_once()
+
+    def test_warm_up_builds_every_service(self):
+        with (
+            patch("src.apps.ai.services.ChatGoogleGenerativeAI"),
+            patch("src.apps.ai.services.EmbeddingsService"),
+            patch("src.apps.ai.services.VectorStore"),
+            patch("src.apps.ai.agents.health_agent.ChatGoogleGenerativeAI"),
+            patch("src.apps.ai.agents.scheduling_agent.ChatGoogleGenerativeAI"),
+        ):
+            warmed = warm_up()
+
+        assert warmed == [
+            "ProductIntelligenceService",
+            "HealthAssistantService",
+            "SchedulingAgentService",
+        ]
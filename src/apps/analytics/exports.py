@@ -0,0 +1,204 @@
+"""
+Streaming BI exports of sales, sale items and appointments.
+
+Rows are read through server-side cursors (``iterator(chunk_size=...)``)
+and encoded batch by batch, so memory stays constant whatever the range.
+"""
+
+import csv
+import io
+import json
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from src.apps.schedule.models import Appointment
+from src.apps.store.models import Sale, SaleItem
+
+EXPORT_CHUNK_SIZE = 2000
+
+
+class ExportError(Exception):
+    """Raised when an export cannot be produced (e.g. a missing optional library)."""
+
+
+@dataclass(frozen=True)
+class ExportDataset:
+    columns: dict[str, str]
+    queryset: Callable[[datetime, datetime], QuerySet]
+
+    def rows(self, start: date, end: date, chunk_size: int) -> Iterator[tuple]:
+        """Rows whose timestamp falls on local days ``start`` to ``end``."""
+        range_start = timezone.make_aware(datetime.combine(start, time.min))
+        range_end = timezone.make_aware(
+            datetime.combine(end + timedelta(days=1), time.min)
+        )
+        return (
+            self.queryset(range_start, range_end)
+            .order_by("pk")
+            .values_list(*self.columns.values())
+            .iterator(chunk_size=chunk_size)
+        )
+
+
+DATASETS = {
+    "sales": ExportDataset(
+        columns={
+            "id": "id",
+            "created_at": "created_at",
+            "customer_id": "customer_id",
+            "processed_by_id": "processed_by_id",
+            "total_value": "total_value",
+        },
+        queryset=lambda start, end: Sale.objects.filter(
+            created_at__gte=start, created_at__lt=end
+        ),
+    ),
+    "sale-items": ExportDataset(
+        columns={
+            "id": "id",
+            "sale_id": "sale_id",
+            "sold_at": "sale__created_at",
+            "product_id": "lot__product_id",
+            "lot_id": "lot_id",
+            "quantity": "quantity",
+            "unit_price": "unit_price",
+        },
+        queryset=lambda start, end: SaleItem.objects.filter(
+            sale__created_at__gte=start, sale__created_at__lt=end
+        ),
+    ),
+    "appointments": ExportDataset(
+        columns={
+            "id": "id",
+            "schedule_time": "schedule_time",
+            "status": "status",
+            "pet_id": "pet_id",
+            "service_id": "service_id",
+            "service_price": "service__price",
+            "resource_id": "resource_id",
+            "completed_at": "completed_at",
+        },
+        queryset=lambda start, end: Appointment.objects.filter(
+            schedule_time__gte=start, schedule_time__lt=end
+        ),
+    ),
+}
+
+
+def _batches(rows: Iterable[tuple], size: int) -> Iterator[list[tuple]]:
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def _csv_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def render_csv(columns: list[str], rows: Iterable[tuple], batch_size: int):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for batch in _batches(rows, batch_size):
+        writer.writerows([_csv_value(v) for v in row] for row in batch)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def render_ndjson(columns: list[str], rows: Iterable[tuple], batch_size: int):
+    for batch in _batches(rows, batch_size):
+        yield "".join(
+            json.dumps(dict(zip(columns, row, strict=True)), cls=DjangoJSONEncoder)
+            + "\n"
+            for row in batch
+        )
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands back what was written since the last drain."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def render_parquet(columns: list[str], rows: Iterable[tuple], batch_size: int):
+    """
+    One Parquet row group per batch; needs the optional ``pyarrow`` package,
+    which is checked before anything is streamed.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ExportError("A exportação em Parquet requer o pacote 'pyarrow'.") from e
+
+    def chunks():
+        sink = _ChunkSink()
+        writer = None
+        try:
+            for batch in _batches(rows, batch_size):
+                values = zip(*batch, strict=True)
+                table = pa.table(
+                    {
+                        name: pa.array(column)
+                        for name, column in zip(columns, values, strict=True)
+                    }
+                )
+                if writer is None:
+                    writer = pq.ParquetWriter(sink, table.schema)
+                writer.write_table(table)
+                yield sink.drain()
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            pq.write_table(pa.table({name: [] for name in columns}), sink)
+        yield sink.drain()
+
+    return chunks()
+
+
+FORMATS = {
+    "csv": ("text/csv", render_csv),
+    "ndjson": ("application/x-ndjson", render_ndjson),
+    "parquet": ("application/vnd.apache.parquet", render_parquet),
+}
+
+
+def export_rows(
+    dataset: str,
+    file_format: str,
+    start: date,
+    end: date,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[str | bytes]:
+    """Encoded chunks of ``dataset`` between ``start`` and ``end`` (local days)."""
+    export = DATASETS[dataset]
+    _, render = FORMATS[file_format]
+    return render(list(export.columns), export.rows(start, end, chunk_size), chunk_size)
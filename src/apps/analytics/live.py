@@ -0,0 +1,69 @@
+"""
+Live dashboard deltas, fanned out to every open dashboard through Redis
+pub/sub: each committed change is published once, and each SSE connection
+only relays what it receives.
+"""
+
+import json
+import time
+from collections.abc import Iterator
+
+import redis
+import structlog
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+logger = structlog.get_logger(__name__)
+
+DASHBOARD_CHANNEL = "analytics:dashboard:events"
+HEARTBEAT_SECONDS = 15
+# Streams end after this long; EventSource reconnects on its own after
+# RECONNECT_MS, which keeps one client from pinning a worker forever.
+STREAM_MAX_SECONDS = 300
+RECONNECT_MS = 3000
+
+_client: redis.Redis | None = None
+
+
+def _redis() -> redis.Redis:
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.DASHBOARD_EVENTS_URL)
+    return _client
+
+
+def publish_dashboard_event(event: dict) -> None:
+    """
+    Publishes ``event`` to every connected dashboard.
+
+    Live updates are best effort: a Redis failure is logged and never
+    breaks the write that triggered it.
+    """
+    try:
+        _redis().publish(DASHBOARD_CHANNEL, json.dumps(event, cls=DjangoJSONEncoder))
+    except redis.RedisError as e:
+        logger.warning(
+            "dashboard_event_publish_failed", event_type=event.get("type"), error=str(e)
+        )
+
+
+def stream_dashboard_events(
+    heartbeat: int = HEARTBEAT_SECONDS, max_seconds: int = STREAM_MAX_SECONDS
+) -> Iterator[str]:
+    """Yields server-sent event frames for every published dashboard event."""
+    pubsub = _redis().pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(DASHBOARD_CHANNEL)
+    try:
+        yield f"retry: {RECONNECT_MS}\n\n"
+        deadline = time.monotonic() + max_seconds
+        while time.monotonic() < deadline:
+            message = pubsub.get_message(timeout=heartbeat)
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+            data = message["data"]
+            if isinstance(data, bytes):
+                data = data.decode()
+            yield f"event: delta\ndata: {data}\n\n"
+    finally:
+        pubsub.close()
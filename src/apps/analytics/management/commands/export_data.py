@@ -0,0 +1,68 @@
+"""Management command to stream a BI export to a file or stdout."""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from src.apps.analytics.exports import (
+    DATASETS,
+    EXPORT_CHUNK_SIZE,
+    FORMATS,
+    ExportError,
+    export_rows,
+)
+
+
+class Command(BaseCommand):
+    help = "Export sales, sale items or appointments for a date range"
+
+    def add_arguments(self, parser):
+        parser.add_argument("dataset", choices=list(DATASETS))
+        parser.add_argument(
+            "--start", type=date.fromisoformat, required=True, help="YYYY-MM-DD"
+        )
+        parser.add_argument(
+            "--end", type=date.fromisoformat, required=True, help="YYYY-MM-DD"
+        )
+        parser.add_argument("--format", choices=list(FORMATS), default="csv")
+        parser.add_argument(
+            "--output", help="File to write; defaults to stdout (not for parquet)"
+        )
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        if options["start"] > options["end"]:
+            raise CommandError("--start must not be after --end")
+        if options["format"] == "parquet" and not options["output"]:
+            raise CommandError("Parquet exports require --output")
+
+        try:
+            chunks = export_rows(
+                options["dataset"],
+                options["format"],
+                options["start"],
+                options["end"],
+                chunk_size=options["chunk_size"],
+            )
+        except ExportError as e:
+            raise CommandError(str(e)) from e
+
+        if options["output"]:
+            with open(options["output"], "wb") as output:
+                written = self._write(chunks, output)
+            self.stderr.write(
+                self.style.SUCCESS(
+                    f"✅ Exported {written} bytes to {options['output']}"
+                )
+            )
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+
+    def _write(self, chunks, output) -> int:
+        written = 0
+        for chunk in chunks:
+            data = chunk.encode() if isinstance(chunk, str) else chunk
+            output.write(data)
+            written += len(data)
+        return written
@@ -0,0 +1,158 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:35
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("store", "0004_sale_created_at_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RollupDirtyDay",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(unique=True, verbose_name="Dia")),
+            ],
+            options={
+                "verbose_name": "Dia Pendente de Consolidação",
+                "verbose_name_plural": "Dias Pendentes de Consolidação",
+            },
+        ),
+        migrations.CreateModel(
+            name="MetricsRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("day", "Dia"), ("week", "Semana"), ("month", "Mês")],
+                        max_length=5,
+                        verbose_name="Granularidade",
+                    ),
+                ),
+                ("period_start", models.DateField(verbose_name="Início do Período")),
+                (
+                    "revenue",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="Faturamento",
+                    ),
+                ),
+                (
+                    "sales_count",
+                    models.PositiveIntegerField(default=0, verbose_name="Vendas"),
+                ),
+                (
+                    "total_appointments",
+                    models.PositiveIntegerField(default=0, verbose_name="Agendamentos"),
+                ),
+                (
+                    "appointments_by_status",
+                    models.JSONField(
+                        default=dict, verbose_name="Agendamentos por Status"
+                    ),
+                ),
+                (
+                    "new_customers",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Novos Clientes"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="Última Atualização"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Consolidado de Métricas",
+                "verbose_name_plural": "Consolidados de Métricas",
+                "ordering": ["granularity", "period_start"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("granularity", "period_start"),
+                        name="unique_metrics_rollup_period",
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="ProductRevenueRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "granularity",
+                    models.CharField(
+                        choices=[("day", "Dia"), ("week", "Semana"), ("month", "Mês")],
+                        max_length=5,
+                        verbose_name="Granularidade",
+                    ),
+                ),
+                ("period_start", models.DateField(verbose_name="Início do Período")),
+                (
+                    "units_sold",
+                    models.PositiveIntegerField(default=0, verbose_name="Unidades"),
+                ),
+                (
+                    "revenue",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="Faturamento",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="revenue_rollups",
+                        to="store.product",
+                        verbose_name="Produto",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Consolidado de Produto",
+                "verbose_name_plural": "Consolidados de Produtos",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("granularity", "period_start", "product"),
+                        name="unique_product_revenue_rollup_period",
+                    )
+                ],
+            },
+        ),
+    ]
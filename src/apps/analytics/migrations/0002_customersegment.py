@@ -0,0 +1,95 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("accounts", "0006_auth_user_date_joined_index"),
+        ("analytics", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CustomerSegment",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "recency_days",
+                    models.PositiveIntegerField(
+                        blank=True, null=True, verbose_name="Dias desde a Última Visita"
+                    ),
+                ),
+                (
+                    "frequency",
+                    models.PositiveIntegerField(default=0, verbose_name="Frequência"),
+                ),
+                (
+                    "monetary",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="Valor Gasto",
+                    ),
+                ),
+                (
+                    "r_score",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="Nota R"),
+                ),
+                (
+                    "f_score",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="Nota F"),
+                ),
+                (
+                    "m_score",
+                    models.PositiveSmallIntegerField(default=0, verbose_name="Nota M"),
+                ),
+                (
+                    "segment",
+                    models.CharField(
+                        choices=[
+                            ("CHAMPIONS", "Campeões"),
+                            ("LOYAL", "Fiéis"),
+                            ("POTENTIAL_LOYALIST", "Potenciais Fiéis"),
+                            ("NEW", "Novos"),
+                            ("NEEDS_ATTENTION", "Precisam de Atenção"),
+                            ("AT_RISK", "Em Risco"),
+                            ("CANT_LOSE", "Não Podemos Perder"),
+                            ("HIBERNATING", "Hibernando"),
+                            ("LOST", "Perdidos"),
+                            ("INACTIVE", "Sem Histórico"),
+                        ],
+                        db_index=True,
+                        default="INACTIVE",
+                        max_length=20,
+                        verbose_name="Segmento",
+                    ),
+                ),
+                ("computed_at", models.DateTimeField(verbose_name="Calculado em")),
+                (
+                    "customer",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="segment",
+                        to="accounts.customer",
+                        verbose_name="Tutor",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Segmento de Cliente",
+                "verbose_name_plural": "Segmentos de Clientes",
+                "ordering": ["-m_score", "-f_score", "-r_score"],
+            },
+        ),
+    ]
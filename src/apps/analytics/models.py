@@ -0,0 +1,141 @@
+from django.db import models
+
+from src.apps.accounts.models import Customer
+from src.apps.store.models import Product
+
+
+class Granularity(models.TextChoices):
+    DAY = "day", "Dia"
+    WEEK = "week", "Semana"
+    MONTH = "month", "Mês"
+
+
+class MetricsRollup(models.Model):
+    """Dashboard totals for one day, week (starting Monday) or month."""
+
+    granularity = models.CharField(
+        max_length=5, choices=Granularity.choices, verbose_name="Granularidade"
+    )
+    period_start = models.DateField(verbose_name="Início do Período")
+    revenue = models.DecimalField(
+        max_digits=14, decimal_places=2, default=0, verbose_name="Faturamento"
+    )
+    sales_count = models.PositiveIntegerField(default=0, verbose_name="Vendas")
+    total_appointments = models.PositiveIntegerField(
+        default=0, verbose_name="Agendamentos"
+    )
+    appointments_by_status = models.JSONField(
+        default=dict, verbose_name="Agendamentos por Status"
+    )
+    new_customers = models.PositiveIntegerField(
+        default=0, verbose_name="Novos Clientes"
+    )
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Última Atualização")
+
+    class Meta:
+        ordering = ["granularity", "period_start"]
+        verbose_name = "Consolidado de Métricas"
+        verbose_name_plural = "Consolidados de Métricas"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["granularity", "period_start"],
+                name="unique_metrics_rollup_period",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_granularity_display()} de {self.period_start:%d/%m/%Y}"
+
+
+class ProductRevenueRollup(models.Model):
+    """Units sold and revenue of one product in one rollup period."""
+
+    granularity = models.CharField(
+        max_length=5, choices=Granularity.choices, verbose_name="Granularidade"
+    )
+    period_start = models.DateField(verbose_name="Início do Período")
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name="revenue_rollups",
+        verbose_name="Produto",
+    )
+    units_sold = models.PositiveIntegerField(default=0, verbose_name="Unidades")
+    revenue = models.DecimalField(
+        max_digits=14, decimal_places=2, default=0, verbose_name="Faturamento"
+    )
+
+    class Meta:
+        verbose_name = "Consolidado de Produto"
+        verbose_name_plural = "Consolidados de Produtos"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["granularity", "period_start", "product"],
+                name="unique_product_revenue_rollup_period",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.product} - {self.get_granularity_display()} de {self.period_start:%d/%m/%Y}"
+
+
+class RollupDirtyDay(models.Model):
+    """A local day whose source rows changed since its rollups were built."""
+
+    day = models.DateField(unique=True, verbose_name="Dia")
+
+    class Meta:
+        verbose_name = "Dia Pendente de Consolidação"
+        verbose_name_plural = "Dias Pendentes de Consolidação"
+
+    def __str__(self):
+        return f"{self.day:%d/%m/%Y}"
+
+
+class CustomerSegment(models.Model):
+    """RFM scores and segment of a customer, rebuilt by the segmentation job."""
+
+    class Segment(models.TextChoices):
+        CHAMPIONS = "CHAMPIONS", "Campeões"
+        LOYAL = "LOYAL", "Fiéis"
+        POTENTIAL_LOYALIST = "POTENTIAL_LOYALIST", "Potenciais Fiéis"
+        NEW = "NEW", "Novos"
+        NEEDS_ATTENTION = "NEEDS_ATTENTION", "Precisam de Atenção"
+        AT_RISK = "AT_RISK", "Em Risco"
+        CANT_LOSE = "CANT_LOSE", "Não Podemos Perder"
+        HIBERNATING = "HIBERNATING", "Hibernando"
+        LOST = "LOST", "Perdidos"
+        INACTIVE = "INACTIVE", "Sem Histórico"
+
+    customer = models.OneToOneField(
+        Customer,
+        on_delete=models.CASCADE,
+        related_name="segment",
+        verbose_name="Tutor",
+    )
+    recency_days = models.PositiveIntegerField(
+        null=True, blank=True, verbose_name="Dias desde a Última Visita"
+    )
+    frequency = models.PositiveIntegerField(default=0, verbose_name="Frequência")
+    monetary = models.DecimalField(
+        max_digits=14, decimal_places=2, default=0, verbose_name="Valor Gasto"
+    )
+    r_score = models.PositiveSmallIntegerField(default=0, verbose_name="Nota R")
+    f_score = models.PositiveSmallIntegerField(default=0, verbose_name="Nota F")
+    m_score = models.PositiveSmallIntegerField(default=0, verbose_name="Nota M")
+    segment = models.CharField(
+        max_length=20,
+        choices=Segment.choices,
+        default=Segment.INACTIVE,
+        db_index=True,
+        verbose_name="Segmento",
+    )
+    computed_at = models.DateTimeField(verbose_name="Calculado em")
+
+    class Meta:
+        ordering = ["-m_score", "-f_score", "-r_score"]
+        verbose_name = "Segmento de Cliente"
+        verbose_name_plural = "Segmentos de Clientes"
+
+    def __str__(self):
+        return f"{self.customer} - {self.get_segment_display()}"
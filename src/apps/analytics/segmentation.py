@@ -0,0 +1,67 @@
+"""
+Vectorized RFM (recency, frequency, monetary) scoring.
+
+Scores are quintiles (1-5, higher is better) computed over the customers
+that have any history; customers without history score 0 and fall in the
+INACTIVE segment.
+"""
+
+import numpy as np
+
+from .models import CustomerSegment
+
+Segment = CustomerSegment.Segment
+
+QUINTILES = (0.2, 0.4, 0.6, 0.8)
+
+
+def quintile_scores(values: np.ndarray, active: np.ndarray) -> np.ndarray:
+    """Scores ``values`` 1-5 by the quintiles of its ``active`` entries."""
+    scores = np.zeros(values.shape, dtype=np.int8)
+    if active.any():
+        edges = np.quantile(values[active], QUINTILES)
+        scores[active] = np.searchsorted(edges, values[active], side="right") + 1
+    return scores
+
+
+def score_rfm(
+    recency_days: np.ndarray, frequency: np.ndarray, monetary: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the R, F and M score arrays and the segment of every customer.
+
+    Recency is inverted before scoring, so the most recent customers get 5.
+    """
+    active = frequency > 0
+
+    r = quintile_scores(-recency_days, active)
+    f = quintile_scores(frequency, active)
+    m = quintile_scores(monetary, active)
+    fm = np.rint((f + m) / 2)
+
+    segments = np.select(
+        [
+            ~active,
+            (r >= 4) & (fm >= 4),
+            (r == 3) & (fm >= 4),
+            (r == 1) & (fm >= 4),
+            (r <= 2) & (fm >= 3),
+            (r >= 4) & (fm >= 2),
+            r >= 4,
+            r == 3,
+            r == 2,
+        ],
+        [
+            Segment.INACTIVE,
+            Segment.CHAMPIONS,
+            Segment.LOYAL,
+            Segment.CANT_LOSE,
+            Segment.AT_RISK,
+            Segment.POTENTIAL_LOYALIST,
+            Segment.NEW,
+            Segment.NEEDS_ATTENTION,
+            Segment.HIBERNATING,
+        ],
+        default=Segment.LOST,
+    )
+    return r, f, m, segments
@@ -1,5 +1,12 @@
+from datetime import timedelta
+
+from django.utils import timezone
 from rest_framework import serializers
 
+from src.apps.analytics.exports import FORMATS
+from src.apps.analytics.models import CustomerSegment, Granularity
+from src.apps.analytics.services import UTILIZATION_MAX_WEEKS
+
 
 class DailyMetricSerializer(serializers.Serializer):
     """
@@ -9,7 +16,9 @@ class DailyMetricSerializer(serializers.Serializer):
     appointments, and new customers.
     """
 
-    date = serializers.DateField(help_text="Date of the metric")
+    date = serializers.DateField(
+        help_text="Date of the metric (first day of the period for rollups)"
+    )
     total_revenue = serializers.FloatField(help_text="Total revenue for the day in BRL")
     total_appointments = serializers.IntegerField(
         help_text="Number of appointments scheduled"
@@ -59,6 +68,10 @@ class DashboardDataSerializer(serializers.Serializer):
     - Top products by revenue
     """
 
+    granularity = serializers.ChoiceField(
+        choices=Granularity.choices,
+        help_text="Resolution of metrics_history (one entry per day, week or month)",
+    )
     period_start = serializers.DateField(
         help_text="Start date of the analysis period (ISO format)"
     )
@@ -74,3 +87,115 @@ class DashboardDataSerializer(serializers.Serializer):
     top_products = TopProductSerializer(
         many=True, help_text="Top 5 products by revenue"
     )
+
+
+class ExportParamsSerializer(serializers.Serializer):
+    """
+    Query parameters of a BI export.
+
+    ``start`` and ``end`` are inclusive local dates.
+    """
+
+    start = serializers.DateField(help_text="First day to export (inclusive)")
+    end = serializers.DateField(help_text="Last day to export (inclusive)")
+    file_format = serializers.ChoiceField(
+        choices=list(FORMATS), default="csv", help_text="csv, ndjson or parquet"
+    )
+
+    def validate(self, data):
+        if data["start"] > data["end"]:
+            raise serializers.ValidationError("'start' must not be after 'end'.")
+        return data
+
+
+class CustomerSegmentSerializer(serializers.ModelSerializer):
+    """RFM scores and segment of a customer."""
+
+    customer_name = serializers.CharField(
+        source="customer.user.get_full_name", read_only=True
+    )
+    segment_display = serializers.CharField(
+        source="get_segment_display", read_only=True
+    )
+
+    class Meta:
+        model = CustomerSegment
+        fields = [
+            "customer",
+            "customer_name",
+            "recency_days",
+            "frequency",
+            "monetary",
+            "r_score",
+            "f_score",
+            "m_score",
+            "segment",
+            "segment_display",
+            "computed_at",
+        ]
+        read_only_fields = fields
+
+
+class SegmentCountSerializer(serializers.Serializer):
+    """Number of customers in one RFM segment."""
+
+    segment = serializers.ChoiceField(choices=CustomerSegment.Segment.choices)
+    count = serializers.IntegerField(help_text="Customers in this segment")
+
+
+class UtilizationParamsSerializer(serializers.Serializer):
+    """
+    Query parameters of the utilization heatmap.
+
+    Both dates default to the last four weeks; the range is widened to
+    whole weeks.
+    """
+
+    start = serializers.DateField(required=False, help_text="First day (inclusive)")
+    end = serializers.DateField(required=False, help_text="Last day (inclusive)")
+    service = serializers.IntegerField(
+        required=False, help_text="Only count appointments of this service"
+    )
+
+    def validate(self, data):
+        end = data.setdefault("end", timezone.localdate())
+        start = data.setdefault("start", end - timedelta(weeks=4) + timedelta(days=1))
+        if start > end:
+            raise serializers.ValidationError("'start' must not be after 'end'.")
+        if (end - start).days > UTILIZATION_MAX_WEEKS * 7:
+            raise serializers.ValidationError(
+                f"The range must not exceed {UTILIZATION_MAX_WEEKS} weeks."
+            )
+        return data
+
+
+class ServiceUtilizationSerializer(serializers.Serializer):
+    service_id = serializers.IntegerField()
+    service_name = serializers.CharField()
+    appointments = serializers.IntegerField()
+    occupied_minutes = serializers.IntegerField()
+
+
+class UtilizationSerializer(serializers.Serializer):
+    """
+    Weekday x hour utilization. Matrices have 7 rows (Monday first) of 24
+    hourly columns.
+    """
+
+    period_start = serializers.DateField(help_text="Monday of the first week")
+    period_end = serializers.DateField(help_text="Sunday of the last week")
+    service = serializers.IntegerField(allow_null=True)
+    lanes = serializers.IntegerField(
+        help_text="Appointments that can run at the same time"
+    )
+    occupied_minutes = serializers.ListField(
+        child=serializers.ListField(child=serializers.IntegerField())
+    )
+    open_minutes = serializers.ListField(
+        child=serializers.ListField(child=serializers.IntegerField())
+    )
+    utilization = serializers.ListField(
+        child=serializers.ListField(child=serializers.FloatField(allow_null=True)),
+        help_text="occupied / (open x lanes); null where nothing is open",
+    )
+    services = ServiceUtilizationSerializer(many=True)
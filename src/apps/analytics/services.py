@@ -1,13 +1,191 @@
-from datetime import timedelta
+from collections import Counter
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from functools import reduce
+from operator import or_
 
-from django.db.models import Count, F, Sum
-from django.db.models.functions import TruncDate
+import numpy as np
+import structlog
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F, Min, Q, Sum
+from django.db.models.functions import TruncMonth, TruncWeek
 from django.utils import timezone
 
-from src.apps.accounts.models import Customer
-from src.apps.schedule.models import Appointment
-from src.apps.store.models import Sale, SaleItem
+from src.apps.schedule.models import Appointment, Resource, Service, TimeSlot
+from src.apps.store.models import ReorderSuggestion, Sale
+
+from .models import (
+    CustomerSegment,
+    Granularity,
+    MetricsRollup,
+    ProductRevenueRollup,
+    RollupDirtyDay,
+)
+from .segmentation import score_rfm
+from .utilization import minutes_by_hour, utilization_ratio
+
+logger = structlog.get_logger(__name__)
+
+DAY_BUCKET_CACHE_KEY = "analytics:dashboard:day:{date}"
+TODAY_BUCKET_TTL = 60
+ADMIN_HOME_CACHE_KEY = "analytics:admin-home:{date}"
+ADMIN_HOME_TTL = 30
+# Longest window served by the rollup tables, and the chart size the
+# automatic granularity aims for.
+ROLLUP_MAX_DAYS = 3660
+MAX_CHART_POINTS = 90
+REFRESH_CHUNK_DAYS = 366
+UTILIZATION_CACHE_KEY = "analytics:utilization:week:{week}"
+UTILIZATION_WEEK_TTL = 60 * 60 * 24
+UTILIZATION_MAX_WEEKS = 26
+
+# Per-day buckets for [start_date, end_date], one row per local day, in one
+# statement. Every CTE filters its timestamp column with a half-open
+# [period_start, period_end) range so the b-tree indexes on
+# store_sale.created_at, schedule_appointment.schedule_time and
+# auth_user.date_joined are used; local dates are only derived afterwards.
+DAY_BUCKETS_SQL = """
+WITH days AS (
+    SELECT day::date AS day
+    FROM generate_series(%(start_date)s::date, %(end_date)s::date, interval '1 day') AS day
+),
+sales AS (
+    SELECT
+        (created_at AT TIME ZONE %(tz)s)::date AS day,
+        SUM(total_value) AS revenue,
+        COUNT(*) AS sales_count
+    FROM store_sale
+    WHERE created_at >= %(period_start)s AND created_at < %(period_end)s
+    GROUP BY 1
+),
+statuses AS (
+    SELECT (schedule_time AT TIME ZONE %(tz)s)::date AS day, status, COUNT(*) AS count
+    FROM schedule_appointment
+    WHERE schedule_time >= %(period_start)s AND schedule_time < %(period_end)s
+    GROUP BY 1, 2
+),
+appointments AS (
+    SELECT day, SUM(count)::int AS total, json_object_agg(status, count) AS statuses
+    FROM statuses
+    GROUP BY day
+),
+customers AS (
+    SELECT (u.date_joined AT TIME ZONE %(tz)s)::date AS day, COUNT(*) AS total
+    FROM accounts_customer c
+    JOIN auth_user u ON u.id = c.user_id
+    WHERE u.date_joined >= %(period_start)s AND u.date_joined < %(period_end)s
+    GROUP BY 1
+),
+product_sales AS (
+    SELECT
+        (s.created_at AT TIME ZONE %(tz)s)::date AS day,
+        l.product_id,
+        SUM(si.quantity) AS units_sold,
+        SUM(si.quantity * si.unit_price) AS revenue_generated
+    FROM store_saleitem si
+    JOIN store_sale s ON s.id = si.sale_id
+    JOIN store_productlot l ON l.id = si.lot_id
+    WHERE s.created_at >= %(period_start)s AND s.created_at < %(period_end)s
+    GROUP BY 1, 2
+),
+products AS (
+    SELECT
+        ps.day,
+        json_agg(
+            json_build_object(
+                'product_id', p.id,
+                'product_name', p.name,
+                'category_name', cat.name,
+                'units_sold', ps.units_sold,
+                'revenue_generated', ps.revenue_generated
+            )
+        ) AS products
+    FROM product_sales ps
+    JOIN store_product p ON p.id = ps.product_id
+    LEFT JOIN store_category cat ON cat.id = p.category_id
+    GROUP BY ps.day
+)
+SELECT
+    d.day,
+    COALESCE(s.revenue, 0),
+    COALESCE(s.sales_count, 0),
+    COALESCE(a.total, 0),
+    COALESCE(c.total, 0),
+    COALESCE(a.statuses, '{}'),
+    COALESCE(p.products, '[]')
+FROM days d
+LEFT JOIN sales s ON s.day = d.day
+LEFT JOIN appointments a ON a.day = d.day
+LEFT JOIN customers c ON c.day = d.day
+LEFT JOIN products p ON p.day = d.day
+ORDER BY d.day
+"""
+
+# Non-canceled appointments grouped by local week, weekday, start minute and
+# service for a half-open [period_start, period_end) range.
+UTILIZATION_SQL = """
+SELECT
+    date_trunc('week', local_time)::date AS week,
+    EXTRACT(ISODOW FROM local_time)::int - 1 AS weekday,
+    (EXTRACT(HOUR FROM local_time) * 60 + EXTRACT(MINUTE FROM local_time))::int,
+    service_id,
+    duration_minutes,
+    COUNT(*)
+FROM (
+    SELECT
+        a.schedule_time AT TIME ZONE %(tz)s AS local_time,
+        a.service_id,
+        s.duration_minutes
+    FROM schedule_appointment a
+    JOIN schedule_service s ON s.id = a.service_id
+    WHERE a.schedule_time >= %(period_start)s
+        AND a.schedule_time < %(period_end)s
+        AND a.status <> 'CANCELED'
+) AS appointments
+GROUP BY 1, 2, 3, 4, 5
+"""
+
+# Per-customer RFM inputs as one row of parallel arrays. Visits are past,
+# non-canceled appointments; only completed ones add their service price.
+# Customers without any history get a recency of -1.
+CUSTOMER_RFM_SQL = """
+WITH sales AS (
+    SELECT customer_id, MAX(created_at) AS last_at, COUNT(*) AS n, SUM(total_value) AS total
+    FROM store_sale
+    WHERE customer_id IS NOT NULL
+    GROUP BY customer_id
+),
+visits AS (
+    SELECT
+        p.owner_id AS customer_id,
+        MAX(a.schedule_time) AS last_at,
+        COUNT(*) AS n,
+        SUM(s.price) FILTER (WHERE a.status = 'COMPLETED') AS total
+    FROM schedule_appointment a
+    JOIN pets_pet p ON p.id = a.pet_id
+    JOIN schedule_service s ON s.id = a.service_id
+    WHERE a.schedule_time <= %(now)s AND a.status <> 'CANCELED'
+    GROUP BY p.owner_id
+)
+SELECT
+    array_agg(c.id ORDER BY c.id),
+    array_agg(
+        COALESCE(
+            FLOOR(
+                EXTRACT(EPOCH FROM %(now)s - GREATEST(s.last_at, v.last_at)) / 86400
+            )::int,
+            -1
+        )
+        ORDER BY c.id
+    ),
+    array_agg(COALESCE(s.n, 0) + COALESCE(v.n, 0) ORDER BY c.id),
+    array_agg(COALESCE(s.total, 0) + COALESCE(v.total, 0) ORDER BY c.id)
+FROM accounts_customer c
+LEFT JOIN sales s ON s.customer_id = c.id
+LEFT JOIN visits v ON v.customer_id = c.id
+"""
 
 
 class AnalyticsService:
@@ -18,13 +196,15 @@ class AnalyticsService:
     minimizing N+1 queries and database round-trips.
     """
 
+    TOP_PRODUCTS_LIMIT = 5
+
     @staticmethod
     def get_dashboard_metrics(days: int = 7) -> dict:
         """
         Aggregates dashboard metrics for the specified period.
 
-        Single service call returns all metrics needed for the dashboard,
-        using optimized queries with annotate/aggregate.
+        The window is assembled from the cached per-day buckets of
+        ``_get_day_buckets``.
 
         Args:
             days: Number of days to look back from today (default: 7)
@@ -37,102 +217,705 @@ class AnalyticsService:
             - status_distribution: List of appointment status counts
             - top_products: List of top 5 products by revenue
         """
-        end_date = timezone.now().date()
+        end_date = timezone.localdate()
         start_date = end_date - timedelta(days=days - 1)
+        buckets = AnalyticsService._get_day_buckets(start_date, end_date)
+        return AnalyticsService._merge_buckets(buckets, start_date, end_date)
+
+    @staticmethod
+    def get_admin_home() -> dict:
+        """
+        Counters of the admin home page: revenue today and this month,
+        confirmed appointments today, new customers this month, the last 7
+        days of revenue, today's top products and the most urgent reorder
+        suggestions.
+
+        The counters are composed from the cached per-day buckets and the
+        result is cached for ``ADMIN_HOME_TTL`` seconds; any write dated in
+        the window drops it through ``mark_days_changed``, so only the
+        changed day is recomputed on the next load.
+        """
+        today = timezone.localdate()
+        key = ADMIN_HOME_CACHE_KEY.format(date=today.isoformat())
+        counters = cache.get(key)
+        if counters is not None:
+            return counters
+
+        month_start = today.replace(day=1)
+        week_start = today - timedelta(days=6)
+        first_day = min(month_start, week_start)
+        buckets = {
+            date.fromisoformat(bucket["date"]): bucket
+            for bucket in AnalyticsService._get_day_buckets(first_day, today)
+        }
+        month = [bucket for day, bucket in buckets.items() if day >= month_start]
+        week = [bucket for day, bucket in buckets.items() if day >= week_start]
+        today_bucket = buckets[today]
+
+        top_products = sorted(
+            today_bucket["products"],
+            key=lambda p: p["revenue_generated"],
+            reverse=True,
+        )[: AnalyticsService.TOP_PRODUCTS_LIMIT]
+
+        counters = {
+            "revenue_today": today_bucket["total_revenue"],
+            "appointments_today": today_bucket["statuses"].get(
+                Appointment.Status.CONFIRMED, 0
+            ),
+            "revenue_monthly": round(sum(b["total_revenue"] for b in month), 2),
+            "new_customers_monthly": sum(b["new_customers"] for b in month),
+            "chart_labels": [
+                date.fromisoformat(b["date"]).strftime("%d/%m") for b in week
+            ],
+            "chart_values": [b["total_revenue"] for b in week],
+            "top_products": top_products,
+            "reorder_suggestions": list(
+                ReorderSuggestion.objects.filter(suggested_quantity__gt=0).values(
+                    "stock",
+                    "daily_forecast",
+                    "stockout_date",
+                    "suggested_quantity",
+                    product_name=F("product__name"),
+                )[: AnalyticsService.TOP_PRODUCTS_LIMIT]
+            ),
+        }
+        cache.set(key, counters, ADMIN_HOME_TTL)
+        return counters
+
+    @staticmethod
+    def get_rollup_metrics(days: int, granularity: str | None = None) -> dict:
+        """
+        Dashboard metrics for long windows, read from the rollup tables.
 
-        daily_metrics = (
-            Sale.objects.filter(
-                created_at__date__gte=start_date, created_at__date__lte=end_date
+        ``granularity`` defaults to the coarsest resolution that still gives
+        about ``MAX_CHART_POINTS`` points for the window. Each history entry
+        is one period, dated by its first day, so the first period may start
+        before the requested window. Two indexed queries serve any range.
+        """
+        granularity = granularity or AnalyticsService.pick_granularity(days)
+        end_date = timezone.localdate()
+        first_period = _period_start(end_date - timedelta(days=days - 1), granularity)
+
+        rollups = {
+            rollup.period_start: rollup
+            for rollup in MetricsRollup.objects.filter(
+                granularity=granularity,
+                period_start__gte=first_period,
+                period_start__lte=end_date,
             )
-            .annotate(date=TruncDate("created_at"))
-            .values("date")
-            .annotate(total_revenue=Sum("total_value"), total_sales=Count("id"))
-            .order_by("date")
-        )
+        }
 
-        new_customers_per_day = (
-            Customer.objects.filter(
-                user__date_joined__date__gte=start_date,
-                user__date_joined__date__lte=end_date,
+        metrics_history = []
+        status_counts: Counter[str] = Counter()
+        period = first_period
+        while period <= end_date:
+            rollup = rollups.get(period)
+            metrics_history.append(
+                {
+                    "date": period.isoformat(),
+                    "total_revenue": float(rollup.revenue) if rollup else 0.0,
+                    "total_appointments": rollup.total_appointments if rollup else 0,
+                    "new_customers": rollup.new_customers if rollup else 0,
+                }
             )
-            .annotate(date=TruncDate("user__date_joined"))
-            .values("date")
-            .annotate(new_customers=Count("id"))
-            .order_by("date")
-        )
+            if rollup:
+                status_counts.update(rollup.appointments_by_status)
+            period = _next_period(period, granularity)
 
-        appointments_per_day = (
-            Appointment.objects.filter(
-                schedule_time__date__gte=start_date, schedule_time__date__lte=end_date
+        top_products = list(
+            ProductRevenueRollup.objects.filter(
+                granularity=granularity,
+                period_start__gte=first_period,
+                period_start__lte=end_date,
             )
-            .annotate(date=TruncDate("schedule_time"))
-            .values("date")
-            .annotate(total_appointments=Count("id"))
-            .order_by("date")
+            .values(
+                product_name=F("product__name"),
+                category_name=F("product__category__name"),
+            )
+            .annotate(units_sold=Sum("units_sold"), revenue_generated=Sum("revenue"))
+            .values(
+                "product_id",
+                "product_name",
+                "category_name",
+                "units_sold",
+                "revenue_generated",
+            )
+            .order_by("-revenue_generated")[: AnalyticsService.TOP_PRODUCTS_LIMIT]
         )
 
-        daily_data_map = {}
-        for day_offset in range(days):
-            current_date = start_date + timedelta(days=day_offset)
-            daily_data_map[current_date] = {
-                "date": current_date.isoformat(),
-                "total_revenue": Decimal("0.00"),
-                "total_appointments": 0,
-                "new_customers": 0,
-            }
+        return {
+            "granularity": granularity,
+            "period_start": first_period.isoformat(),
+            "period_end": end_date.isoformat(),
+            "metrics_history": metrics_history,
+            "status_distribution": _sorted_status_counts(status_counts),
+            "top_products": top_products,
+        }
 
-        for metric in daily_metrics:
-            date_key = metric["date"]
-            if date_key in daily_data_map:
-                daily_data_map[date_key]["total_revenue"] = float(
-                    metric["total_revenue"] or 0
-                )
+    @staticmethod
+    def pick_granularity(days: int) -> str:
+        """The coarsest rollup that keeps ``days`` within MAX_CHART_POINTS points."""
+        if days <= MAX_CHART_POINTS:
+            return Granularity.DAY
+        if days <= MAX_CHART_POINTS * 7:
+            return Granularity.WEEK
+        return Granularity.MONTH
+
+    @staticmethod
+    def get_utilization(
+        start_date: date, end_date: date, service_id: int | None = None
+    ) -> dict:
+        """
+        Occupied versus open minutes per weekday and hour for the whole
+        weeks (Monday to Sunday) covering ``start_date``..``end_date``.
+
+        Occupied minutes of each week are cached per service, so only weeks
+        missing from the cache hit the database, with one grouped query.
+        Open minutes come from ``TimeSlot`` and are multiplied by the number
+        of bookable lanes (active resources, or one when there are none).
+        """
+        first_week = _period_start(start_date, Granularity.WEEK)
+        last_week = _period_start(end_date, Granularity.WEEK)
+        weeks = [
+            first_week + timedelta(weeks=offset)
+            for offset in range((last_week - first_week).days // 7 + 1)
+        ]
+
+        keys = {
+            week: UTILIZATION_CACHE_KEY.format(week=week.isoformat()) for week in weeks
+        }
+        cached = cache.get_many(keys.values())
+        occupancy = {week: cached[key] for week, key in keys.items() if key in cached}
 
-        for metric in new_customers_per_day:
-            date_key = metric["date"]
-            if date_key in daily_data_map:
-                daily_data_map[date_key]["new_customers"] = metric["new_customers"]
-
-        for metric in appointments_per_day:
-            date_key = metric["date"]
-            if date_key in daily_data_map:
-                daily_data_map[date_key]["total_appointments"] = metric[
-                    "total_appointments"
-                ]
-
-        status_distribution = list(
-            Appointment.objects.filter(
-                schedule_time__date__gte=start_date, schedule_time__date__lte=end_date
+        missing = [week for week in weeks if week not in occupancy]
+        if missing:
+            computed = AnalyticsService._compute_week_occupancy(missing[0], missing[-1])
+            occupancy.update(computed)
+            current_week = _period_start(timezone.localdate(), Granularity.WEEK)
+            cache.set_many(
+                {keys[w]: o for w, o in computed.items() if w < current_week},
+                timeout=UTILIZATION_WEEK_TTL,
             )
-            .values("status")
-            .annotate(count=Count("id"))
-            .order_by("-count")
+            cache.set_many(
+                {keys[w]: o for w, o in computed.items() if w >= current_week},
+                timeout=TODAY_BUCKET_TTL,
+            )
+
+        occupied = np.zeros((7, 24), dtype=np.int64)
+        appointments: Counter[int] = Counter()
+        service_minutes: Counter[int] = Counter()
+        for week in weeks:
+            for sid, matrix in occupancy[week]["occupied"].items():
+                matrix = np.asarray(matrix)
+                service_minutes[sid] += int(matrix.sum())
+                if service_id is None or sid == service_id:
+                    occupied += matrix
+            appointments.update(occupancy[week]["appointments"])
+
+        slots = list(
+            TimeSlot.objects.values_list("day_of_week", "start_time", "end_time")
         )
+        open_minutes = np.zeros((7, 24), dtype=np.int64)
+        if slots:
+            starts = np.array([s.hour * 60 + s.minute for _, s, _ in slots])
+            ends = np.array([e.hour * 60 + e.minute for _, _, e in slots])
+            open_minutes = np.minimum(
+                minutes_by_hour(
+                    np.array([day for day, _, _ in slots]),
+                    starts,
+                    np.maximum(ends - starts, 0),
+                    np.ones(len(slots), dtype=np.int64),
+                )[0],
+                60,
+            ) * len(weeks)
 
-        top_products = list(
-            SaleItem.objects.filter(
-                sale__created_at__date__gte=start_date,
-                sale__created_at__date__lte=end_date,
+        resources = Resource.objects.filter(is_active=True)
+        if service_id is not None:
+            resources = resources.filter(services=service_id)
+        lanes = resources.count() or 1
+
+        names = dict(
+            Service.objects.filter(pk__in=service_minutes).values_list("pk", "name")
+        )
+        return {
+            "period_start": first_week.isoformat(),
+            "period_end": (last_week + timedelta(days=6)).isoformat(),
+            "service": service_id,
+            "lanes": lanes,
+            "occupied_minutes": occupied.tolist(),
+            "open_minutes": open_minutes.tolist(),
+            "utilization": utilization_ratio(occupied, open_minutes * lanes),
+            "services": [
+                {
+                    "service_id": sid,
+                    "service_name": names.get(sid, ""),
+                    "appointments": appointments[sid],
+                    "occupied_minutes": minutes,
+                }
+                for sid, minutes in service_minutes.most_common()
+            ],
+        }
+
+    @staticmethod
+    def mark_days_changed(*moments: date | datetime | None) -> None:
+        """
+        Records that rows dated on the local days of ``moments`` changed.
+
+        The days are queued for the next rollup refresh in the current
+        transaction, and their cached dashboard buckets and utilization
+        weeks are dropped once it commits.
+        """
+        days = {
+            timezone.localdate(moment) if isinstance(moment, datetime) else moment
+            for moment in moments
+            if moment is not None
+        }
+        if not days:
+            return
+
+        RollupDirtyDay.objects.bulk_create(
+            [RollupDirtyDay(day=day) for day in days], ignore_conflicts=True
+        )
+        keys = [DAY_BUCKET_CACHE_KEY.format(date=day.isoformat()) for day in days]
+        keys += {
+            UTILIZATION_CACHE_KEY.format(
+                week=_period_start(day, Granularity.WEEK).isoformat()
             )
-            .select_related("lot__product", "lot__product__category")
-            .values(
-                product_id=F("lot__product__id"),
-                product_name=F("lot__product__name"),
-                category_name=F("lot__product__category__name"),
+            for day in days
+        }
+        keys.append(ADMIN_HOME_CACHE_KEY.format(date=timezone.localdate().isoformat()))
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+    @staticmethod
+    def refresh_rollups(full: bool = False) -> int:
+        """
+        Brings the rollup tables up to date and returns how many days were
+        rebuilt.
+
+        Today and every day queued by ``mark_days_changed`` are recomputed
+        from the source tables; the weeks and months containing them are
+        then re-aggregated from the daily rollups. ``full`` (or an empty
+        table) rebuilds everything since the first recorded activity.
+        """
+        today = timezone.localdate()
+        dirty = list(RollupDirtyDay.objects.values_list("pk", "day"))
+
+        if full or not MetricsRollup.objects.exists():
+            first_day = min(_first_activity_date() or today, today)
+            runs = [(first_day, today)]
+        else:
+            days = {day for _, day in dirty if day <= today} | {today}
+            runs = _day_runs(sorted(days))
+
+        rebuilt = 0
+        with transaction.atomic():
+            for run_start, run_end in runs:
+                chunk_start = run_start
+                while chunk_start <= run_end:
+                    chunk_end = min(
+                        chunk_start + timedelta(days=REFRESH_CHUNK_DAYS - 1), run_end
+                    )
+                    buckets = AnalyticsService._compute_day_buckets(
+                        chunk_start, chunk_end
+                    )
+                    _store_day_rollups(buckets)
+                    rebuilt += len(buckets)
+                    chunk_start = chunk_end + timedelta(days=1)
+
+            for granularity in (Granularity.WEEK, Granularity.MONTH):
+                _store_coarse_rollups(runs, granularity)
+
+            RollupDirtyDay.objects.filter(pk__in=[pk for pk, _ in dirty]).delete()
+
+        logger.info("analytics_rollups_refreshed", days=rebuilt, full=full)
+        return rebuilt
+
+    @staticmethod
+    def _get_day_buckets(start_date: date, end_date: date) -> list[dict]:
+        """
+        Per-day buckets for ``start_date``..``end_date``. Past days never
+        change, so their buckets are cached without expiry and only
+        invalidated when a row dated on them is written; today's bucket
+        lives for ``TODAY_BUCKET_TTL`` seconds. Missing buckets are computed
+        together in a single SQL statement.
+        """
+        today = timezone.localdate()
+        dates = [
+            start_date + timedelta(days=offset)
+            for offset in range((end_date - start_date).days + 1)
+        ]
+
+        keys = {day: DAY_BUCKET_CACHE_KEY.format(date=day.isoformat()) for day in dates}
+        cached = cache.get_many(keys.values())
+        buckets = {day: cached[key] for day, key in keys.items() if key in cached}
+
+        missing = [day for day in dates if day not in buckets]
+        if missing:
+            computed = AnalyticsService._compute_day_buckets(missing[0], missing[-1])
+            buckets.update(computed)
+            cache.set_many(
+                {keys[day]: bucket for day, bucket in computed.items() if day < today},
+                timeout=None,
             )
-            .annotate(
-                units_sold=Sum("quantity"),
-                revenue_generated=Sum(F("quantity") * F("unit_price")),
+            cache.set_many(
+                {keys[day]: bucket for day, bucket in computed.items() if day >= today},
+                timeout=TODAY_BUCKET_TTL,
             )
-            .order_by("-revenue_generated")[:5]
+
+        return [buckets[day] for day in dates]
+
+    @staticmethod
+    def _compute_day_buckets(start_date: date, end_date: date) -> dict[date, dict]:
+        params = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "period_start": timezone.make_aware(datetime.combine(start_date, time.min)),
+            "period_end": timezone.make_aware(
+                datetime.combine(end_date + timedelta(days=1), time.min)
+            ),
+            "tz": timezone.get_current_timezone_name(),
+        }
+        with connection.cursor() as cursor:
+            cursor.execute(DAY_BUCKETS_SQL, params)
+            rows = cursor.fetchall()
+
+        return {
+            day: {
+                "date": day.isoformat(),
+                "total_revenue": float(revenue),
+                "sales_count": sales_count,
+                "total_appointments": appointments,
+                "new_customers": customers,
+                "statuses": statuses,
+                "products": products,
+            }
+            for (
+                day,
+                revenue,
+                sales_count,
+                appointments,
+                customers,
+                statuses,
+                products,
+            ) in rows
+        }
+
+    @staticmethod
+    def _compute_week_occupancy(first_week: date, last_week: date) -> dict[date, dict]:
+        weeks = [
+            first_week + timedelta(weeks=offset)
+            for offset in range((last_week - first_week).days // 7 + 1)
+        ]
+        params = {
+            "period_start": timezone.make_aware(datetime.combine(first_week, time.min)),
+            "period_end": timezone.make_aware(
+                datetime.combine(last_week + timedelta(weeks=1), time.min)
+            ),
+            "tz": timezone.get_current_timezone_name(),
+        }
+        with connection.cursor() as cursor:
+            cursor.execute(UTILIZATION_SQL, params)
+            rows = cursor.fetchall()
+
+        occupancy = {week: {"occupied": {}, "appointments": {}} for week in weeks}
+        if not rows:
+            return occupancy
+
+        week_index = {week: i for i, week in enumerate(weeks)}
+        service_ids = sorted({row[3] for row in rows})
+        service_index = {sid: i for i, sid in enumerate(service_ids)}
+        keys = np.array(
+            [week_index[r[0]] * len(service_ids) + service_index[r[3]] for r in rows]
+        )
+        present, groups = np.unique(keys, return_inverse=True)
+        counts = np.array([r[5] for r in rows], dtype=np.int64)
+        matrices = minutes_by_hour(
+            np.array([r[1] for r in rows]),
+            np.array([r[2] for r in rows]),
+            np.array([r[4] for r in rows]),
+            counts,
+            groups=groups,
+            n_groups=len(present),
         )
+        totals = np.bincount(groups, weights=counts, minlength=len(present))
+
+        for group, key in enumerate(present.tolist()):
+            week = weeks[key // len(service_ids)]
+            sid = service_ids[key % len(service_ids)]
+            occupancy[week]["occupied"][sid] = matrices[group].tolist()
+            occupancy[week]["appointments"][sid] = int(totals[group])
+        return occupancy
+
+    @staticmethod
+    def _merge_buckets(buckets: list[dict], start_date: date, end_date: date) -> dict:
+        status_counts: Counter[str] = Counter()
+        products: dict[int, dict] = {}
+        for bucket in buckets:
+            status_counts.update(bucket["statuses"])
+            for product in bucket["products"]:
+                total = products.setdefault(
+                    product["product_id"],
+                    {**product, "units_sold": 0, "revenue_generated": 0.0},
+                )
+                total["units_sold"] += product["units_sold"]
+                total["revenue_generated"] += product["revenue_generated"]
 
-        metrics_history = [daily_data_map[d] for d in sorted(daily_data_map.keys())]
+        top_products = sorted(
+            products.values(), key=lambda p: p["revenue_generated"], reverse=True
+        )[: AnalyticsService.TOP_PRODUCTS_LIMIT]
+        for product in top_products:
+            product["revenue_generated"] = round(product["revenue_generated"], 2)
 
         return {
+            "granularity": Granularity.DAY,
             "period_start": start_date.isoformat(),
             "period_end": end_date.isoformat(),
-            "metrics_history": metrics_history,
-            "status_distribution": status_distribution,
+            "metrics_history": [
+                {
+                    key: bucket[key]
+                    for key in (
+                        "date",
+                        "total_revenue",
+                        "total_appointments",
+                        "new_customers",
+                    )
+                }
+                for bucket in buckets
+            ],
+            "status_distribution": _sorted_status_counts(status_counts),
             "top_products": top_products,
         }
+
+
+class CustomerSegmentationService:
+    """Recomputes the RFM segment of every customer in one vectorized pass."""
+
+    BATCH_SIZE = 5000
+
+    @staticmethod
+    def compute_segments() -> int:
+        """
+        Loads per-customer recency, frequency and monetary value as columnar
+        arrays from one grouped query, scores them with NumPy and upserts
+        ``CustomerSegment`` rows. Returns the number of customers scored.
+        """
+        now = timezone.now()
+        with connection.cursor() as cursor:
+            cursor.execute(CUSTOMER_RFM_SQL, {"now": now})
+            customer_ids, recency, frequency, monetary = cursor.fetchone()
+
+        if not customer_ids:
+            return 0
+
+        recency_days = np.array(recency, dtype=np.int64)
+        r, f, m, segments = score_rfm(
+            recency_days,
+            np.array(frequency, dtype=np.int64),
+            np.array(monetary, dtype=np.float64),
+        )
+
+        CustomerSegment.objects.bulk_create(
+            [
+                CustomerSegment(
+                    customer_id=customer_id,
+                    recency_days=days if days >= 0 else None,
+                    frequency=count,
+                    monetary=value,
+                    r_score=r_score,
+                    f_score=f_score,
+                    m_score=m_score,
+                    segment=segment,
+                    computed_at=now,
+                )
+                for customer_id, days, count, value, r_score, f_score, m_score, segment in zip(
+                    customer_ids,
+                    recency_days.tolist(),
+                    frequency,
+                    monetary,
+                    r.tolist(),
+                    f.tolist(),
+                    m.tolist(),
+                    segments.tolist(),
+                    strict=True,
+                )
+            ],
+            batch_size=CustomerSegmentationService.BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["customer"],
+            update_fields=[
+                "recency_days",
+                "frequency",
+                "monetary",
+                "r_score",
+                "f_score",
+                "m_score",
+                "segment",
+                "computed_at",
+            ],
+        )
+
+        logger.info("customer_segments_computed", customers=len(customer_ids))
+        return len(customer_ids)
+
+
+def _period_start(day: date, granularity: str) -> date:
+    if granularity == Granularity.WEEK:
+        return day - timedelta(days=day.weekday())
+    if granularity == Granularity.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def _next_period(period: date, granularity: str) -> date:
+    if granularity == Granularity.WEEK:
+        return period + timedelta(weeks=1)
+    if granularity == Granularity.MONTH:
+        return (period + timedelta(days=32)).replace(day=1)
+    return period + timedelta(days=1)
+
+
+def _day_runs(days: list[date]) -> list[tuple[date, date]]:
+    """Groups sorted ``days`` into (first, last) runs of consecutive days."""
+    runs: list[tuple[date, date]] = []
+    for day in days:
+        if runs and day - runs[-1][1] == timedelta(days=1):
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
+def _sorted_status_counts(status_counts: Counter) -> list[dict]:
+    return [
+        {"status": status, "count": count}
+        for status, count in sorted(
+            status_counts.items(), key=lambda item: (-item[1], item[0])
+        )
+    ]
+
+
+def _to_money(value: float) -> Decimal:
+    return round(Decimal(str(value)), 2)
+
+
+def _first_activity_date() -> date | None:
+    firsts = [
+        Sale.objects.aggregate(first=Min("created_at"))["first"],
+        Appointment.objects.aggregate(first=Min("schedule_time"))["first"],
+        get_user_model().objects.aggregate(first=Min("date_joined"))["first"],
+    ]
+    firsts = [timezone.localdate(moment) for moment in firsts if moment is not None]
+    return min(firsts) if firsts else None
+
+
+def _store_day_rollups(buckets: dict[date, dict]) -> None:
+    MetricsRollup.objects.bulk_create(
+        [
+            MetricsRollup(
+                granularity=Granularity.DAY,
+                period_start=day,
+                revenue=_to_money(bucket["total_revenue"]),
+                sales_count=bucket["sales_count"],
+                total_appointments=bucket["total_appointments"],
+                appointments_by_status=bucket["statuses"],
+                new_customers=bucket["new_customers"],
+            )
+            for day, bucket in buckets.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["granularity", "period_start"],
+        update_fields=[
+            "revenue",
+            "sales_count",
+            "total_appointments",
+            "appointments_by_status",
+            "new_customers",
+            "updated_at",
+        ],
+    )
+    ProductRevenueRollup.objects.filter(
+        granularity=Granularity.DAY, period_start__in=list(buckets)
+    ).delete()
+    ProductRevenueRollup.objects.bulk_create(
+        [
+            ProductRevenueRollup(
+                granularity=Granularity.DAY,
+                period_start=day,
+                product_id=product["product_id"],
+                units_sold=product["units_sold"],
+                revenue=_to_money(product["revenue_generated"]),
+            )
+            for day, bucket in buckets.items()
+            for product in bucket["products"]
+        ]
+    )
+
+
+def _store_coarse_rollups(runs: list[tuple[date, date]], granularity: str) -> None:
+    """Re-aggregates the weeks or months touching ``runs`` from daily rollups."""
+    ranges: list[tuple[date, date]] = []
+    for run_start, run_end in runs:
+        start = _period_start(run_start, granularity)
+        end = _next_period(_period_start(run_end, granularity), granularity)
+        if ranges and start <= ranges[-1][1]:
+            ranges[-1] = (ranges[-1][0], max(end, ranges[-1][1]))
+        else:
+            ranges.append((start, end))
+    in_ranges = reduce(
+        or_, (Q(period_start__gte=start, period_start__lt=end) for start, end in ranges)
+    )
+
+    totals: dict[date, MetricsRollup] = {}
+    for rollup in MetricsRollup.objects.filter(in_ranges, granularity=Granularity.DAY):
+        period = _period_start(rollup.period_start, granularity)
+        total = totals.setdefault(
+            period,
+            MetricsRollup(
+                granularity=granularity,
+                period_start=period,
+                appointments_by_status={},
+            ),
+        )
+        total.revenue += rollup.revenue
+        total.sales_count += rollup.sales_count
+        total.total_appointments += rollup.total_appointments
+        total.new_customers += rollup.new_customers
+        total.appointments_by_status = dict(
+            Counter(total.appointments_by_status)
+            + Counter(rollup.appointments_by_status)
+        )
+
+    MetricsRollup.objects.bulk_create(
+        totals.values(),
+        update_conflicts=True,
+        unique_fields=["granularity", "period_start"],
+        update_fields=[
+            "revenue",
+            "sales_count",
+            "total_appointments",
+            "appointments_by_status",
+            "new_customers",
+            "updated_at",
+        ],
+    )
+
+    trunc = TruncWeek if granularity == Granularity.WEEK else TruncMonth
+    ProductRevenueRollup.objects.filter(in_ranges, granularity=granularity).delete()
+    ProductRevenueRollup.objects.bulk_create(
+        [
+            ProductRevenueRollup(
+                granularity=granularity,
+                period_start=row["period"],
+                product_id=row["product_id"],
+                units_sold=row["total_units"],
+                revenue=row["total_revenue"],
+            )
+            for row in ProductRevenueRollup.objects.filter(
+                in_ranges, granularity=Granularity.DAY
+            )
+            .annotate(period=trunc("period_start"))
+            .values("period", "product_id")
+            .annotate(total_units=Sum("units_sold"), total_revenue=Sum("revenue"))
+        ]
+    )
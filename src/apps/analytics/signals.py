@@ -0,0 +1,107 @@
+from decimal import Decimal
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from src.apps.accounts.models import Customer
+from src.apps.schedule.models import Appointment
+from src.apps.store.models import Sale
+
+from .live import publish_dashboard_event
+from .services import AnalyticsService
+
+
+def _publish_on_commit(event: dict) -> None:
+    transaction.on_commit(partial(publish_dashboard_event, event))
+
+
+def _local_date(moment):
+    return timezone.localdate(moment) if moment is not None else None
+
+
+@receiver([post_save, post_delete], sender=Sale)
+def mark_sale_day_changed(sender, instance, **kwargs):
+    AnalyticsService.mark_days_changed(instance.created_at)
+
+
+@receiver(post_save, sender=Sale)
+def publish_sale_delta(sender, instance, created, **kwargs):
+    previous = (
+        Decimal("0") if created else instance.get_original_value("total_value") or 0
+    )
+    revenue_delta = instance.total_value - previous
+    if created or revenue_delta:
+        _publish_on_commit(
+            {
+                "type": "sale",
+                "date": _local_date(instance.created_at),
+                "revenue_delta": float(revenue_delta),
+                "sales_delta": int(created),
+            }
+        )
+
+
+@receiver(post_delete, sender=Sale)
+def publish_sale_removal(sender, instance, **kwargs):
+    total_value = instance.get_original_value("total_value") or instance.total_value
+    _publish_on_commit(
+        {
+            "type": "sale",
+            "date": _local_date(instance.created_at),
+            "revenue_delta": -float(total_value),
+            "sales_delta": -1,
+        }
+    )
+
+
+@receiver([post_save, post_delete], sender=Appointment)
+def mark_appointment_days_changed(sender, instance, **kwargs):
+    AnalyticsService.mark_days_changed(
+        instance.schedule_time, instance.get_original_value("schedule_time")
+    )
+
+
+@receiver(post_save, sender=Appointment)
+def publish_appointment_change(sender, instance, created, **kwargs):
+    event = {
+        "type": "appointment",
+        "date": _local_date(instance.schedule_time),
+        "status": instance.status,
+        "previous_date": None,
+        "previous_status": None,
+    }
+    if not created:
+        event["previous_date"] = _local_date(
+            instance.get_original_value("schedule_time")
+        )
+        event["previous_status"] = instance.get_original_value("status")
+        if (event["date"], event["status"]) == (
+            event["previous_date"],
+            event["previous_status"],
+        ):
+            return
+    _publish_on_commit(event)
+
+
+@receiver(post_delete, sender=Appointment)
+def publish_appointment_removal(sender, instance, **kwargs):
+    _publish_on_commit(
+        {
+            "type": "appointment",
+            "date": None,
+            "status": None,
+            "previous_date": _local_date(
+                instance.get_original_value("schedule_time") or instance.schedule_time
+            ),
+            "previous_status": instance.get_original_value("status") or instance.status,
+        }
+    )
+
+
+@receiver(post_save, sender=Customer)
+def mark_customer_day_changed(sender, instance, created, **kwargs):
+    if created:
+        AnalyticsService.mark_days_changed(instance.user.date_joined)
@@ -0,0 +1,15 @@
+from celery import shared_task
+
+from .services import AnalyticsService, CustomerSegmentationService
+
+
+@shared_task
+def refresh_analytics_rollups(full: bool = False) -> str:
+    rebuilt = AnalyticsService.refresh_rollups(full=full)
+    return f"{rebuilt} dias consolidados nas tabelas de métricas."
+
+
+@shared_task
+def compute_customer_segments() -> str:
+    scored = CustomerSegmentationService.compute_segments()
+    return f"{scored} clientes segmentados por RFM."
@@ -101,10 +101,10 @@ class TestDashboardMetricsAPI:
 
     def test_days_parameter_validation_exceeds_maximum(self, authenticated_client):
         """
-        Test that days parameter exceeding 90 is rejected.
+        Test that days parameter exceeding the rollup range is rejected.
         """
         url = reverse("analytics:dashboard-metrics")
-        response = authenticated_client.get(url, {"days": 100})
+        response = authenticated_client.get(url, {"days": 4000})
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
@@ -143,3 +143,29 @@ class TestDashboardMetricsAPI:
 
         assert len(data["metrics_history"]) == 7
         assert any(day["total_revenue"] > 0 for day in data["metrics_history"])
+
+    def test_long_range_uses_rollups(self, authenticated_client):
+        """
+        Test that windows over 90 days are served from the rollup tables
+        with an automatically chosen granularity.
+        """
+        url = reverse("analytics:dashboard-metrics")
+        response = authenticated_client.get(url, {"days": 730})
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["granularity"] == "month"
+        assert len(data["metrics_history"]) in (24, 25)
+
+    def test_explicit_granularity(self, authenticated_client):
+        """
+        Test that an explicit granularity is honored and validated.
+        """
+        url = reverse("analytics:dashboard-metrics")
+
+        response = authenticated_client.get(url, {"days": 28, "granularity": "week"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["granularity"] == "week"
+
+        response = authenticated_client.get(url, {"granularity": "year"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
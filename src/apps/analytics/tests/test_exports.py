@@ -0,0 +1,137 @@
+import csv
+import io
+import json
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from src.apps.analytics.exports import export_rows
+from src.apps.store.factories import ProductLotFactory, SaleFactory, SaleItemFactory
+from src.apps.store.models import Sale
+
+
+@pytest.mark.django_db
+class TestDataExports:
+    """Test suite for the streamed BI exports."""
+
+    def _sale(self, days_ago, value):
+        sale = SaleFactory(total_value=Decimal(value))
+        SaleItemFactory(
+            sale=sale,
+            lot=ProductLotFactory(quantity=10),
+            quantity=2,
+            unit_price=Decimal(value) / 2,
+        )
+        moment = timezone.now() - timezone.timedelta(days=days_ago)
+        Sale.objects.filter(pk=sale.pk).update(created_at=moment)
+        return sale
+
+    def test_csv_export_streams_rows_in_range(self):
+        """
+        Test that only rows inside the inclusive local date range are
+        exported, in batches.
+        """
+        today = timezone.localdate()
+        inside = [self._sale(0, "10.00"), self._sale(0, "20.00"), self._sale(1, "5")]
+        self._sale(10, "99.00")
+
+        chunks = list(
+            export_rows(
+                "sales",
+                "csv",
+                today - timezone.timedelta(days=1),
+                today,
+                chunk_size=2,
+            )
+        )
+
+        rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+        assert len(chunks) == 2
+        assert [int(row["id"]) for row in rows] == [sale.pk for sale in inside]
+        assert rows[0]["total_value"] == "10.00"
+
+    def test_ndjson_export_of_sale_items(self):
+        """
+        Test that NDJSON emits one JSON object per sale item.
+        """
+        sale = self._sale(0, "30.00")
+        today = timezone.localdate()
+
+        lines = "".join(export_rows("sale-items", "ndjson", today, today)).splitlines()
+
+        item = json.loads(lines[0])
+        assert len(lines) == 1
+        assert item["sale_id"] == sale.pk
+        assert item["quantity"] == 2
+        assert item["unit_price"] == "15.00"
+
+    def test_parquet_export(self):
+        """
+        Test that Parquet output is a readable file when pyarrow is installed.
+        """
+        pq = pytest.importorskip("pyarrow.parquet")
+        self._sale(0, "10.00")
+        today = timezone.localdate()
+
+        data = b"".join(export_rows("sales", "parquet", today, today))
+
+        table = pq.read_table(io.BytesIO(data))
+        assert table.num_rows == 1
+
+    def test_export_endpoint_is_streamed_for_staff(self, authenticated_client):
+        client, _ = authenticated_client
+        self._sale(0, "10.00")
+        today = timezone.localdate().isoformat()
+
+        response = client.get(
+            reverse("analytics:data-export", args=["sales"]),
+            {"start": today, "end": today, "file_format": "csv"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.streaming
+        assert response["Content-Type"] == "text/csv"
+        assert "attachment" in response["Content-Disposition"]
+        body = b"".join(response.streaming_content).decode()
+        assert body.splitlines()[0].startswith("id,created_at")
+
+    def test_export_endpoint_validation(
+        self, authenticated_client, regular_user_client
+    ):
+        client, _ = authenticated_client
+        url = reverse("analytics:data-export", args=["sales"])
+
+        assert (
+            client.get(url, {"start": "2025-02-01", "end": "2025-01-01"}).status_code
+            == status.HTTP_400_BAD_REQUEST
+        )
+        assert (
+            client.get(
+                reverse("analytics:data-export", args=["pets"]),
+                {"start": "2025-01-01", "end": "2025-01-31"},
+            ).status_code
+            == status.HTTP_404_NOT_FOUND
+        )
+        regular_client, _ = regular_user_client
+        assert regular_client.get(url).status_code == status.HTTP_403_FORBIDDEN
+
+    def test_management_command_writes_file(self, tmp_path):
+        self._sale(0, "10.00")
+        today = timezone.localdate().isoformat()
+        output = tmp_path / "sales.ndjson"
+
+        call_command(
+            "export_data",
+            "sales",
+            f"--start={today}",
+            f"--end={today}",
+            "--format=ndjson",
+            f"--output={output}",
+            stderr=io.StringIO(),
+        )
+
+        assert len(output.read_text().splitlines()) == 1
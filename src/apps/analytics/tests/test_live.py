@@ -0,0 +1,172 @@
+import json
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from src.apps.accounts.factories import UserFactory
+from src.apps.analytics import live
+from src.apps.schedule.factories import AppointmentFactory
+from src.apps.schedule.models import Appointment
+from src.apps.schedule.services import AppointmentService
+from src.apps.store.factories import SaleFactory
+
+
+@pytest.fixture
+def published(mocker):
+    """Collects the events published after each commit."""
+    events = []
+    mocker.patch(
+        "src.apps.analytics.signals.publish_dashboard_event", side_effect=events.append
+    )
+    mocker.patch(
+        "src.apps.schedule.services.publish_dashboard_event", side_effect=events.append
+    )
+    return events
+
+
+@pytest.mark.django_db
+class TestDashboardEventPublishing:
+    """Test suite for the post-commit dashboard deltas."""
+
+    def test_sale_publishes_revenue_delta(
+        self, published, django_capture_on_commit_callbacks
+    ):
+        """
+        Test that a sale publishes its creation and then only the revenue
+        change of later saves.
+        """
+        with django_capture_on_commit_callbacks(execute=True):
+            sale = SaleFactory(total_value=Decimal("0"))
+            sale.total_value = Decimal("120.50")
+            sale.save(update_fields=["total_value"])
+            sale.save()
+
+        assert [(e["revenue_delta"], e["sales_delta"]) for e in published] == [
+            (0.0, 1),
+            (120.5, 0),
+        ]
+        assert published[0]["date"] == timezone.localdate(sale.created_at)
+
+    def test_nothing_is_published_without_commit(
+        self, published, django_capture_on_commit_callbacks
+    ):
+        """
+        Test that events wait for the transaction to commit.
+        """
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            SaleFactory()
+
+        assert published == []
+        assert len(callbacks) >= 1
+
+    def test_appointment_status_change_is_published(
+        self, published, django_capture_on_commit_callbacks
+    ):
+        """
+        Test that status transitions carry the previous status, and saves
+        that change neither day nor status publish nothing.
+        """
+        appointment = AppointmentFactory(status=Appointment.Status.PENDING)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            appointment.notes = "Sem mudanças relevantes"
+            appointment.save()
+            appointment.status = Appointment.Status.CONFIRMED
+            appointment.save()
+
+        assert len(published) == 1
+        assert published[0]["status"] == Appointment.Status.CONFIRMED
+        assert published[0]["previous_status"] == Appointment.Status.PENDING
+
+    def test_bulk_status_update_publishes_refresh(
+        self, published, django_capture_on_commit_callbacks
+    ):
+        """
+        Test that bulk updates, which bypass signals, ask dashboards to
+        refetch the touched days.
+        """
+        appointment = AppointmentFactory(
+            schedule_time=timezone.now() - timezone.timedelta(hours=1),
+            status=Appointment.Status.CONFIRMED,
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            AppointmentService.bulk_update_status(
+                Appointment.objects.filter(pk=appointment.pk),
+                Appointment.Status.COMPLETED,
+            )
+
+        assert published == [
+            {
+                "type": "refresh",
+                "dates": [timezone.localdate(appointment.schedule_time)],
+            }
+        ]
+
+    def test_publish_failures_are_swallowed(self, mocker):
+        """
+        Test that an unavailable Redis never breaks the triggering write.
+        """
+        client = MagicMock()
+        client.publish.side_effect = redis.ConnectionError("down")
+        mocker.patch.object(live, "_redis", return_value=client)
+
+        live.publish_dashboard_event({"type": "sale"})
+
+        client.publish.assert_called_once()
+
+
+class TestDashboardEventStream:
+    """Test suite for the SSE frames relayed from pub/sub."""
+
+    def test_stream_relays_messages_and_heartbeats(self):
+        pubsub = MagicMock()
+        pubsub.get_message.side_effect = [
+            {"type": "message", "data": b'{"type": "sale"}'},
+            None,
+        ]
+        client = MagicMock()
+        client.pubsub.return_value = pubsub
+
+        with patch.object(live, "_redis", return_value=client):
+            stream = live.stream_dashboard_events(heartbeat=1)
+            frames = [next(stream) for _ in range(3)]
+            stream.close()
+
+        pubsub.subscribe.assert_called_once_with(live.DASHBOARD_CHANNEL)
+        assert frames[0] == f"retry: {live.RECONNECT_MS}\n\n"
+        assert frames[1] == 'event: delta\ndata: {"type": "sale"}\n\n'
+        assert frames[2] == ": keepalive\n\n"
+        pubsub.close.assert_called_once()
+
+    @pytest.mark.django_db
+    def test_endpoint_streams_event_stream(self):
+        client = APIClient()
+        client.force_authenticate(user=UserFactory())
+
+        with patch(
+            "src.apps.analytics.views.stream_dashboard_events",
+            return_value=iter(["retry: 3000\n\n"]),
+        ):
+            response = client.get(
+                reverse("analytics:dashboard-events"), HTTP_ACCEPT="text/event-stream"
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/event-stream"
+        assert b"".join(response.streaming_content) == b"retry: 3000\n\n"
+
+    @pytest.mark.django_db
+    def test_endpoint_requires_authentication(self):
+        response = APIClient().get(
+            reverse("analytics:dashboard-events"), HTTP_ACCEPT="text/event-stream"
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "detail" in json.loads(response.content)
@@ -0,0 +1,150 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from src.apps.accounts.factories import CustomerFactory
+from src.apps.analytics.models import CustomerSegment
+from src.apps.analytics.segmentation import quintile_scores, score_rfm
+from src.apps.analytics.services import CustomerSegmentationService
+from src.apps.pets.factories import PetFactory
+from src.apps.schedule.factories import AppointmentFactory, ServiceFactory
+from src.apps.schedule.models import Appointment
+from src.apps.store.factories import SaleFactory
+from src.apps.store.models import Sale
+
+Segment = CustomerSegment.Segment
+
+
+class TestRfmScoring:
+    """Test suite for the vectorized RFM scoring."""
+
+    def test_quintile_scores_ignore_inactive_entries(self):
+        values = np.array([10, 20, 30, 40, 50, 0])
+        active = np.array([True, True, True, True, True, False])
+
+        scores = quintile_scores(values, active)
+
+        assert scores.tolist() == [1, 2, 3, 4, 5, 0]
+
+    def test_score_rfm_assigns_segments(self):
+        recency = np.array([1, 2, 300, 400, 5, -1])
+        frequency = np.array([20, 15, 18, 1, 1, 0])
+        monetary = np.array([900.0, 800.0, 950.0, 10.0, 5.0, 0.0])
+
+        r, f, m, segments = score_rfm(recency, frequency, monetary)
+
+        assert r.tolist() == [5, 4, 2, 1, 3, 0]
+        assert f.tolist() == [5, 3, 4, 2, 2, 0]
+        assert m.tolist() == [4, 3, 5, 2, 1, 0]
+        assert segments.tolist() == [
+            Segment.CHAMPIONS,
+            Segment.POTENTIAL_LOYALIST,
+            Segment.AT_RISK,
+            Segment.LOST,
+            Segment.NEEDS_ATTENTION,
+            Segment.INACTIVE,
+        ]
+
+
+@pytest.mark.django_db
+class TestCustomerSegmentationService:
+    """Test suite for CustomerSegmentationService.compute_segments."""
+
+    def _sale(self, customer, days_ago, value):
+        sale = SaleFactory(customer=customer, total_value=Decimal(value))
+        moment = timezone.now() - timezone.timedelta(days=days_ago)
+        Sale.objects.filter(pk=sale.pk).update(created_at=moment)
+
+    def test_combines_sales_and_visits(self):
+        customer = CustomerFactory()
+        self._sale(customer, 30, "100.00")
+        pet = PetFactory(owner=customer)
+        service = ServiceFactory(price=Decimal("50.00"))
+        AppointmentFactory(
+            pet=pet,
+            service=service,
+            schedule_time=timezone.now() - timezone.timedelta(days=3, hours=1),
+            status=Appointment.Status.COMPLETED,
+        )
+        AppointmentFactory(
+            pet=pet,
+            service=service,
+            schedule_time=timezone.now() - timezone.timedelta(days=10),
+            status=Appointment.Status.CANCELED,
+        )
+        AppointmentFactory(
+            pet=pet,
+            service=service,
+            schedule_time=timezone.now() + timezone.timedelta(days=2),
+            status=Appointment.Status.PENDING,
+        )
+        idle = CustomerFactory()
+
+        scored = CustomerSegmentationService.compute_segments()
+
+        assert scored == 2
+        segment = CustomerSegment.objects.get(customer=customer)
+        assert segment.recency_days == 3
+        assert segment.frequency == 2
+        assert segment.monetary == Decimal("150.00")
+        assert segment.segment == Segment.CHAMPIONS
+        empty = CustomerSegment.objects.get(customer=idle)
+        assert empty.recency_days is None
+        assert empty.segment == Segment.INACTIVE
+
+    def test_recompute_updates_existing_rows(self):
+        customer = CustomerFactory()
+        CustomerSegmentationService.compute_segments()
+        assert CustomerSegment.objects.get(customer=customer).frequency == 0
+
+        self._sale(customer, 1, "20.00")
+        CustomerSegmentationService.compute_segments()
+
+        assert CustomerSegment.objects.count() == 1
+        assert CustomerSegment.objects.get(customer=customer).frequency == 1
+
+    def test_no_customers_is_a_noop(self):
+        assert CustomerSegmentationService.compute_segments() == 0
+
+
+@pytest.mark.django_db
+class TestCustomerSegmentAPI:
+    """Test suite for the customer segment endpoints."""
+
+    def test_lists_and_filters_segments(self, authenticated_client):
+        client, _ = authenticated_client
+        buyer = CustomerFactory()
+        SaleFactory(customer=buyer, total_value=Decimal("10.00"))
+        CustomerFactory()
+        CustomerSegmentationService.compute_segments()
+
+        response = client.get(
+            reverse("analytics:customer-segment-list"),
+            {"segment": Segment.INACTIVE},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["segment_display"] == "Sem Histórico"
+
+    def test_summary_counts_customers_per_segment(self, authenticated_client):
+        client, _ = authenticated_client
+        CustomerFactory.create_batch(2)
+        CustomerSegmentationService.compute_segments()
+
+        response = client.get(reverse("analytics:customer-segment-summary"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [{"segment": Segment.INACTIVE, "count": 2}]
+
+    def test_requires_staff(self, client):
+        response = client.get(reverse("analytics:customer-segment-list"))
+
+        assert response.status_code in (
+            status.HTTP_401_UNAUTHORIZED,
+            status.HTTP_403_FORBIDDEN,
+        )
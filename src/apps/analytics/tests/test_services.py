@@ -6,11 +6,17 @@ from django.contrib.auth.models import User
 from django.utils import timezone
 
 from src.apps.accounts.factories import CustomerFactory
+from src.apps.analytics.models import (
+    MetricsRollup,
+    ProductRevenueRollup,
+    RollupDirtyDay,
+)
 from src.apps.analytics.services import AnalyticsService
 from src.apps.pets.factories import PetFactory
 from src.apps.schedule.factories import AppointmentFactory, ServiceFactory
 from src.apps.schedule.models import Appointment
 from src.apps.store.factories import ProductLotFactory, SaleFactory, SaleItemFactory
+from src.apps.store.models import Sale
 
 
 @pytest.mark.django_db
@@ -52,7 +58,7 @@ class TestAnalyticsService:
         """
         from datetime import datetime
 
-        yesterday = (timezone.now() - timedelta(days=1)).date()
+        yesterday = timezone.localdate() - timedelta(days=1)
         test_time = timezone.make_aware(
             datetime.combine(yesterday, datetime.min.time().replace(hour=12))
         )
@@ -83,7 +89,7 @@ class TestAnalyticsService:
         """
         from datetime import datetime
 
-        today = timezone.now().date()
+        today = timezone.localdate()
         test_time = timezone.make_aware(
             datetime.combine(today, datetime.min.time().replace(hour=12))
         )
@@ -125,7 +131,7 @@ class TestAnalyticsService:
         """
         from datetime import datetime
 
-        yesterday = (timezone.now() - timedelta(days=1)).date()
+        yesterday = timezone.localdate() - timedelta(days=1)
         test_time = timezone.make_aware(
             datetime.combine(yesterday, datetime.min.time().replace(hour=12))
         )
@@ -151,8 +157,8 @@ class TestAnalyticsService:
         """
         from datetime import datetime
 
-        yesterday = (timezone.now() - timedelta(days=1)).date()
-        day_before = (timezone.now() - timedelta(days=2)).date()
+        yesterday = timezone.localdate() - timedelta(days=1)
+        day_before = timezone.localdate() - timedelta(days=2)
 
         yesterday_time = timezone.make_aware(
             datetime.combine(yesterday, datetime.min.time().replace(hour=12))
@@ -199,3 +205,255 @@ class TestAnalyticsService:
             assert metric["total_revenue"] == 0.0
             assert metric["total_appointments"] == 0
             assert metric["new_customers"] == 0
+
+    def test_metrics_use_a_single_query(self, django_assert_num_queries):
+        """
+        Test that the whole dashboard is served by one database round trip.
+        """
+        with django_assert_num_queries(1):
+            AnalyticsService.get_dashboard_metrics(days=30)
+
+    def test_days_follow_local_time_zone(self):
+        """
+        Test that a sale late in the local evening counts for that local day,
+        even though it falls on the next day in UTC.
+        """
+        from datetime import datetime
+
+        yesterday = timezone.localdate() - timedelta(days=1)
+        late_evening = timezone.make_aware(
+            datetime.combine(yesterday, datetime.min.time().replace(hour=23, minute=30))
+        )
+        sale = SaleFactory(total_value=Decimal("80.00"))
+        # created_at is auto_now_add, so it has to be moved after creation.
+        Sale.objects.filter(pk=sale.pk).update(created_at=late_evening)
+
+        data = AnalyticsService.get_dashboard_metrics(days=2)
+
+        assert data["metrics_history"][0]["date"] == yesterday.isoformat()
+        assert data["metrics_history"][0]["total_revenue"] == 80.0
+        assert data["metrics_history"][1]["total_revenue"] == 0
+
+
+@pytest.mark.django_db
+class TestDashboardBucketCache:
+    """Test suite for the per-day dashboard bucket cache."""
+
+    def _sale_at(self, moment, value):
+        sale = SaleFactory(total_value=Decimal(value))
+        Sale.objects.filter(pk=sale.pk).update(created_at=moment)
+        return sale
+
+    def _noon(self, days_ago):
+        from datetime import datetime
+
+        day = timezone.localdate() - timedelta(days=days_ago)
+        return timezone.make_aware(
+            datetime.combine(day, datetime.min.time().replace(hour=12))
+        )
+
+    def test_warm_window_only_recomputes_today(self, django_assert_num_queries):
+        """
+        Test that past buckets are reused and only today's expiring bucket
+        is fetched again, whatever the window size.
+        """
+        from django.core.cache import cache
+
+        from src.apps.analytics.services import DAY_BUCKET_CACHE_KEY
+
+        AnalyticsService.get_dashboard_metrics(days=90)
+        cache.delete(DAY_BUCKET_CACHE_KEY.format(date=timezone.localdate()))
+
+        with django_assert_num_queries(1):
+            data = AnalyticsService.get_dashboard_metrics(days=90)
+        with django_assert_num_queries(0):
+            AnalyticsService.get_dashboard_metrics(days=90)
+
+        assert len(data["metrics_history"]) == 90
+
+    def test_past_bucket_is_invalidated_by_sale_signal(
+        self, django_capture_on_commit_callbacks
+    ):
+        """
+        Test that a cached past day only changes when a sale dated on it is
+        saved through the ORM.
+        """
+        sale = self._sale_at(self._noon(2), "40.00")
+        assert (
+            AnalyticsService.get_dashboard_metrics(days=3)["metrics_history"][0][
+                "total_revenue"
+            ]
+            == 40.0
+        )
+
+        Sale.objects.filter(pk=sale.pk).update(total_value=Decimal("90.00"))
+        assert (
+            AnalyticsService.get_dashboard_metrics(days=3)["metrics_history"][0][
+                "total_revenue"
+            ]
+            == 40.0
+        )
+
+        sale.refresh_from_db()
+        with django_capture_on_commit_callbacks(execute=True):
+            sale.save()
+        assert (
+            AnalyticsService.get_dashboard_metrics(days=3)["metrics_history"][0][
+                "total_revenue"
+            ]
+            == 90.0
+        )
+
+    def test_top_products_are_merged_across_days(self):
+        """
+        Test that product totals from several cached days are summed before
+        ranking.
+        """
+        lot_a = ProductLotFactory(quantity=100)
+        lot_b = ProductLotFactory(quantity=100)
+        for days_ago in (1, 2):
+            sale = self._sale_at(self._noon(days_ago), "0")
+            SaleItemFactory(sale=sale, lot=lot_a, quantity=1, unit_price=Decimal("60"))
+        sale = self._sale_at(self._noon(1), "0")
+        SaleItemFactory(sale=sale, lot=lot_b, quantity=1, unit_price=Decimal("100"))
+
+        top_products = AnalyticsService.get_dashboard_metrics(days=3)["top_products"]
+
+        assert top_products[0]["product_id"] == lot_a.product.id
+        assert top_products[0]["units_sold"] == 2
+        assert top_products[0]["revenue_generated"] == 120.0
+        assert top_products[1]["product_id"] == lot_b.product.id
+
+
+@pytest.mark.django_db
+class TestAdminHomeCounters:
+    """Test suite for the cached admin home counters."""
+
+    def test_counters(self):
+        lot = ProductLotFactory(quantity=100)
+        sale = SaleFactory(total_value=Decimal("30.00"))
+        SaleItemFactory(sale=sale, lot=lot, quantity=3, unit_price=Decimal("10"))
+        AppointmentFactory(status=Appointment.Status.CONFIRMED)
+        AppointmentFactory(status=Appointment.Status.CANCELED)
+
+        counters = AnalyticsService.get_admin_home()
+
+        assert counters["revenue_today"] == 30.0
+        assert counters["revenue_monthly"] == 30.0
+        assert counters["appointments_today"] == 1
+        assert len(counters["chart_values"]) == 7
+        assert counters["chart_values"][-1] == 30.0
+        assert counters["top_products"][0]["product_name"] == lot.product.name
+        assert counters["top_products"][0]["units_sold"] == 3
+
+    def test_cached_until_a_sale_is_saved(
+        self, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        AnalyticsService.get_admin_home()
+
+        with django_assert_num_queries(0):
+            AnalyticsService.get_admin_home()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            SaleFactory(total_value=Decimal("12.50"))
+
+        assert AnalyticsService.get_admin_home()["revenue_today"] == 12.5
+
+
+@pytest.mark.django_db
+class TestMetricsRollups:
+    """Test suite for the day/week/month rollup tables."""
+
+    def _sale_at(self, moment, lot, unit_price):
+        sale = SaleFactory(total_value=Decimal(unit_price))
+        SaleItemFactory(sale=sale, lot=lot, quantity=1, unit_price=Decimal(unit_price))
+        Sale.objects.filter(pk=sale.pk).update(created_at=moment)
+        return sale
+
+    def _noon(self, day):
+        from datetime import datetime
+
+        return timezone.make_aware(
+            datetime.combine(day, datetime.min.time().replace(hour=12))
+        )
+
+    def test_full_refresh_builds_every_granularity(self):
+        """
+        Test that a first refresh backfills daily rows and aggregates them
+        into weeks and months.
+        """
+        today = timezone.localdate()
+        monday = today - timedelta(days=today.weekday() + 7)
+        lot = ProductLotFactory(quantity=100)
+        self._sale_at(self._noon(monday), lot, "30.00")
+        self._sale_at(self._noon(monday + timedelta(days=2)), lot, "20.00")
+
+        AnalyticsService.refresh_rollups()
+
+        week = MetricsRollup.objects.get(granularity="week", period_start=monday)
+        assert week.revenue == Decimal("50.00")
+        assert week.sales_count == 2
+        month_total = sum(
+            MetricsRollup.objects.filter(granularity="month").values_list(
+                "revenue", flat=True
+            )
+        )
+        assert month_total == Decimal("50.00")
+        product = ProductRevenueRollup.objects.get(
+            granularity="week", period_start=monday
+        )
+        assert product.units_sold == 2
+        assert product.revenue == Decimal("50.00")
+
+    def test_incremental_refresh_only_rebuilds_changed_days(
+        self, django_capture_on_commit_callbacks
+    ):
+        """
+        Test that later refreshes rebuild today plus the days marked as
+        changed, and clear the queue.
+        """
+        AnalyticsService.refresh_rollups()
+        old_day = timezone.localdate() - timedelta(days=40)
+        lot = ProductLotFactory(quantity=100)
+        sale = self._sale_at(self._noon(old_day), lot, "70.00")
+
+        assert AnalyticsService.refresh_rollups() == 1
+        assert not MetricsRollup.objects.filter(
+            granularity="day", period_start=old_day, revenue__gt=0
+        ).exists()
+
+        sale.refresh_from_db()
+        with django_capture_on_commit_callbacks(execute=True):
+            sale.save()
+
+        assert AnalyticsService.refresh_rollups() == 2
+        assert MetricsRollup.objects.get(
+            granularity="day", period_start=old_day
+        ).revenue == Decimal("70.00")
+        assert not RollupDirtyDay.objects.exists()
+
+    def test_rollup_metrics_read_periods(self, django_assert_num_queries):
+        """
+        Test that long windows are read with two queries and report one
+        entry per period.
+        """
+        today = timezone.localdate()
+        lot = ProductLotFactory(quantity=100)
+        self._sale_at(self._noon(today - timedelta(days=200)), lot, "99.00")
+        AnalyticsService.refresh_rollups()
+
+        with django_assert_num_queries(2):
+            data = AnalyticsService.get_rollup_metrics(days=365)
+
+        assert data["granularity"] == "week"
+        assert data["period_start"] <= (today - timedelta(days=364)).isoformat()
+        assert sum(day["total_revenue"] for day in data["metrics_history"]) == 99.0
+        assert data["top_products"][0]["units_sold"] == 1
+
+    def test_pick_granularity(self):
+        """
+        Test that the coarsest granularity keeping ~90 points is chosen.
+        """
+        assert AnalyticsService.pick_granularity(90) == "day"
+        assert AnalyticsService.pick_granularity(365) == "week"
+        assert AnalyticsService.pick_granularity(1825) == "month"
@@ -0,0 +1,129 @@
+from datetime import datetime, time, timedelta
+
+import numpy as np
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from src.apps.analytics.services import AnalyticsService
+from src.apps.analytics.utilization import minutes_by_hour
+from src.apps.schedule.factories import AppointmentFactory, ServiceFactory
+from src.apps.schedule.models import Appointment, TimeSlot
+
+
+def test_minutes_by_hour_spreads_intervals():
+    matrix = minutes_by_hour(
+        weekdays=np.array([0, 0, 6]),
+        start_minutes=np.array([9 * 60 + 30, 9 * 60, 23 * 60 + 30]),
+        durations=np.array([60, 30, 60]),
+        weights=np.array([1, 2, 1]),
+    )[0]
+
+    assert matrix[0, 9] == 30 + 60
+    assert matrix[0, 10] == 30
+    assert matrix[6, 23] == 30
+    assert matrix.sum() == 150
+
+
+@pytest.mark.django_db
+class TestUtilization:
+    """Test suite for the weekday x hour utilization heatmap."""
+
+    @pytest.fixture
+    def monday(self):
+        today = timezone.localdate()
+        return today - timedelta(days=today.weekday(), weeks=2)
+
+    def _at(self, day, hour, minute=0):
+        return timezone.make_aware(datetime.combine(day, time(hour, minute)))
+
+    def test_occupied_and_open_minutes(self, monday):
+        TimeSlot.objects.create(day_of_week=0, start_time=time(9), end_time=time(12))
+        bath = ServiceFactory(duration_minutes=60)
+        nails = ServiceFactory(duration_minutes=30)
+        AppointmentFactory(
+            service=bath,
+            schedule_time=self._at(monday, 9, 30),
+            status=Appointment.Status.COMPLETED,
+        )
+        AppointmentFactory(
+            service=nails,
+            schedule_time=self._at(monday, 9),
+            status=Appointment.Status.CONFIRMED,
+        )
+        AppointmentFactory(
+            service=bath,
+            schedule_time=self._at(monday, 11),
+            status=Appointment.Status.CANCELED,
+        )
+
+        data = AnalyticsService.get_utilization(monday, monday + timedelta(days=2))
+
+        assert data["period_start"] == monday.isoformat()
+        assert data["period_end"] == (monday + timedelta(days=6)).isoformat()
+        assert data["lanes"] == 1
+        assert data["occupied_minutes"][0][9:12] == [60, 30, 0]
+        assert data["open_minutes"][0][8:13] == [0, 60, 60, 60, 0]
+        assert data["utilization"][0][9:12] == [1.0, 0.5, 0.0]
+        assert data["utilization"][0][8] is None
+        assert data["services"] == [
+            {
+                "service_id": bath.pk,
+                "service_name": bath.name,
+                "appointments": 1,
+                "occupied_minutes": 60,
+            },
+            {
+                "service_id": nails.pk,
+                "service_name": nails.name,
+                "appointments": 1,
+                "occupied_minutes": 30,
+            },
+        ]
+
+        only_nails = AnalyticsService.get_utilization(
+            monday, monday, service_id=nails.pk
+        )
+        assert only_nails["occupied_minutes"][0][9:11] == [30, 0]
+
+    def test_weeks_are_cached_until_appointments_change(
+        self, monday, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        service = ServiceFactory(duration_minutes=60)
+        AnalyticsService.get_utilization(monday, monday)
+
+        with django_assert_num_queries(2):
+            AnalyticsService.get_utilization(monday, monday)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            AppointmentFactory(
+                service=service,
+                schedule_time=self._at(monday, 14),
+                status=Appointment.Status.CONFIRMED,
+            )
+
+        data = AnalyticsService.get_utilization(monday, monday)
+        assert data["occupied_minutes"][0][14] == 60
+
+    def test_endpoint(self, authenticated_client, monday):
+        client, _ = authenticated_client
+
+        response = client.get(
+            reverse("analytics:utilization"),
+            {"start": monday.isoformat(), "end": monday.isoformat()},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["occupied_minutes"]) == 7
+        assert len(response.data["occupied_minutes"][0]) == 24
+
+    def test_endpoint_rejects_long_ranges(self, authenticated_client):
+        client, _ = authenticated_client
+
+        response = client.get(
+            reverse("analytics:utilization"),
+            {"start": "2020-01-01", "end": "2021-01-01"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -1,9 +1,29 @@
 from django.urls import path
 
-from src.apps.analytics.views import DashboardMetricsView
+from src.apps.analytics.views import (
+    CustomerSegmentListView,
+    CustomerSegmentSummaryView,
+    DashboardEventsView,
+    DashboardMetricsView,
+    DataExportView,
+    UtilizationView,
+)
 
 app_name = "analytics"
 
 urlpatterns = [
     path("dashboard/", DashboardMetricsView.as_view(), name="dashboard-metrics"),
+    path("dashboard/events/", DashboardEventsView.as_view(), name="dashboard-events"),
+    path("exports/<slug:dataset>/", DataExportView.as_view(), name="data-export"),
+    path("utilization/", UtilizationView.as_view(), name="utilization"),
+    path(
+        "customer-segments/",
+        CustomerSegmentListView.as_view(),
+        name="customer-segment-list",
+    ),
+    path(
+        "customer-segments/summary/",
+        CustomerSegmentSummaryView.as_view(),
+        name="customer-segment-summary",
+    ),
 ]
@@ -0,0 +1,46 @@
+"""
+Vectorized weekday x hour occupancy.
+
+Intervals are spread over a per-minute timeline with a difference array
+(+n at the start minute, -n at the end minute, then a cumulative sum), so
+any number of appointments or opening hours costs a few array operations.
+"""
+
+import numpy as np
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def minutes_by_hour(
+    weekdays: np.ndarray,
+    start_minutes: np.ndarray,
+    durations: np.ndarray,
+    weights: np.ndarray,
+    *,
+    groups: np.ndarray | None = None,
+    n_groups: int = 1,
+) -> np.ndarray:
+    """
+    Sums weighted interval minutes into a ``(n_groups, 7, 24)`` matrix.
+
+    Each interval starts at ``start_minutes`` past midnight of ``weekdays``
+    (0 is Monday) and lasts ``durations`` minutes; time past midnight is
+    dropped. ``groups`` assigns every interval to a row of the result.
+    """
+    if groups is None:
+        groups = np.zeros(len(weekdays), dtype=np.int64)
+
+    ends = np.minimum(start_minutes + durations, MINUTES_PER_DAY)
+    timeline = np.zeros((n_groups, 7, MINUTES_PER_DAY + 1), dtype=np.int64)
+    np.add.at(timeline, (groups, weekdays, start_minutes), weights)
+    np.add.at(timeline, (groups, weekdays, ends), -weights)
+
+    occupied = np.cumsum(timeline, axis=2)[:, :, :MINUTES_PER_DAY]
+    return occupied.reshape(n_groups, 7, 24, 60).sum(axis=3)
+
+
+def utilization_ratio(occupied: np.ndarray, capacity: np.ndarray) -> list:
+    """``occupied / capacity`` rounded to 3 places; None where nothing is open."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.round(occupied / capacity, 3)
+    return np.where(capacity > 0, ratio, None).tolist()
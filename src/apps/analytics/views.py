@@ -1,11 +1,30 @@
-from drf_spectacular.utils import OpenApiParameter, extend_schema
-from rest_framework import status
-from rest_framework.permissions import IsAuthenticated
+import json
+
+import structlog
+from django.db.models import Count
+from django.http import StreamingHttpResponse
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
+from rest_framework import generics, renderers, status
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from src.apps.analytics.serializers import DashboardDataSerializer
-from src.apps.analytics.services import AnalyticsService
+from src.apps.analytics.exports import DATASETS, FORMATS, ExportError, export_rows
+from src.apps.analytics.live import stream_dashboard_events
+from src.apps.analytics.models import CustomerSegment, Granularity
+from src.apps.analytics.serializers import (
+    CustomerSegmentSerializer,
+    DashboardDataSerializer,
+    ExportParamsSerializer,
+    SegmentCountSerializer,
+    UtilizationParamsSerializer,
+    UtilizationSerializer,
+)
+from src.apps.analytics.services import ROLLUP_MAX_DAYS, AnalyticsService
+
+logger = structlog.get_logger(__name__)
+
+LIVE_MAX_DAYS = 90
 
 
 class DashboardMetricsView(APIView):
@@ -18,7 +37,10 @@ class DashboardMetricsView(APIView):
     - Top-selling products
 
     Query Parameters:
-    - days (int): Number of days to look back (default: 7, max: 90)
+    - days (int): Number of days to look back (default: 7, max: 3660)
+    - granularity (str): day, week or month. Windows up to 90 days without
+      it are computed live; anything else is read from the rollup tables,
+      picking the coarsest granularity that fits when it is omitted.
     """
 
     permission_classes = [IsAuthenticated]
@@ -31,9 +53,20 @@ class DashboardMetricsView(APIView):
                 name="days",
                 type=int,
                 location=OpenApiParameter.QUERY,
-                description="Number of days to analyze (default: 7, max: 90)",
+                description="Number of days to analyze (default: 7, max: 3660)",
                 required=False,
-            )
+            ),
+            OpenApiParameter(
+                name="granularity",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                enum=Granularity.values,
+                description=(
+                    "Resolution of metrics_history. Omit it to get live daily "
+                    "metrics up to 90 days and automatic rollups beyond that."
+                ),
+                required=False,
+            ),
         ],
         responses={200: DashboardDataSerializer},
         tags=["Analytics"],
@@ -59,14 +92,29 @@ class DashboardMetricsView(APIView):
                 {"error": "Parameter 'days' must be at least 1"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        if days > 90:
+        if days > ROLLUP_MAX_DAYS:
+            return Response(
+                {"error": f"Parameter 'days' cannot exceed {ROLLUP_MAX_DAYS}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        granularity = request.query_params.get("granularity")
+        if granularity is not None and granularity not in Granularity.values:
             return Response(
-                {"error": "Parameter 'days' cannot exceed 90"},
+                {
+                    "error": "Parameter 'granularity' must be one of: "
+                    + ", ".join(Granularity.values)
+                },
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
         try:
-            data = AnalyticsService.get_dashboard_metrics(days=days)
+            if granularity is None and days <= LIVE_MAX_DAYS:
+                data = AnalyticsService.get_dashboard_metrics(days=days)
+            else:
+                data = AnalyticsService.get_rollup_metrics(
+                    days=days, granularity=granularity
+                )
         except Exception as e:
             return Response(
                 {"error": "Failed to retrieve metrics", "detail": str(e)},
@@ -75,3 +123,178 @@ class DashboardMetricsView(APIView):
 
         serializer = DashboardDataSerializer(data)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+class EventStreamRenderer(renderers.BaseRenderer):
+    """Lets DRF negotiate ``text/event-stream``; errors are rendered as JSON."""
+
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data).encode(self.charset)
+
+
+class DashboardEventsView(APIView):
+    """
+    Server-sent event stream of dashboard deltas.
+
+    Each committed sale or appointment change is published once through
+    Redis pub/sub and relayed to every open dashboard, which applies it to
+    the data it already loaded instead of polling the metrics endpoint.
+    """
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [EventStreamRenderer, renderers.JSONRenderer]
+
+    @extend_schema(
+        summary="Stream Dashboard Updates",
+        description=(
+            "Server-sent events with one `delta` event per committed change: "
+            "`sale` (date, revenue_delta, sales_delta), `appointment` (date, "
+            "status, previous_date, previous_status) or `refresh` (dates to "
+            "refetch after bulk updates)."
+        ),
+        responses={
+            200: OpenApiResponse(description="text/event-stream of delta events")
+        },
+        tags=["Analytics"],
+    )
+    def get(self, request):
+        response = StreamingHttpResponse(
+            stream_dashboard_events(), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+class DataExportView(APIView):
+    """
+    Streams sales, sale items or appointments for BI tools.
+
+    Rows are read through a server-side cursor and sent chunk by chunk, so
+    any date range is exported in constant memory.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="Export Data",
+        description=(
+            "Streams the `sales`, `sale-items` or `appointments` dataset for "
+            "the inclusive local date range as CSV, NDJSON or Parquet."
+        ),
+        parameters=[ExportParamsSerializer],
+        responses={200: OpenApiResponse(description="Streamed file")},
+        tags=["Analytics"],
+    )
+    def get(self, request, dataset):
+        if dataset not in DATASETS:
+            return Response(
+                {"error": f"Unknown dataset '{dataset}'"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        params = ExportParamsSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        file_format = params.validated_data["file_format"]
+
+        try:
+            chunks = export_rows(
+                dataset,
+                file_format,
+                params.validated_data["start"],
+                params.validated_data["end"],
+            )
+        except ExportError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        filename = (
+            f"{dataset}_{params.validated_data['start']:%Y%m%d}_"
+            f"{params.validated_data['end']:%Y%m%d}.{file_format}"
+        )
+        response = StreamingHttpResponse(chunks, content_type=FORMATS[file_format][0])
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        logger.info(
+            "data_export_started",
+            dataset=dataset,
+            file_format=file_format,
+            user=request.user.username,
+        )
+        return response
+
+
+class UtilizationView(APIView):
+    """Appointment load per weekday and hour against the opening hours."""
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="Service Utilization Heatmap",
+        description=(
+            "Occupied versus open minutes per weekday and hour for the whole "
+            "weeks covering the range, optionally for one service."
+        ),
+        parameters=[UtilizationParamsSerializer],
+        responses={200: UtilizationSerializer},
+        tags=["Analytics"],
+    )
+    def get(self, request):
+        params = UtilizationParamsSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        data = AnalyticsService.get_utilization(
+            params.validated_data["start"],
+            params.validated_data["end"],
+            service_id=params.validated_data.get("service"),
+        )
+        return Response(data)
+
+
+class CustomerSegmentListView(generics.ListAPIView):
+    """Lists the RFM segment of every customer, best customers first."""
+
+    permission_classes = [IsAdminUser]
+    serializer_class = CustomerSegmentSerializer
+
+    @extend_schema(
+        summary="List Customer Segments",
+        parameters=[
+            OpenApiParameter(
+                name="segment",
+                type=str,
+                enum=CustomerSegment.Segment.values,
+                description="Only return customers of this segment",
+            )
+        ],
+        tags=["Analytics"],
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        queryset = CustomerSegment.objects.select_related("customer__user")
+        segment = self.request.query_params.get("segment")
+        if segment:
+            queryset = queryset.filter(segment=segment)
+        return queryset
+
+
+class CustomerSegmentSummaryView(APIView):
+    """Number of customers in each RFM segment."""
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="Customer Segment Summary",
+        responses={200: SegmentCountSerializer(many=True)},
+        tags=["Analytics"],
+    )
+    def get(self, request):
+        counts = (
+            CustomerSegment.objects.values("segment")
+            .annotate(count=Count("pk"))
+            .order_by("-count", "segment")
+        )
+        return Response(SegmentCountSerializer(counts, many=True).data)
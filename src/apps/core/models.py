@@ -0,0 +1,27 @@
+class TrackedFieldsMixin:
+    """
+    Remembers the database values of ``TRACKED_FIELDS`` on load and after
+    save, so business rules and signal receivers can compare against them
+    without re-fetching the row.
+    """
+
+    TRACKED_FIELDS: tuple[str, ...] = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_tracked_fields()
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._snapshot_tracked_fields()
+
+    def get_original_value(self, field_name: str):
+        """Returns the value ``field_name`` had when last loaded or saved."""
+        return getattr(self, "_original_values", {}).get(field_name)
+
+    def _snapshot_tracked_fields(self):
+        self._original_values = {
+            name: self.__dict__.get(name) for name in self.TRACKED_FIELDS
+        }
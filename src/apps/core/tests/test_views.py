@@ -79,9 +79,22 @@ class TestHealthCheckView:
 
     def test_health_check_returns_ok(self, client):
         """Should return OK status."""
-        response = client.get("/api/v1/status/")
+        with patch("src.apps.core.views.warm_up") as mock_warm_up:
+            response = client.get("/api/v1/status/")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "ok"
         assert data["service"] == "petcare"
+        assert data["ai"] == "ready"
+        mock_warm_up.assert_called_once()
+
+    def test_health_check_survives_ai_warm_up_failure(self, client):
+        """Should stay OK when the AI clients cannot be built."""
+        with patch(
+            "src.apps.core.views.warm_up", side_effect=ValueError("missing key")
+        ):
+            response = client.get("/api/v1/status/")
+
+        assert response.status_code == 200
+        assert response.json()["ai"] == "unavailable"
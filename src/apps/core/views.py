@@ -1,10 +1,15 @@
 import os
 
+import structlog
 from django.conf import settings
 from django.http import HttpResponse, JsonResponse
 from django.views import View
 from django.views.generic import TemplateView
 
+from src.apps.ai.clients import warm_up
+
+logger = structlog.get_logger(__name__)
+
 
 class AutoSchemaModelNameMixin:
     """
@@ -53,7 +58,17 @@ class HealthCheckView(View):
     """
     A simple view that returns a 200 OK status if the service is running.
     Used by the deployment script to verify application health.
+
+    Each check also warms the worker's shared AI clients, so the first AI
+    request after a deploy does not pay for building them. A failure there
+    is reported but does not fail the check.
     """
 
     def get(self, request, *args, **kwargs):
-        return JsonResponse({"status": "ok", "service": "petcare"})
+        try:
+            warm_up()
+            ai_status = "ready"
+        except Exception as e:
+            logger.warning("ai_clients_warm_up_failed", error=str(e))
+            ai_status = "unavailable"
+        return JsonResponse({"status": "ok", "service": "petcare", "ai": ai_status})
@@ -55,8 +55,9 @@ class PetAdmin(admin.ModelAdmin):
             HealthAssistantService,
             HealthInsightRequest,
         )
+        from src.apps.ai.clients import get_service
 
-        service = HealthAssistantService()
+        service = get_service(HealthAssistantService)
         success_count = 0
         error_count = 0
 
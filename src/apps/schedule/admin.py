@@ -1,17 +1,38 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 
 from .forms import AppointmentAdminForm, ServiceAdminForm
+from .models import Appointment
+from .services import AppointmentService
 
 
 class AppointmentAdmin(admin.ModelAdmin):
     change_list_template = "admin/schedule/appointment/change_list.html"
     form = AppointmentAdminForm
-    list_display = ["pet", "service", "schedule_time", "status", "completed_at"]
-    list_select_related = ["pet", "service", "pet__owner__user"]
+    list_display = [
+        "pet",
+        "service",
+        "resource",
+        "schedule_time",
+        "status",
+        "completed_at",
+    ]
+    list_select_related = ["pet", "service", "resource", "pet__owner__user"]
     search_fields = ["pet__name", "service__name"]
     autocomplete_fields = ["pet"]
-    list_filter = ["service", "status", "schedule_time"]
+    list_filter = ["service", "resource", "status", "schedule_time"]
     readonly_fields = ["completed_at"]
+    actions = ["mark_as_completed"]
+
+    @admin.action(description="Marcar como concluídos")
+    def mark_as_completed(self, request, queryset):
+        updated = AppointmentService.bulk_update_status(
+            queryset, Appointment.Status.COMPLETED
+        )
+        self.message_user(
+            request,
+            f"{updated} agendamento(s) marcado(s) como concluído(s).",
+            messages.SUCCESS,
+        )
 
     class Media:
         js = ("js/schedule_admin.js",)
@@ -23,6 +44,13 @@ class ServiceAdmin(admin.ModelAdmin):
     search_fields = ["name"]
 
 
+class ResourceAdmin(admin.ModelAdmin):
+    list_display = ["name", "kind", "is_active"]
+    list_filter = ["kind", "is_active"]
+    search_fields = ["name"]
+    filter_horizontal = ["services"]
+
+
 class TimeSlotAdmin(admin.ModelAdmin):
     list_display = ["get_day_of_week_display", "start_time", "end_time"]
     ordering = ["day_of_week", "start_time"]
@@ -1,5 +1,5 @@
 import random
-from datetime import time
+from datetime import time, timedelta
 
 import factory
 from django.utils import timezone
@@ -7,7 +7,13 @@ from factory.django import DjangoModelFactory
 from faker import Faker
 
 from src.apps.pets.factories import PetFactory
-from src.apps.schedule.models import Appointment, Service, TimeSlot
+from src.apps.schedule.models import (
+    Appointment,
+    AppointmentSeries,
+    Resource,
+    Service,
+    TimeSlot,
+)
 
 fake = Faker("pt_BR")
 
@@ -38,6 +44,21 @@ class ServiceFactory(DjangoModelFactory):
     duration_minutes = factory.Iterator([30, 45, 60, 90])
 
 
+class ResourceFactory(DjangoModelFactory):
+    class Meta:
+        model = Resource
+        skip_postgeneration_save = True
+
+    name = factory.LazyFunction(fake.first_name)
+    kind = Resource.Kind.GROOMER
+    is_active = True
+
+    @factory.post_generation
+    def services(self, create, extracted, **kwargs):
+        if create and extracted:
+            self.services.add(*extracted)
+
+
 class AppointmentFactory(DjangoModelFactory):
     class Meta:
         model = Appointment
@@ -51,6 +72,18 @@ class AppointmentFactory(DjangoModelFactory):
     )
 
 
+class AppointmentSeriesFactory(DjangoModelFactory):
+    class Meta:
+        model = AppointmentSeries
+
+    pet = factory.SubFactory(PetFactory)
+    service = factory.SubFactory(ServiceFactory)
+    start_date = factory.LazyFunction(lambda: timezone.localdate() + timedelta(days=7))
+    time = time(10, 0)
+    interval_weeks = 1
+    occurrences = 4
+
+
 class TimeSlotFactory(DjangoModelFactory):
     class Meta:
         model = TimeSlot
@@ -44,7 +44,7 @@ class AppointmentAdminForm(forms.ModelForm):
 
     class Meta:
         model = Appointment
-        fields = ["pet", "service", "status", "notes"]
+        fields = ["pet", "service", "resource", "status", "notes"]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -147,6 +147,7 @@ class AppointmentAdminForm(forms.ModelForm):
                 schedule_time=cleaned_data.get("schedule_time"),
                 status=cleaned_data.get("status"),
                 notes=cleaned_data.get("notes"),
+                resource=cleaned_data.get("resource"),
             )
         except ValueError as e:
             raise forms.ValidationError(str(e)) from e
@@ -0,0 +1,96 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:16
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pets", "0003_alter_pet_options_alter_breed_description"),
+        ("schedule", "0006_alter_appointment_schedule_time"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="appointment",
+            name="schedule_time",
+            field=models.DateTimeField(
+                db_index=True, verbose_name="Data e Hora do Agendamento"
+            ),
+        ),
+        migrations.CreateModel(
+            name="Resource",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=100, verbose_name="Nome")),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("GROOMER", "Tosador(a)"),
+                            ("VET", "Veterinário(a)"),
+                            ("ROOM", "Sala"),
+                        ],
+                        default="GROOMER",
+                        max_length=10,
+                        verbose_name="Tipo",
+                    ),
+                ),
+                ("is_active", models.BooleanField(default=True, verbose_name="Ativo")),
+                (
+                    "services",
+                    models.ManyToManyField(
+                        blank=True,
+                        help_text="Serviços que este recurso pode atender.",
+                        related_name="resources",
+                        to="schedule.service",
+                        verbose_name="Serviços",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Recurso",
+                "verbose_name_plural": "Recursos",
+                "ordering": ["kind", "name"],
+            },
+        ),
+        migrations.AddField(
+            model_name="appointment",
+            name="resource",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Profissional ou sala alocado. Vazio para serviços sem recursos.",
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="appointments",
+                to="schedule.resource",
+                verbose_name="Recurso",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="appointment",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("resource__isnull", False)),
+                fields=("resource", "schedule_time"),
+                name="unique_appointment_per_resource_time",
+                violation_error_message="Este recurso já possui um agendamento neste mesmo horário.",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="appointment",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("resource__isnull", True)),
+                fields=("schedule_time",),
+                name="unique_appointment_time_without_resource",
+                violation_error_message="Já existe um agendamento exatamente neste mesmo horário.",
+            ),
+        ),
+    ]
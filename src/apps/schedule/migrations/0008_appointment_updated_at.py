@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("schedule", "0007_resource_appointment_resource"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="appointment",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, verbose_name="Última Atualização"
+            ),
+        ),
+    ]
@@ -0,0 +1,86 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("pets", "0003_alter_pet_options_alter_breed_description"),
+        ("schedule", "0008_appointment_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AppointmentSeries",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "start_date",
+                    models.DateField(verbose_name="Data da Primeira Ocorrência"),
+                ),
+                ("time", models.TimeField(verbose_name="Horário")),
+                (
+                    "interval_weeks",
+                    models.PositiveSmallIntegerField(
+                        default=1,
+                        help_text="Intervalo, em semanas, entre duas ocorrências.",
+                        verbose_name="Intervalo em semanas",
+                    ),
+                ),
+                (
+                    "occurrences",
+                    models.PositiveSmallIntegerField(
+                        verbose_name="Número de Ocorrências"
+                    ),
+                ),
+                ("notes", models.TextField(blank=True, verbose_name="Observações")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Criado em"),
+                ),
+                (
+                    "pet",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="appointment_series",
+                        to="pets.pet",
+                    ),
+                ),
+                (
+                    "service",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="appointment_series",
+                        to="schedule.service",
+                        verbose_name="Serviço",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Série de Agendamentos",
+                "verbose_name_plural": "Séries de Agendamentos",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.AddField(
+            model_name="appointment",
+            name="series",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="appointments",
+                to="schedule.appointmentseries",
+                verbose_name="Série",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("schedule", "0009_appointmentseries"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="appointment",
+            name="reminder_sent_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="Lembrete enviado em"
+            ),
+        ),
+    ]
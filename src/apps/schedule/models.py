@@ -1,5 +1,6 @@
 from django.db import models
 
+from src.apps.core.models import TrackedFieldsMixin
 from src.apps.pets.models import Pet
 
 
@@ -21,7 +22,72 @@ class Service(models.Model):
         return self.name
 
 
-class Appointment(models.Model):
+class Resource(models.Model):
+    """A bookable staff member or room; each one runs one appointment at a time."""
+
+    class Kind(models.TextChoices):
+        GROOMER = "GROOMER", "Tosador(a)"
+        VETERINARIAN = "VET", "Veterinário(a)"
+        ROOM = "ROOM", "Sala"
+
+    name = models.CharField(max_length=100, verbose_name="Nome")
+    kind = models.CharField(
+        max_length=10,
+        choices=Kind.choices,
+        default=Kind.GROOMER,
+        verbose_name="Tipo",
+    )
+    services = models.ManyToManyField(
+        Service,
+        related_name="resources",
+        blank=True,
+        verbose_name="Serviços",
+        help_text="Serviços que este recurso pode atender.",
+    )
+    is_active = models.BooleanField(default=True, verbose_name="Ativo")
+
+    class Meta:
+        ordering = ["kind", "name"]
+        verbose_name = "Recurso"
+        verbose_name_plural = "Recursos"
+
+    def __str__(self):
+        return f"{self.name} ({self.get_kind_display()})"
+
+
+class AppointmentSeries(models.Model):
+    """A weekly recurring booking, materialized into individual appointments."""
+
+    pet = models.ForeignKey(
+        Pet, on_delete=models.PROTECT, related_name="appointment_series"
+    )
+    service = models.ForeignKey(
+        Service,
+        on_delete=models.PROTECT,
+        related_name="appointment_series",
+        verbose_name="Serviço",
+    )
+    start_date = models.DateField(verbose_name="Data da Primeira Ocorrência")
+    time = models.TimeField(verbose_name="Horário")
+    interval_weeks = models.PositiveSmallIntegerField(
+        default=1,
+        help_text="Intervalo, em semanas, entre duas ocorrências.",
+        verbose_name="Intervalo em semanas",
+    )
+    occurrences = models.PositiveSmallIntegerField(verbose_name="Número de Ocorrências")
+    notes = models.TextField(blank=True, verbose_name="Observações")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Criado em")
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Série de Agendamentos"
+        verbose_name_plural = "Séries de Agendamentos"
+
+    def __str__(self):
+        return f"Série de {self.service.name} para {self.pet.name}"
+
+
+class Appointment(TrackedFieldsMixin, models.Model):
     class Status(models.TextChoices):
         PENDING = "PENDING", "Pendente"
         CONFIRMED = "CONFIRMED", "Confirmado"
@@ -35,12 +101,26 @@ class Appointment(models.Model):
         related_name="appointments",
         verbose_name="Serviço",
     )
+    resource = models.ForeignKey(
+        Resource,
+        on_delete=models.PROTECT,
+        related_name="appointments",
+        null=True,
+        blank=True,
+        verbose_name="Recurso",
+        help_text="Profissional ou sala alocado. Vazio para serviços sem recursos.",
+    )
+    series = models.ForeignKey(
+        AppointmentSeries,
+        on_delete=models.SET_NULL,
+        related_name="appointments",
+        null=True,
+        blank=True,
+        verbose_name="Série",
+    )
     schedule_time = models.DateTimeField(
         verbose_name="Data e Hora do Agendamento",
-        unique=True,
-        error_messages={
-            "unique": "Já existe um agendamento exatamente neste mesmo horário."
-        },
+        db_index=True,
     )
     status = models.CharField(
         max_length=10,
@@ -56,11 +136,31 @@ class Appointment(models.Model):
     completed_at = models.DateTimeField(
         null=True, blank=True, verbose_name="Concluído em"
     )
+    reminder_sent_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="Lembrete enviado em"
+    )
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Última Atualização")
 
     class Meta:
         ordering = ["-schedule_time"]
         verbose_name = "Agendamento"
         verbose_name_plural = "Agendamentos"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["resource", "schedule_time"],
+                condition=models.Q(resource__isnull=False),
+                name="unique_appointment_per_resource_time",
+                violation_error_message="Este recurso já possui um agendamento neste mesmo horário.",
+            ),
+            models.UniqueConstraint(
+                fields=["schedule_time"],
+                condition=models.Q(resource__isnull=True),
+                name="unique_appointment_time_without_resource",
+                violation_error_message="Já existe um agendamento exatamente neste mesmo horário.",
+            ),
+        ]
+
+    TRACKED_FIELDS = ("schedule_time", "status", "completed_at")
 
     def __str__(self):
         formatted_date = self.schedule_time.strftime("%d/%m/%Y ás %H:%M")
@@ -1,8 +1,11 @@
 import zoneinfo
 
+from django.db import transaction
+from django.utils import timezone
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
-from .models import Appointment, Service, TimeSlot
+from .models import Appointment, AppointmentSeries, Service, TimeSlot
 from .services import AppointmentService
 
 
@@ -18,12 +21,42 @@ class TimeSlotSerializer(serializers.ModelSerializer):
         fields = ["id", "day_of_week", "start_time", "end_time"]
 
 
+class AppointmentCalendarRowSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    start = serializers.DateTimeField()
+    duration = serializers.IntegerField(help_text="Duração em minutos.")
+    pet = serializers.CharField()
+    service = serializers.CharField()
+    status = serializers.CharField()
+
+
+class AppointmentBulkStatusSerializer(serializers.Serializer):
+    status = serializers.ChoiceField(choices=Appointment.Status.choices)
+    date = serializers.DateField(
+        required=False, help_text="Atualiza todos os agendamentos desta data."
+    )
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False,
+        help_text="Atualiza apenas os agendamentos com estes IDs.",
+    )
+
+    def validate(self, data):
+        if "date" not in data and "ids" not in data:
+            raise serializers.ValidationError("Informe 'date' e/ou 'ids'.")
+        return data
+
+
 class AppointmentSerializer(serializers.ModelSerializer):
     pet_name = serializers.CharField(source="pet.name", read_only=True)
     service_name = serializers.CharField(source="service.name", read_only=True)
     service_duration = serializers.IntegerField(
         source="service.duration_minutes", read_only=True
     )
+    resource_name = serializers.CharField(
+        source="resource.name", read_only=True, default=None
+    )
 
     schedule_date = serializers.DateField(write_only=True)
     schedule_time_input = serializers.TimeField(write_only=True, source="schedule_time")
@@ -37,13 +70,15 @@ class AppointmentSerializer(serializers.ModelSerializer):
             "service",
             "service_name",
             "service_duration",
+            "resource",
+            "resource_name",
             "status",
             "notes",
             "schedule_date",
             "schedule_time_input",
             "schedule_time",
         ]
-        read_only_fields = ["status", "schedule_time"]
+        read_only_fields = ["status", "schedule_time", "resource"]
 
     def validate(self, data):
         schedule_date = data.get("schedule_date")
@@ -97,3 +132,74 @@ class AppointmentSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(str(e)) from e
 
         return appointment
+
+
+MAX_SERIES_OCCURRENCES = 52
+
+
+class SeriesConflictSerializer(serializers.Serializer):
+    date = serializers.DateField()
+    reason = serializers.CharField()
+
+
+class SeriesAppointmentSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Appointment
+        fields = ["id", "schedule_time", "resource", "status"]
+
+
+class AppointmentSeriesSerializer(serializers.ModelSerializer):
+    pet_name = serializers.CharField(source="pet.name", read_only=True)
+    service_name = serializers.CharField(source="service.name", read_only=True)
+    occurrences = serializers.IntegerField(
+        min_value=1, max_value=MAX_SERIES_OCCURRENCES
+    )
+    interval_weeks = serializers.IntegerField(min_value=1, max_value=12, default=1)
+    appointments = SeriesAppointmentSerializer(many=True, read_only=True)
+    conflicts = serializers.SerializerMethodField()
+
+    class Meta:
+        model = AppointmentSeries
+        fields = [
+            "id",
+            "pet",
+            "pet_name",
+            "service",
+            "service_name",
+            "start_date",
+            "time",
+            "interval_weeks",
+            "occurrences",
+            "notes",
+            "created_at",
+            "appointments",
+            "conflicts",
+        ]
+        read_only_fields = ["created_at"]
+
+    def validate_pet(self, pet):
+        user = self.context["request"].user
+        if not user.is_staff and pet.owner.user_id != user.pk:
+            raise serializers.ValidationError("Você só pode agendar para seus pets.")
+        return pet
+
+    def validate_start_date(self, start_date):
+        if start_date < timezone.localdate():
+            raise serializers.ValidationError(
+                "Não é possível agendar serviços para o passado."
+            )
+        return start_date
+
+    @extend_schema_field(SeriesConflictSerializer(many=True))
+    def get_conflicts(self, obj):
+        """Dates skipped when the series was booked; only known on creation."""
+        conflicts = getattr(obj, "booking_conflicts", [])
+        return SeriesConflictSerializer(conflicts, many=True).data
+
+    def create(self, validated_data):
+        with transaction.atomic():
+            series = AppointmentSeries.objects.create(**validated_data)
+            result = AppointmentService.book_series(series)
+
+        series.booking_conflicts = result.conflicts
+        return series
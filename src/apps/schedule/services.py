@@ -1,20 +1,44 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from functools import partial
 from typing import TYPE_CHECKING
 
 import structlog
+from django.db import transaction
+from django.db.models import Count, Max, Q, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
-from .models import Appointment, TimeSlot
+from src.apps.analytics.live import publish_dashboard_event
+from src.apps.analytics.services import AnalyticsService
+
+from .models import Appointment, AppointmentSeries, Resource, TimeSlot
 
 if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
     from src.apps.pets.models import Pet
 
     from .models import Service
 
 logger = structlog.get_logger(__name__)
 
+SLOT_INCREMENT_MINUTES = 15
+
+
+@dataclass
+class SeriesConflict:
+    date: date
+    reason: str
+
+
+@dataclass
+class SeriesBookingResult:
+    created: list[Appointment] = field(default_factory=list)
+    conflicts: list[SeriesConflict] = field(default_factory=list)
+
 
 class AppointmentService:
     @staticmethod
@@ -26,9 +50,13 @@ class AppointmentService:
         schedule_time: datetime,
         status: str,
         notes: str,
+        resource: Resource | None = None,
     ) -> Appointment:
         """
         Applies business logic to an appointment instance without saving it.
+
+        When the service is run by resources, ``resource`` is kept if it is
+        free; otherwise one is assigned through ``find_free_resource``.
         """
         is_new = appointment.pk is None
         time_changed = not is_new and appointment.schedule_time != schedule_time
@@ -42,17 +70,29 @@ class AppointmentService:
                 "Um agendamento futuro não pode ser marcado como 'Concluído'."
             )
 
-        existing_appointments = Appointment.objects.filter(
+        resources = list(service.resources.filter(is_active=True))
+        lanes, pet_has_booking = AppointmentService._load_day_bookings(
+            timezone.localtime(schedule_time).date(),
+            resources=resources,
+            exclude_pk=appointment.pk,
             pet=pet,
-            schedule_time__date=schedule_time.date(),
-        ).exclude(status=Appointment.Status.CANCELED)
-
-        if not is_new:
-            existing_appointments = existing_appointments.exclude(pk=appointment.pk)
+        )
 
-        if existing_appointments.exists():
+        if pet_has_booking:
             raise ValueError("Este pet já possui um agendamento para esta data.")
 
+        if status != Appointment.Status.CANCELED:
+            resource = AppointmentService._assign_resource(
+                resources,
+                lanes,
+                schedule_time,
+                schedule_time + timedelta(minutes=service.duration_minutes),
+                preferred_id=resource.pk if resource else appointment.resource_id,
+            )
+            appointment.resource = resource
+        elif resource is not None:
+            appointment.resource = resource
+
         appointment.pet = pet
         appointment.service = service
         appointment.schedule_time = schedule_time
@@ -61,8 +101,7 @@ class AppointmentService:
 
         is_now_completed = status == Appointment.Status.COMPLETED
         was_already_completed = (
-            not is_new
-            and Appointment.objects.get(pk=appointment.pk).completed_at is not None
+            not is_new and appointment.get_original_value("completed_at") is not None
         )
 
         if is_now_completed and not was_already_completed:
@@ -106,21 +145,12 @@ class AppointmentService:
         else:
             current_time = start_of_day_dt
 
-        existing_appointments = (
-            Appointment.objects.filter(schedule_time__date=schedule_date)
-            .exclude(status=Appointment.Status.CANCELED)
-            .select_related("service")
-            .order_by("schedule_time")
+        lanes, _ = AppointmentService._load_day_bookings(
+            schedule_date, resources=list(service.resources.filter(is_active=True))
         )
 
-        occupied_periods = []
-        for app in existing_appointments:
-            app_start = timezone.localtime(app.schedule_time)
-            app_end = app_start + timedelta(minutes=app.service.duration_minutes)
-            occupied_periods.append((app_start, app_end))
-
         available_slots = []
-        slot_increment = timedelta(minutes=15)
+        slot_increment = timedelta(minutes=SLOT_INCREMENT_MINUTES)
         service_duration = timedelta(minutes=service.duration_minutes)
 
         while current_time + service_duration <= end_of_day_dt:
@@ -130,18 +160,386 @@ class AppointmentService:
             if slot_end > end_of_day_dt:
                 break
 
-            overlap = any(
-                max(slot_start, occ_start) < min(slot_end, occ_end)
-                for occ_start, occ_end in occupied_periods
-            )
-
-            if not overlap:
+            if any(
+                AppointmentService._is_lane_free(periods, slot_start, slot_end)
+                for periods in lanes.values()
+            ):
                 available_slots.append(slot_start)
 
             current_time += slot_increment
 
         return available_slots
 
+    @staticmethod
+    def find_free_resource(
+        service: Service,
+        schedule_time: datetime,
+        exclude_pk: int | None = None,
+    ) -> Resource | None:
+        """
+        Picks the resource that should take a booking for ``service`` at
+        ``schedule_time``.
+
+        Returns None when the service has no resources (the shared single
+        agenda applies) and raises ValueError when no resource is free.
+        """
+        resources = list(service.resources.filter(is_active=True))
+        lanes, _ = AppointmentService._load_day_bookings(
+            timezone.localtime(schedule_time).date(),
+            resources=resources,
+            exclude_pk=exclude_pk,
+        )
+        return AppointmentService._assign_resource(
+            resources,
+            lanes,
+            schedule_time,
+            schedule_time + timedelta(minutes=service.duration_minutes),
+        )
+
+    @staticmethod
+    def book_series(series: AppointmentSeries) -> SeriesBookingResult:
+        """
+        Materializes every occurrence of ``series`` in one pass.
+
+        Working hours and existing bookings for the whole span are loaded
+        with one query each, occurrences are checked in memory against the
+        same rules as a single booking, and the free ones are inserted with
+        ``bulk_create``. Occurrences that cannot be booked are reported as
+        conflicts instead of aborting the series.
+        """
+        service = series.service
+        duration = timedelta(minutes=service.duration_minutes)
+        dates = [
+            series.start_date + timedelta(weeks=series.interval_weeks * i)
+            for i in range(series.occurrences)
+        ]
+
+        working_hours: dict[int, tuple[time, time]] = {}
+        for slot in TimeSlot.objects.filter(
+            day_of_week__in={d.weekday() for d in dates}
+        ):
+            current = working_hours.get(slot.day_of_week)
+            working_hours[slot.day_of_week] = (
+                min(current[0], slot.start_time) if current else slot.start_time,
+                min(current[1], slot.end_time) if current else slot.end_time,
+            )
+
+        resources = list(service.resources.filter(is_active=True))
+        lanes_by_date, pet_dates = AppointmentService._load_bookings(
+            dates[0], dates[-1], resources=resources, pet=series.pet
+        )
+
+        now = timezone.now()
+        result = SeriesBookingResult()
+        for occurrence_date in dates:
+            start = timezone.make_aware(datetime.combine(occurrence_date, series.time))
+            end = start + duration
+
+            hours = working_hours.get(occurrence_date.weekday())
+            if hours is None:
+                reason = "Não há expediente neste dia."
+            elif not AppointmentService._fits_working_hours(
+                occurrence_date, hours, start, end
+            ):
+                reason = "O horário está fora do expediente deste dia."
+            elif start < now:
+                reason = "Não é possível agendar serviços para o passado."
+            elif occurrence_date in pet_dates:
+                reason = "Este pet já possui um agendamento para esta data."
+            else:
+                lanes = lanes_by_date.setdefault(
+                    occurrence_date, AppointmentService._empty_lanes(resources)
+                )
+                try:
+                    resource = AppointmentService._assign_resource(
+                        resources, lanes, start, end
+                    )
+                except ValueError as e:
+                    reason = str(e)
+                else:
+                    lanes[resource.pk if resource else None].append((start, end))
+                    pet_dates.add(occurrence_date)
+                    result.created.append(
+                        Appointment(
+                            pet=series.pet,
+                            service=service,
+                            resource=resource,
+                            series=series,
+                            schedule_time=start,
+                            notes=series.notes,
+                        )
+                    )
+                    continue
+            result.conflicts.append(SeriesConflict(date=occurrence_date, reason=reason))
+
+        with transaction.atomic():
+            result.created = Appointment.objects.bulk_create(result.created)
+
+        logger.info(
+            "appointment_series_booked",
+            series_id=series.pk,
+            created=len(result.created),
+            conflicts=len(result.conflicts),
+        )
+        return result
+
+    @staticmethod
+    def _fits_working_hours(
+        schedule_date: date,
+        hours: tuple[time, time],
+        slot_start: datetime,
+        slot_end: datetime,
+    ) -> bool:
+        """
+        Whether [slot_start, slot_end) is one of the slots ``get_available_slots``
+        would offer inside ``hours`` on ``schedule_date``.
+        """
+        day_start = timezone.make_aware(datetime.combine(schedule_date, hours[0]))
+        day_end = timezone.make_aware(datetime.combine(schedule_date, hours[1]))
+        offset = slot_start - day_start
+        return (
+            day_start <= slot_start
+            and slot_end <= day_end
+            and offset % timedelta(minutes=SLOT_INCREMENT_MINUTES) == timedelta(0)
+        )
+
+    @staticmethod
+    def _assign_resource(
+        resources: list[Resource],
+        lanes: dict[int | None, list[tuple[datetime, datetime]]],
+        slot_start: datetime,
+        slot_end: datetime,
+        preferred_id: int | None = None,
+    ) -> Resource | None:
+        """
+        Chooses a free lane for [slot_start, slot_end).
+
+        ``preferred_id`` is kept when that resource is still free. Otherwise
+        free resources are packed best-fit: the one whose previous booking
+        ends closest to the requested start wins, so idle gaps stay
+        concentrated on the other resources and longer services still fit.
+        """
+        if not resources:
+            if not AppointmentService._is_lane_free(lanes[None], slot_start, slot_end):
+                raise ValueError("Este horário já está ocupado por outro agendamento.")
+            return None
+
+        by_id = {r.pk: r for r in resources}
+        if preferred_id in by_id and AppointmentService._is_lane_free(
+            lanes[preferred_id], slot_start, slot_end
+        ):
+            return by_id[preferred_id]
+
+        best_resource = None
+        best_gap = None
+        for resource in resources:
+            periods = lanes[resource.pk]
+            if not AppointmentService._is_lane_free(periods, slot_start, slot_end):
+                continue
+            previous_ends = [end for _, end in periods if end <= slot_start]
+            gap = slot_start - max(previous_ends) if previous_ends else None
+            if best_resource is None or (
+                gap is not None and (best_gap is None or gap < best_gap)
+            ):
+                best_resource = resource
+                best_gap = gap
+
+        if best_resource is None:
+            raise ValueError("Todos os profissionais estão ocupados neste horário.")
+
+        return best_resource
+
+    @staticmethod
+    def _load_day_bookings(
+        schedule_date: date,
+        *,
+        resources: list[Resource],
+        exclude_pk: int | None = None,
+        pet: Pet | None = None,
+    ) -> tuple[dict[int | None, list[tuple[datetime, datetime]]], bool]:
+        """
+        Loads the occupied periods of every lane in ``resources`` on
+        ``schedule_date`` and whether ``pet`` already has a booking that day.
+        """
+        lanes_by_date, pet_dates = AppointmentService._load_bookings(
+            schedule_date,
+            schedule_date,
+            resources=resources,
+            exclude_pk=exclude_pk,
+            pet=pet,
+        )
+        return (
+            lanes_by_date.get(schedule_date)
+            or AppointmentService._empty_lanes(resources),
+            schedule_date in pet_dates,
+        )
+
+    @staticmethod
+    def _load_bookings(
+        first_date: date,
+        last_date: date,
+        *,
+        resources: list[Resource],
+        exclude_pk: int | None = None,
+        pet: Pet | None = None,
+    ) -> tuple[
+        dict[date, dict[int | None, list[tuple[datetime, datetime]]]], set[date]
+    ]:
+        """
+        Loads, with a single range query, the occupied periods per local date
+        of every lane in ``resources`` between ``first_date`` and
+        ``last_date`` (inclusive), plus the dates on which ``pet`` is booked.
+
+        A lane is one active resource. An empty ``resources`` list means the
+        legacy single lane (keyed by None), made of every appointment that
+        has no resource.
+        """
+        lane_ids = list(AppointmentService._empty_lanes(resources))
+        lane_filter = (
+            Q(resource_id__in=lane_ids) if resources else Q(resource__isnull=True)
+        )
+        if pet is not None:
+            lane_filter |= Q(pet=pet)
+
+        range_start = timezone.make_aware(datetime.combine(first_date, time.min))
+        range_end = timezone.make_aware(
+            datetime.combine(last_date + timedelta(days=1), time.min)
+        )
+        bookings = (
+            Appointment.objects.filter(
+                lane_filter,
+                schedule_time__gte=range_start,
+                schedule_time__lt=range_end,
+            )
+            .exclude(status=Appointment.Status.CANCELED)
+            .order_by("schedule_time")
+            .values_list(
+                "schedule_time", "service__duration_minutes", "resource_id", "pet_id"
+            )
+        )
+        if exclude_pk is not None:
+            bookings = bookings.exclude(pk=exclude_pk)
+
+        lanes_by_date: dict[
+            date, dict[int | None, list[tuple[datetime, datetime]]]
+        ] = {}
+        pet_dates: set[date] = set()
+        for start, duration, resource_id, pet_id in bookings:
+            app_start = timezone.localtime(start)
+            if pet is not None and pet_id == pet.pk:
+                pet_dates.add(app_start.date())
+            if resource_id in lane_ids:
+                lanes = lanes_by_date.setdefault(
+                    app_start.date(), AppointmentService._empty_lanes(resources)
+                )
+                app_end = app_start + timedelta(minutes=duration)
+                lanes[resource_id].append((app_start, app_end))
+
+        return lanes_by_date, pet_dates
+
+    @staticmethod
+    def _empty_lanes(
+        resources: list[Resource],
+    ) -> dict[int | None, list[tuple[datetime, datetime]]]:
+        return {r.pk: [] for r in resources} if resources else {None: []}
+
+    @staticmethod
+    def _is_lane_free(
+        periods: list[tuple[datetime, datetime]],
+        slot_start: datetime,
+        slot_end: datetime,
+    ) -> bool:
+        return not any(
+            max(slot_start, occ_start) < min(slot_end, occ_end)
+            for occ_start, occ_end in periods
+        )
+
+    @staticmethod
+    def get_calendar_version(
+        queryset: QuerySet[Appointment], start: datetime, end: datetime
+    ) -> tuple[int, datetime | None]:
+        """
+        Returns (row count, last modification) for the calendar window.
+
+        Both values come from one aggregate over the schedule_time index and
+        change whenever a row in the window is added, edited or removed, so
+        they are enough to answer conditional GETs without loading rows.
+        """
+        version = queryset.filter(
+            schedule_time__gte=start, schedule_time__lt=end
+        ).aggregate(total=Count("id"), last_modified=Max("updated_at"))
+        return version["total"], version["last_modified"]
+
+    @staticmethod
+    def get_calendar_rows(
+        queryset: QuerySet[Appointment], start: datetime, end: datetime
+    ) -> list[dict]:
+        """
+        Returns the compact calendar rows for appointments starting in
+        [start, end), built with values() instead of model instances.
+        """
+        rows = (
+            queryset.filter(schedule_time__gte=start, schedule_time__lt=end)
+            .order_by("schedule_time")
+            .values(
+                "id",
+                "schedule_time",
+                "service__duration_minutes",
+                "pet__name",
+                "service__name",
+                "status",
+            )
+        )
+        return [
+            {
+                "id": row["id"],
+                "start": timezone.localtime(row["schedule_time"]),
+                "duration": row["service__duration_minutes"],
+                "pet": row["pet__name"],
+                "service": row["service__name"],
+                "status": row["status"],
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def bulk_update_status(queryset: QuerySet[Appointment], status: str) -> int:
+        """
+        Moves every appointment in ``queryset`` to ``status`` with a single
+        UPDATE, applying the same completed_at rules as
+        ``prepare_appointment_instance``.
+
+        COMPLETED only applies to appointments that already started and were
+        not canceled; completed_at is stamped for the ones not yet completed
+        and kept for the rest. Any other status clears completed_at.
+
+        Returns the number of updated appointments.
+        """
+        if status not in Appointment.Status.values:
+            raise ValueError(f"Status inválido: {status}")
+
+        now = timezone.now()
+        updates: dict = {"status": status, "updated_at": now}
+
+        if status == Appointment.Status.COMPLETED:
+            queryset = queryset.filter(schedule_time__lte=now).exclude(
+                status=Appointment.Status.CANCELED
+            )
+            updates["completed_at"] = Coalesce("completed_at", Value(now))
+        else:
+            updates["completed_at"] = None
+
+        # .update() skips post_save, so analytics is notified here; open
+        # dashboards refetch the touched days instead of applying deltas.
+        dates = list(queryset.dates("schedule_time", "day"))
+        AnalyticsService.mark_days_changed(*dates)
+        transaction.on_commit(
+            partial(publish_dashboard_event, {"type": "refresh", "dates": dates})
+        )
+        updated = queryset.update(**updates)
+        logger.info("appointments_bulk_status_updated", status=status, count=updated)
+        return updated
+
     @staticmethod
     def cancel_appointment(appointment: Appointment, user) -> Appointment:
         """
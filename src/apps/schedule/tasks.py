@@ -1,13 +1,17 @@
 from datetime import timedelta
+from itertools import islice
 
+import structlog
 from celery import shared_task
 from django.conf import settings
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection, send_mail
 from django.db.models import Sum
 from django.utils import timezone
 
 from .models import Appointment
 
+logger = structlog.get_logger(__name__)
+
 
 @shared_task
 def generate_daily_appointments_report() -> str:
@@ -65,3 +69,59 @@ def generate_daily_appointments_report() -> str:
     )
 
     return f"Relatório de agendamentos concluídos para {yesterday.strftime('%d/%m/%Y')} enviado com sucesso."
+
+
+@shared_task
+def send_appointment_reminders(hours_ahead: int = 24, chunk_size: int = 200) -> str:
+    """
+    Emails a reminder for every open appointment starting in the next
+    ``hours_ahead`` hours that has not been reminded yet.
+
+    Appointments are streamed in chunks; each chunk goes out through a single
+    mail connection and is then stamped with ``reminder_sent_at`` so reruns
+    skip it.
+    """
+    now = timezone.now()
+    appointments = (
+        Appointment.objects.filter(
+            schedule_time__gte=now,
+            schedule_time__lt=now + timedelta(hours=hours_ahead),
+            status__in=[Appointment.Status.PENDING, Appointment.Status.CONFIRMED],
+            reminder_sent_at__isnull=True,
+        )
+        .exclude(pet__owner__user__email="")
+        .select_related("pet__owner__user", "service")
+        .order_by("schedule_time")
+        .iterator(chunk_size=chunk_size)
+    )
+
+    sent = 0
+    while chunk := list(islice(appointments, chunk_size)):
+        messages = [_build_reminder_message(app) for app in chunk]
+        with get_connection() as connection:
+            connection.send_messages(messages)
+
+        Appointment.objects.filter(pk__in=[app.pk for app in chunk]).update(
+            reminder_sent_at=timezone.now()
+        )
+        sent += len(chunk)
+
+    logger.info("appointment_reminders_sent", sent=sent, hours_ahead=hours_ahead)
+    return f"{sent} lembretes de agendamento enviados."
+
+
+def _build_reminder_message(appointment: Appointment) -> EmailMessage:
+    owner = appointment.pet.owner
+    scheduled_for = timezone.localtime(appointment.schedule_time)
+    tutor_name = owner.full_name or owner.user.username
+
+    subject = f"Lembrete: {appointment.service.name} para {appointment.pet.name}"
+    message = (
+        f"Olá, {tutor_name}!\n\n"
+        f"Lembramos que {appointment.pet.name} tem {appointment.service.name} "
+        f"agendado para {scheduled_for.strftime('%d/%m/%Y às %H:%M')}.\n\n"
+        "Caso não possa comparecer, cancele o agendamento pelo aplicativo."
+    )
+    return EmailMessage(
+        subject, message, settings.DEFAULT_FROM_EMAIL, [owner.user.email]
+    )
@@ -1,4 +1,4 @@
-from datetime import timedelta
+from datetime import time, timedelta
 
 import pytest
 from django.urls import reverse
@@ -9,7 +9,12 @@ from src.apps.pets.tests.factories import PetFactory
 from src.apps.schedule.models import Appointment
 from src.apps.schedule.services import AppointmentService
 
-from .factories import AppointmentFactory, ServiceFactory, TimeSlotFactory
+from .factories import (
+    AppointmentFactory,
+    AppointmentSeriesFactory,
+    ServiceFactory,
+    TimeSlotFactory,
+)
 
 
 @pytest.mark.django_db
@@ -165,3 +170,197 @@ class TestAppointmentAPI:
         assert response.data["status"] == "CANCELED"
         appointment.refresh_from_db()
         assert appointment.status == Appointment.Status.CANCELED
+
+
+@pytest.mark.django_db
+class TestAppointmentCalendarAPI:
+    def setup_method(self):
+        self.url = reverse("schedule:appointment-calendar")
+        self.start = timezone.now().date() + timedelta(days=7)
+        self.end = self.start + timedelta(days=7)
+
+    def _params(self):
+        return {"start": self.start.isoformat(), "end": self.end.isoformat()}
+
+    def _at(self, day_offset):
+        return timezone.make_aware(
+            timezone.datetime.combine(
+                self.start + timedelta(days=day_offset), timezone.datetime.min.time()
+            )
+            + timedelta(hours=10)
+        )
+
+    def test_returns_only_rows_in_range_with_compact_shape(self, authenticated_client):
+        client, _ = authenticated_client
+        inside = AppointmentFactory(schedule_time=self._at(1))
+        AppointmentFactory(schedule_time=self._at(-2))
+        AppointmentFactory(schedule_time=self._at(8))
+
+        response = client.get(self.url, self._params())
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row["id"] for row in response.json()] == [inside.id]
+        assert set(response.json()[0]) == {
+            "id",
+            "start",
+            "duration",
+            "pet",
+            "service",
+            "status",
+        }
+
+    def test_regular_user_only_sees_own_appointments(self, regular_user_client):
+        client, user = regular_user_client
+        mine = AppointmentFactory(
+            pet=PetFactory(owner__user=user), schedule_time=self._at(1)
+        )
+        AppointmentFactory(schedule_time=self._at(2))
+
+        response = client.get(self.url, self._params())
+
+        assert [row["id"] for row in response.json()] == [mine.id]
+
+    def test_conditional_get_returns_not_modified(self, authenticated_client):
+        client, _ = authenticated_client
+        AppointmentFactory(schedule_time=self._at(1))
+
+        first = client.get(self.url, self._params())
+        second = client.get(self.url, self._params(), HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_etag_changes_when_window_changes(self, authenticated_client):
+        client, _ = authenticated_client
+        AppointmentFactory(schedule_time=self._at(1))
+        first = client.get(self.url, self._params())
+
+        AppointmentFactory(schedule_time=self._at(2))
+        second = client.get(self.url, self._params(), HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert second.status_code == status.HTTP_200_OK
+        assert len(second.json()) == 2
+
+    def test_missing_or_invalid_range_fails(self, authenticated_client):
+        client, _ = authenticated_client
+        assert client.get(self.url).status_code == status.HTTP_400_BAD_REQUEST
+        assert (
+            client.get(self.url, {"start": "x", "end": "y"}).status_code
+            == status.HTTP_400_BAD_REQUEST
+        )
+        assert (
+            client.get(
+                self.url, {"start": self.end.isoformat(), "end": self.start.isoformat()}
+            ).status_code
+            == status.HTTP_400_BAD_REQUEST
+        )
+
+
+@pytest.mark.django_db
+class TestAppointmentBulkStatusAPI:
+    def setup_method(self):
+        self.url = reverse("schedule:appointment-bulk-status")
+
+    def test_staff_can_complete_a_whole_day(self, authenticated_client):
+        client, _ = authenticated_client
+        past = timezone.localtime() - timedelta(days=1)
+        past = past.replace(hour=10, minute=30)
+        appointments = [
+            AppointmentFactory(
+                schedule_time=past - timedelta(minutes=i),
+                status=Appointment.Status.CONFIRMED,
+            )
+            for i in range(3)
+        ]
+
+        response = client.post(
+            self.url,
+            {
+                "status": "COMPLETED",
+                "date": timezone.localtime(past).date().isoformat(),
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated"] == 3
+        for appointment in appointments:
+            appointment.refresh_from_db()
+            assert appointment.completed_at is not None
+
+    def test_requires_date_or_ids(self, authenticated_client):
+        client, _ = authenticated_client
+        response = client.post(self.url, {"status": "COMPLETED"}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_regular_user_is_forbidden(self, regular_user_client):
+        client, _ = regular_user_client
+        response = client.post(
+            self.url, {"status": "COMPLETED", "ids": [1]}, format="json"
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestAppointmentSeriesAPI:
+    def setup_method(self):
+        self.url = reverse("schedule:appointment-series-list")
+        self.start_date = timezone.localdate() + timedelta(days=7)
+        self.service = ServiceFactory(duration_minutes=60)
+        TimeSlotFactory(
+            day_of_week=self.start_date.weekday(),
+            start_time="09:00",
+            end_time="17:00",
+        )
+
+    def _payload(self, pet, **overrides):
+        return {
+            "pet": pet.id,
+            "service": self.service.id,
+            "start_date": self.start_date.isoformat(),
+            "time": "10:00",
+            "occurrences": 4,
+            **overrides,
+        }
+
+    def test_user_books_series_and_sees_conflicts(self, regular_user_client):
+        client, user = regular_user_client
+        pet = PetFactory(owner__user=user)
+        busy_day = self.start_date + timedelta(weeks=2)
+        AppointmentFactory(
+            service=self.service,
+            schedule_time=timezone.make_aware(
+                timezone.datetime.combine(busy_day, time(10, 0))
+            ),
+            status=Appointment.Status.CONFIRMED,
+        )
+
+        response = client.post(self.url, data=self._payload(pet), format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.data["appointments"]) == 3
+        assert response.data["conflicts"][0]["date"] == busy_day.isoformat()
+        assert Appointment.objects.filter(pet=pet).count() == 3
+
+    def test_user_cannot_book_series_for_another_users_pet(self, regular_user_client):
+        client, _ = regular_user_client
+        response = client.post(
+            self.url, data=self._payload(PetFactory()), format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "pet" in response.data
+
+    def test_occurrences_are_bounded(self, regular_user_client):
+        client, user = regular_user_client
+        pet = PetFactory(owner__user=user)
+        response = client.post(
+            self.url, data=self._payload(pet, occurrences=500), format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_user_lists_only_own_series(self, regular_user_client):
+        client, user = regular_user_client
+        AppointmentSeriesFactory(pet=PetFactory(owner__user=user))
+        AppointmentSeriesFactory()
+        response = client.get(self.url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 1
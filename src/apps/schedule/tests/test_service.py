@@ -4,10 +4,13 @@ from unittest.mock import patch
 import pytest
 from django.utils import timezone
 
+from src.apps.pets.tests.factories import PetFactory
 from src.apps.schedule.models import Appointment
 from src.apps.schedule.services import AppointmentService
 from src.apps.schedule.tests.factories import (
     AppointmentFactory,
+    AppointmentSeriesFactory,
+    ResourceFactory,
     ServiceFactory,
     TimeSlotFactory,
 )
@@ -160,3 +163,310 @@ class TestAvailableSlotsService:
             appointment, user=MockAdmin()
         )
         assert canceled_appt.status == Appointment.Status.CANCELED
+
+
+@pytest.mark.django_db
+class TestResourceScheduling:
+    def setup_method(self):
+        self.test_date = date(2025, 8, 18)
+        self.service = ServiceFactory(name="Banho e Tosa", duration_minutes=60)
+        self.table_1 = ResourceFactory(name="Mesa 1", services=[self.service])
+        self.table_2 = ResourceFactory(name="Mesa 2", services=[self.service])
+        TimeSlotFactory(day_of_week=0, start_time=time(8, 0), end_time=time(12, 0))
+
+        mock_now_yesterday = timezone.make_aware(timezone.datetime(2025, 8, 17, 10, 0))
+        self.patcher = patch(
+            "django.utils.timezone.now", return_value=mock_now_yesterday
+        )
+        self.patcher.start()
+
+    def teardown_method(self):
+        self.patcher.stop()
+
+    def _at(self, hour, minute=0):
+        return timezone.make_aware(
+            timezone.datetime.combine(self.test_date, time(hour, minute))
+        )
+
+    def test_slot_stays_open_while_a_resource_is_free(self):
+        AppointmentFactory(
+            service=self.service,
+            resource=self.table_1,
+            schedule_time=self._at(9),
+            status=Appointment.Status.CONFIRMED,
+        )
+        slots = AppointmentService.get_available_slots(self.test_date, self.service)
+        assert self._at(9) in slots
+
+    def test_slot_closes_when_all_resources_are_busy(self):
+        for resource in (self.table_1, self.table_2):
+            AppointmentFactory(
+                service=self.service,
+                resource=resource,
+                schedule_time=self._at(9),
+                status=Appointment.Status.CONFIRMED,
+            )
+        slots = AppointmentService.get_available_slots(self.test_date, self.service)
+        assert self._at(9) not in slots
+        assert self._at(8, 30) not in slots
+        assert self._at(10) in slots
+
+    def test_resourceless_appointments_do_not_block_resources(self):
+        AppointmentFactory(
+            service=ServiceFactory(name="Vacinação", duration_minutes=60),
+            schedule_time=self._at(9),
+            status=Appointment.Status.CONFIRMED,
+        )
+        slots = AppointmentService.get_available_slots(self.test_date, self.service)
+        assert self._at(9) in slots
+
+    def test_find_free_resource_packs_after_previous_booking(self):
+        AppointmentFactory(
+            service=self.service,
+            resource=self.table_2,
+            schedule_time=self._at(8),
+            status=Appointment.Status.CONFIRMED,
+        )
+        resource = AppointmentService.find_free_resource(self.service, self._at(9))
+        assert resource == self.table_2
+
+    def test_find_free_resource_raises_when_all_busy(self):
+        for resource in (self.table_1, self.table_2):
+            AppointmentFactory(
+                service=self.service,
+                resource=resource,
+                schedule_time=self._at(9),
+                status=Appointment.Status.CONFIRMED,
+            )
+        with pytest.raises(ValueError):
+            AppointmentService.find_free_resource(self.service, self._at(9, 30))
+
+    def test_find_free_resource_without_resources_returns_none(self):
+        service = ServiceFactory(name="Vacinação", duration_minutes=30)
+        assert AppointmentService.find_free_resource(service, self._at(9)) is None
+
+    def test_prepare_appointment_assigns_resource(self):
+        AppointmentFactory(
+            service=self.service,
+            resource=self.table_1,
+            schedule_time=self._at(9),
+            status=Appointment.Status.CONFIRMED,
+        )
+        instance = AppointmentService.prepare_appointment_instance(
+            appointment=Appointment(),
+            pet=PetFactory(),
+            service=self.service,
+            schedule_time=self._at(9),
+            status=Appointment.Status.PENDING,
+            notes="",
+        )
+        assert instance.resource == self.table_2
+        instance.save()
+
+
+@pytest.mark.django_db
+class TestAppointmentStatusTransitions:
+    def test_prepare_uses_loaded_values_without_refetch(
+        self, django_assert_num_queries
+    ):
+        appointment = AppointmentFactory(
+            schedule_time=timezone.now() - timedelta(hours=1),
+            status=Appointment.Status.CONFIRMED,
+            completed_at=None,
+        )
+        appointment = Appointment.objects.select_related("pet", "service").get(
+            pk=appointment.pk
+        )
+
+        # One query for the service resources, one for the day's bookings.
+        with django_assert_num_queries(2):
+            AppointmentService.prepare_appointment_instance(
+                appointment=appointment,
+                pet=appointment.pet,
+                service=appointment.service,
+                schedule_time=appointment.schedule_time,
+                status=Appointment.Status.COMPLETED,
+                notes="",
+            )
+
+        assert appointment.completed_at is not None
+
+    def test_prepare_rejects_second_booking_for_pet_on_same_day(self):
+        first = AppointmentFactory(
+            schedule_time=timezone.now() + timedelta(days=2),
+            status=Appointment.Status.CONFIRMED,
+        )
+        with pytest.raises(ValueError, match="Este pet já possui"):
+            AppointmentService.prepare_appointment_instance(
+                appointment=Appointment(),
+                pet=first.pet,
+                service=ServiceFactory(name="Vacinação"),
+                schedule_time=first.schedule_time + timedelta(hours=3),
+                status=Appointment.Status.PENDING,
+                notes="",
+            )
+
+    def test_bulk_complete_stamps_only_started_and_not_canceled(self):
+        past = timezone.now() - timedelta(hours=2)
+        done_at = timezone.now() - timedelta(hours=1)
+        pending = AppointmentFactory(
+            schedule_time=past, status=Appointment.Status.PENDING, completed_at=None
+        )
+        already_done = AppointmentFactory(
+            schedule_time=past - timedelta(minutes=30),
+            status=Appointment.Status.COMPLETED,
+            completed_at=done_at,
+        )
+        canceled = AppointmentFactory(
+            schedule_time=past - timedelta(minutes=60),
+            status=Appointment.Status.CANCELED,
+        )
+        future = AppointmentFactory(
+            schedule_time=timezone.now() + timedelta(hours=3),
+            status=Appointment.Status.CONFIRMED,
+        )
+
+        updated = AppointmentService.bulk_update_status(
+            Appointment.objects.all(), Appointment.Status.COMPLETED
+        )
+
+        assert updated == 2
+        for appointment in (pending, already_done, canceled, future):
+            appointment.refresh_from_db()
+        assert pending.status == Appointment.Status.COMPLETED
+        assert pending.completed_at is not None
+        assert already_done.completed_at == done_at
+        assert canceled.status == Appointment.Status.CANCELED
+        assert future.status == Appointment.Status.CONFIRMED
+
+    def test_bulk_reopen_clears_completed_at(self):
+        appointment = AppointmentFactory(
+            schedule_time=timezone.now() - timedelta(hours=2),
+            status=Appointment.Status.COMPLETED,
+            completed_at=timezone.now(),
+        )
+
+        AppointmentService.bulk_update_status(
+            Appointment.objects.filter(pk=appointment.pk),
+            Appointment.Status.CONFIRMED,
+        )
+
+        appointment.refresh_from_db()
+        assert appointment.status == Appointment.Status.CONFIRMED
+        assert appointment.completed_at is None
+
+    def test_bulk_update_rejects_unknown_status(self):
+        with pytest.raises(ValueError):
+            AppointmentService.bulk_update_status(Appointment.objects.all(), "NOPE")
+
+
+@pytest.mark.django_db
+class TestAppointmentSeriesBooking:
+    def setup_method(self):
+        self.start_date = date(2025, 8, 18)
+        self.service = ServiceFactory(duration_minutes=60)
+        TimeSlotFactory(day_of_week=0, start_time=time(8, 0), end_time=time(12, 0))
+
+        mock_now = timezone.make_aware(timezone.datetime(2025, 8, 17, 10, 0))
+        self.patcher = patch("django.utils.timezone.now", return_value=mock_now)
+        self.patcher.start()
+
+    def teardown_method(self):
+        self.patcher.stop()
+
+    def _at(self, day, hour):
+        return timezone.make_aware(timezone.datetime.combine(day, time(hour, 0)))
+
+    def test_books_every_free_occurrence(self):
+        series = AppointmentSeriesFactory(
+            service=self.service,
+            start_date=self.start_date,
+            time=time(9, 0),
+            occurrences=26,
+        )
+
+        result = AppointmentService.book_series(series)
+
+        assert len(result.created) == 26
+        assert result.conflicts == []
+        times = list(
+            series.appointments.order_by("schedule_time").values_list(
+                "schedule_time", flat=True
+            )
+        )
+        assert times[0] == self._at(self.start_date, 9)
+        assert times[-1] == self._at(self.start_date + timedelta(weeks=25), 9)
+
+    def test_reports_conflicting_dates_and_books_the_rest(self):
+        busy_day = self.start_date + timedelta(weeks=1)
+        pet_day = self.start_date + timedelta(weeks=2)
+        AppointmentFactory(
+            service=self.service,
+            schedule_time=self._at(busy_day, 9),
+            status=Appointment.Status.CONFIRMED,
+        )
+        series = AppointmentSeriesFactory(
+            service=self.service,
+            start_date=self.start_date,
+            time=time(9, 0),
+            occurrences=4,
+        )
+        AppointmentFactory(
+            pet=series.pet,
+            service=ServiceFactory(name="Vacinação"),
+            schedule_time=self._at(pet_day, 11),
+            status=Appointment.Status.PENDING,
+        )
+
+        result = AppointmentService.book_series(series)
+
+        assert [c.date for c in result.conflicts] == [busy_day, pet_day]
+        assert len(result.created) == 2
+        assert series.appointments.count() == 2
+
+    def test_occurrences_outside_working_hours_conflict(self):
+        series = AppointmentSeriesFactory(
+            service=self.service,
+            start_date=self.start_date,
+            time=time(11, 30),
+            interval_weeks=1,
+            occurrences=2,
+        )
+
+        result = AppointmentService.book_series(series)
+
+        assert result.created == []
+        assert len(result.conflicts) == 2
+
+    def test_series_is_spread_across_resources(self):
+        first, second = ResourceFactory.create_batch(2, services=[self.service])
+        AppointmentFactory(
+            service=self.service,
+            resource=first,
+            schedule_time=self._at(self.start_date, 9),
+            status=Appointment.Status.CONFIRMED,
+        )
+        series = AppointmentSeriesFactory(
+            service=self.service,
+            start_date=self.start_date,
+            time=time(9, 0),
+            occurrences=2,
+        )
+
+        result = AppointmentService.book_series(series)
+
+        assert result.conflicts == []
+        assert result.created[0].resource == second
+
+    def test_query_count_does_not_grow_with_occurrences(
+        self, django_assert_max_num_queries
+    ):
+        series = AppointmentSeriesFactory(
+            service=self.service,
+            start_date=self.start_date,
+            time=time(8, 0),
+            occurrences=26,
+        )
+
+        with django_assert_max_num_queries(6):
+            AppointmentService.book_series(series)
@@ -1,8 +1,13 @@
 import pytest
+from django.core import mail
 from django.utils import timezone
 
+from src.apps.schedule import tasks
 from src.apps.schedule.models import Appointment
-from src.apps.schedule.tasks import generate_daily_appointments_report
+from src.apps.schedule.tasks import (
+    generate_daily_appointments_report,
+    send_appointment_reminders,
+)
 from src.apps.schedule.tests.factories import AppointmentFactory
 
 
@@ -73,3 +78,43 @@ def test_generate_daily_report_with_no_completed_appointments(mocker):
         result
         == f"Relatório de agendamentos concluídos para {yesterday_date.strftime('%d/%m/%Y')} enviado com sucesso."
     )
+
+
+@pytest.mark.django_db
+def test_send_appointment_reminders_batches_and_does_not_resend(mocker):
+    now = timezone.now()
+    upcoming = [
+        AppointmentFactory(
+            schedule_time=now + timezone.timedelta(hours=hours),
+            status=Appointment.Status.CONFIRMED,
+        )
+        for hours in (1, 2, 3)
+    ]
+    AppointmentFactory(
+        schedule_time=now + timezone.timedelta(hours=4),
+        status=Appointment.Status.CANCELED,
+    )
+    AppointmentFactory(
+        schedule_time=now + timezone.timedelta(hours=5),
+        status=Appointment.Status.PENDING,
+        reminder_sent_at=now,
+    )
+    AppointmentFactory(
+        schedule_time=now + timezone.timedelta(days=3),
+        status=Appointment.Status.PENDING,
+    )
+    get_connection_spy = mocker.spy(tasks, "get_connection")
+
+    result = send_appointment_reminders(hours_ahead=24, chunk_size=2)
+
+    assert result == "3 lembretes de agendamento enviados."
+    assert get_connection_spy.call_count == 2
+    assert len(mail.outbox) == 3
+    assert mail.outbox[0].to == [upcoming[0].pet.owner.user.email]
+    assert upcoming[0].pet.name in mail.outbox[0].body
+    assert not Appointment.objects.filter(
+        pk__in=[app.pk for app in upcoming], reminder_sent_at__isnull=True
+    ).exists()
+
+    assert send_appointment_reminders() == "0 lembretes de agendamento enviados."
+    assert len(mail.outbox) == 3
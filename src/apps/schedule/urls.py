@@ -2,6 +2,7 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from .views import (
+    AppointmentSeriesViewSet,
     AppointmentViewSet,
     AvailableSlotsView,
     ServiceViewSet,
@@ -14,6 +15,9 @@ router = DefaultRouter()
 router.register(r"services", ServiceViewSet, basename="service")
 router.register(r"time-slots", TimeSlotViewSet, basename="timeslot")
 router.register(r"appointments", AppointmentViewSet, basename="appointment")
+router.register(
+    r"appointment-series", AppointmentSeriesViewSet, basename="appointment-series"
+)
 
 urlpatterns = [
     path("", include(router.urls)),
@@ -1,7 +1,11 @@
 import zoneinfo
-from datetime import date
+from datetime import date, datetime, time, timedelta
 
 import structlog
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.http import http_date, quote_etag
 from drf_spectacular.utils import (
     OpenApiExample,
     OpenApiParameter,
@@ -16,9 +20,12 @@ from rest_framework.views import APIView
 from src.apps.core.views import AutoSchemaModelNameMixin
 from src.petcare.permissions import IsOwnerOrStaff, IsStaffOrReadOnly
 
-from .models import Appointment, Service, TimeSlot
+from .models import Appointment, AppointmentSeries, Service, TimeSlot
 from .serializers import (
+    AppointmentBulkStatusSerializer,
+    AppointmentCalendarRowSerializer,
     AppointmentSerializer,
+    AppointmentSeriesSerializer,
     ServiceSerializer,
     TimeSlotSerializer,
 )
@@ -26,6 +33,23 @@ from .services import AppointmentService
 
 logger = structlog.get_logger(__name__)
 
+CALENDAR_MAX_RANGE_DAYS = 93
+
+
+def _parse_calendar_bound(value: str | None) -> datetime | None:
+    """Parses an ISO date or datetime query param into an aware datetime."""
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        parsed_date = parse_date(value)
+        if parsed_date is None:
+            raise ValueError(value)
+        parsed = datetime.combine(parsed_date, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
 
 @extend_schema(
     tags=["Schedule - Slots"],
@@ -170,6 +194,120 @@ class AppointmentViewSet(AutoSchemaModelNameMixin, viewsets.ModelViewSet):
         )
         instance.delete()
 
+    @extend_schema(
+        summary="Calendar feed for a date range",
+        description=(
+            "Returns compact appointment rows starting in [start, end). "
+            "Supports conditional GET through ETag and Last-Modified."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="start",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                required=True,
+                description="Start of the window (ISO date or datetime, inclusive).",
+                examples=[OpenApiExample("Example", value="2025-12-01")],
+            ),
+            OpenApiParameter(
+                name="end",
+                type=str,
+                location=OpenApiParameter.QUERY,
+                required=True,
+                description="End of the window (ISO date or datetime, exclusive).",
+                examples=[OpenApiExample("Example", value="2026-01-05")],
+            ),
+        ],
+        responses={200: AppointmentCalendarRowSerializer(many=True)},
+    )
+    @action(detail=False, methods=["get"])
+    def calendar(self, request):
+        try:
+            start = _parse_calendar_bound(request.query_params.get("start"))
+            end = _parse_calendar_bound(request.query_params.get("end"))
+        except ValueError:
+            return Response(
+                {"error": "Invalid 'start' or 'end'. Use ISO date or datetime."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if start is None or end is None:
+            return Response(
+                {"error": "Parameters 'start' and 'end' are required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if end <= start or end - start > timedelta(days=CALENDAR_MAX_RANGE_DAYS):
+            return Response(
+                {
+                    "error": f"'end' must be after 'start' and at most {CALENDAR_MAX_RANGE_DAYS} days later."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        queryset = self.get_queryset()
+        total, last_modified = AppointmentService.get_calendar_version(
+            queryset, start, end
+        )
+        last_modified_ts = int(last_modified.timestamp()) if last_modified else 0
+        etag = quote_etag(
+            f"{request.user.pk}-{start.timestamp():.0f}-{end.timestamp():.0f}"
+            f"-{total}-{last_modified.timestamp() if last_modified else 0}"
+        )
+
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=last_modified_ts or None
+        )
+        if not_modified is not None:
+            return not_modified
+
+        rows = AppointmentService.get_calendar_rows(queryset, start, end)
+        response = Response(rows)
+        response["ETag"] = etag
+        if last_modified_ts:
+            response["Last-Modified"] = http_date(last_modified_ts)
+        response["Cache-Control"] = "private, no-cache"
+        return response
+
+    @extend_schema(
+        summary="Bulk status transition",
+        description=(
+            "Moves every appointment of a date and/or a list of IDs to a status "
+            "with a single UPDATE. COMPLETED skips future and canceled "
+            "appointments and stamps completed_at. Staff only."
+        ),
+        request=AppointmentBulkStatusSerializer,
+        responses={200: {"description": "Number of updated appointments."}},
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-status",
+        permission_classes=[IsAdminUser],
+    )
+    def bulk_status(self, request):
+        serializer = AppointmentBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        queryset = Appointment.objects.all()
+        if "date" in data:
+            day_start = timezone.make_aware(datetime.combine(data["date"], time.min))
+            queryset = queryset.filter(
+                schedule_time__gte=day_start,
+                schedule_time__lt=day_start + timedelta(days=1),
+            )
+        if "ids" in data:
+            queryset = queryset.filter(pk__in=data["ids"])
+
+        updated = AppointmentService.bulk_update_status(queryset, data["status"])
+        logger.info(
+            "appointments_bulk_status_requested",
+            status=data["status"],
+            updated=updated,
+            requested_by=request.user.username,
+        )
+        return Response({"updated": updated})
+
     @extend_schema(
         summary="Cancel an appointment",
         description="Cancels an appointment if strictly more than 1 hour remains before the scheduled time.",
@@ -189,3 +327,37 @@ class AppointmentViewSet(AutoSchemaModelNameMixin, viewsets.ModelViewSet):
                 {"error": str(e)},
                 status=status.HTTP_400_BAD_REQUEST,
             )
+
+
+@extend_schema(
+    tags=["Schedule - Appointment Series"],
+    description=(
+        "Endpoints for booking recurring appointments. Creating a series books "
+        "every free occurrence at once and reports the dates that conflicted."
+    ),
+)
+class AppointmentSeriesViewSet(AutoSchemaModelNameMixin, viewsets.ModelViewSet):
+    serializer_class = AppointmentSeriesSerializer
+    permission_classes = [IsOwnerOrStaff]
+    http_method_names = ["get", "post", "head", "options"]
+
+    def get_queryset(self):
+        user = self.request.user
+        queryset = AppointmentSeries.objects.select_related(
+            "pet", "service"
+        ).prefetch_related("appointments")
+        if user.is_staff:
+            return queryset
+        return queryset.filter(pet__owner__user=user)
+
+    def perform_create(self, serializer):
+        series = serializer.save()
+        logger.info(
+            "appointment_series_created",
+            series_id=series.id,
+            pet_id=series.pet.id,
+            service_id=series.service.id,
+            occurrences=series.occurrences,
+            conflicts=len(series.booking_conflicts),
+            created_by=self.request.user.username,
+        )
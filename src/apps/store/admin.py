@@ -180,12 +180,13 @@ class ProductAdmin(admin.ModelAdmin):
     @admin.action(description="🤖 Gerar Descrição Técnica (IA)")
     def generate_technical_description(self, request, queryset):
         """Generate technical product descriptions using AI."""
+        from src.apps.ai.clients import get_service
         from src.apps.ai.services import (
             ProductDescriptionRequest,
             ProductIntelligenceService,
         )
 
-        service = ProductIntelligenceService()
+        service = get_service(ProductIntelligenceService)
         success_count = 0
         error_count = 0
 
@@ -232,12 +233,13 @@ class ProductAdmin(admin.ModelAdmin):
     @admin.action(description="✨ Gerar Descrição Criativa (IA)")
     def generate_creative_description(self, request, queryset):
         """Generate creative product descriptions using AI."""
+        from src.apps.ai.clients import get_service
         from src.apps.ai.services import (
             ProductDescriptionRequest,
             ProductIntelligenceService,
         )
 
-        service = ProductIntelligenceService()
+        service = get_service(ProductIntelligenceService)
         success_count = 0
         error_count = 0
 
@@ -361,3 +363,41 @@ class AutoPromotionAdmin(admin.ModelAdmin):
 
     def has_delete_permission(self, request, obj=None):
         return False
+
+
+class NeedsReorderFilter(admin.SimpleListFilter):
+    title = "Precisa de reposição"
+    parameter_name = "needs_reorder"
+
+    def lookups(self, request, model_admin):
+        return [("yes", "Sim"), ("no", "Não")]
+
+    def queryset(self, request, queryset):
+        if self.value() == "yes":
+            return queryset.filter(suggested_quantity__gt=0)
+        if self.value() == "no":
+            return queryset.filter(suggested_quantity=0)
+        return queryset
+
+
+class ReorderSuggestionAdmin(admin.ModelAdmin):
+    list_display = (
+        "product",
+        "stock",
+        "daily_forecast",
+        "days_of_cover",
+        "reorder_point",
+        "suggested_quantity",
+        "stockout_date",
+        "computed_at",
+    )
+    list_display_links = None
+    list_filter = (NeedsReorderFilter,)
+    search_fields = ("product__name", "product__sku")
+    list_select_related = ("product",)
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
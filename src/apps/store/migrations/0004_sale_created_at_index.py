@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("store", "0003_autopromotion_productlot_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="sale",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True, db_index=True, verbose_name="Data da Venda"
+            ),
+        ),
+    ]
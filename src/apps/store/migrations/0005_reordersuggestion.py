@@ -0,0 +1,87 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("store", "0004_sale_created_at_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReorderSuggestion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "daily_forecast",
+                    models.FloatField(
+                        default=0, verbose_name="Previsão de Vendas por Dia"
+                    ),
+                ),
+                (
+                    "stock",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Estoque Atual"
+                    ),
+                ),
+                (
+                    "days_of_cover",
+                    models.FloatField(
+                        blank=True,
+                        help_text="Vazio quando o produto não tem vendas recentes.",
+                        null=True,
+                        verbose_name="Dias de Cobertura",
+                    ),
+                ),
+                (
+                    "reorder_point",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Ponto de Pedido"
+                    ),
+                ),
+                (
+                    "suggested_quantity",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Quantidade Sugerida"
+                    ),
+                ),
+                (
+                    "stockout_date",
+                    models.DateField(
+                        blank=True,
+                        db_index=True,
+                        null=True,
+                        verbose_name="Ruptura Prevista",
+                    ),
+                ),
+                ("computed_at", models.DateTimeField(verbose_name="Calculado em")),
+                (
+                    "product",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reorder_suggestion",
+                        to="store.product",
+                        verbose_name="Produto",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Sugestão de Reposição",
+                "verbose_name_plural": "Sugestões de Reposição",
+                "ordering": [
+                    models.OrderBy(models.F("stockout_date"), nulls_last=True),
+                    "product__name",
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,147 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:51
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("store", "0005_reordersuggestion"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RelatedProductsBuild",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "last_sale_id",
+                    models.PositiveBigIntegerField(verbose_name="Última Venda"),
+                ),
+                (
+                    "total_baskets",
+                    models.PositiveIntegerField(verbose_name="Total de Vendas"),
+                ),
+                (
+                    "built_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Gerado em"),
+                ),
+            ],
+            options={
+                "verbose_name": "Geração de Produtos Relacionados",
+                "verbose_name_plural": "Gerações de Produtos Relacionados",
+                "get_latest_by": "last_sale_id",
+            },
+        ),
+        migrations.CreateModel(
+            name="ProductPairCount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "baskets",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Vendas em Comum"
+                    ),
+                ),
+                (
+                    "product_a",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="store.product",
+                    ),
+                ),
+                (
+                    "product_b",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="store.product",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Contagem de Compras em Conjunto",
+                "verbose_name_plural": "Contagens de Compras em Conjunto",
+                "indexes": [
+                    models.Index(fields=["product_b"], name="product_pair_b_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("product_a", "product_b"), name="unique_product_pair"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="RelatedProduct",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("rank", models.PositiveSmallIntegerField(verbose_name="Posição")),
+                ("lift", models.FloatField(verbose_name="Lift")),
+                (
+                    "confidence",
+                    models.FloatField(
+                        help_text="Fração das vendas do produto que também levaram o relacionado.",
+                        verbose_name="Confiança",
+                    ),
+                ),
+                (
+                    "baskets",
+                    models.PositiveIntegerField(verbose_name="Vendas em Comum"),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="related_products",
+                        to="store.product",
+                        verbose_name="Produto",
+                    ),
+                ),
+                (
+                    "related",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="store.product",
+                        verbose_name="Produto Relacionado",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Produto Relacionado",
+                "verbose_name_plural": "Produtos Relacionados",
+                "ordering": ["product", "rank"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("product", "rank"), name="unique_related_product_rank"
+                    )
+                ],
+            },
+        ),
+    ]
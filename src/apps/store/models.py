@@ -6,6 +6,7 @@ from django.db import models
 from django.utils import timezone
 
 from src.apps.accounts.models import Customer
+from src.apps.core.models import TrackedFieldsMixin
 
 
 class Category(models.Model):
@@ -243,7 +244,7 @@ class PromotionRule(models.Model):
         return f"{self.promotion.name} para o lote {self.lot.lot_number or 'N/A'}"
 
 
-class Sale(models.Model):
+class Sale(TrackedFieldsMixin, models.Model):
     customer = models.ForeignKey(
         Customer,
         on_delete=models.SET_NULL,
@@ -251,7 +252,9 @@ class Sale(models.Model):
         blank=True,
         verbose_name="Cliente",
     )
-    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Data da Venda")
+    created_at = models.DateTimeField(
+        auto_now_add=True, db_index=True, verbose_name="Data da Venda"
+    )
     total_value = models.DecimalField(
         max_digits=10, decimal_places=2, default=0, verbose_name="Valor Total"
     )
@@ -267,6 +270,8 @@ class Sale(models.Model):
         verbose_name_plural = "Vendas"
         ordering = ["-created_at"]
 
+    TRACKED_FIELDS = ("total_value",)
+
     def __str__(self):
         return f"Venda #{self.id} - {self.created_at.strftime('%d/%m/%Y')}"
 
@@ -294,6 +299,116 @@ class SaleItem(models.Model):
         return f"{self.quantity}x {self.product.name} (Lote: {lot_str})"
 
 
+class ReorderSuggestion(models.Model):
+    """Demand forecast and reorder point of a product, rebuilt nightly."""
+
+    product = models.OneToOneField(
+        Product,
+        on_delete=models.CASCADE,
+        related_name="reorder_suggestion",
+        verbose_name="Produto",
+    )
+    daily_forecast = models.FloatField(
+        default=0, verbose_name="Previsão de Vendas por Dia"
+    )
+    stock = models.PositiveIntegerField(default=0, verbose_name="Estoque Atual")
+    days_of_cover = models.FloatField(
+        null=True,
+        blank=True,
+        verbose_name="Dias de Cobertura",
+        help_text="Vazio quando o produto não tem vendas recentes.",
+    )
+    reorder_point = models.PositiveIntegerField(
+        default=0, verbose_name="Ponto de Pedido"
+    )
+    suggested_quantity = models.PositiveIntegerField(
+        default=0, verbose_name="Quantidade Sugerida"
+    )
+    stockout_date = models.DateField(
+        null=True, blank=True, db_index=True, verbose_name="Ruptura Prevista"
+    )
+    computed_at = models.DateTimeField(verbose_name="Calculado em")
+
+    class Meta:
+        ordering = [models.F("stockout_date").asc(nulls_last=True), "product__name"]
+        verbose_name = "Sugestão de Reposição"
+        verbose_name_plural = "Sugestões de Reposição"
+
+    def __str__(self):
+        return f"{self.product.name}: repor {self.suggested_quantity}"
+
+
+class ProductPairCount(models.Model):
+    """
+    Number of sales containing both products, stored once per pair with
+    ``product_a <= product_b``. The diagonal counts sales of one product.
+    """
+
+    product_a = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="+")
+    product_b = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="+")
+    baskets = models.PositiveIntegerField(default=0, verbose_name="Vendas em Comum")
+
+    class Meta:
+        verbose_name = "Contagem de Compras em Conjunto"
+        verbose_name_plural = "Contagens de Compras em Conjunto"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product_a", "product_b"], name="unique_product_pair"
+            ),
+        ]
+        indexes = [models.Index(fields=["product_b"], name="product_pair_b_idx")]
+
+
+class RelatedProduct(models.Model):
+    """One of the top neighbours of a product by co-purchase lift."""
+
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name="related_products",
+        verbose_name="Produto",
+    )
+    related = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="Produto Relacionado",
+    )
+    rank = models.PositiveSmallIntegerField(verbose_name="Posição")
+    lift = models.FloatField(verbose_name="Lift")
+    confidence = models.FloatField(
+        verbose_name="Confiança",
+        help_text="Fração das vendas do produto que também levaram o relacionado.",
+    )
+    baskets = models.PositiveIntegerField(verbose_name="Vendas em Comum")
+
+    class Meta:
+        ordering = ["product", "rank"]
+        verbose_name = "Produto Relacionado"
+        verbose_name_plural = "Produtos Relacionados"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product", "rank"], name="unique_related_product_rank"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.product_id} -> {self.related_id} (#{self.rank})"
+
+
+class RelatedProductsBuild(models.Model):
+    """Watermark of the co-occurrence counts: sales up to ``last_sale_id``."""
+
+    last_sale_id = models.PositiveBigIntegerField(verbose_name="Última Venda")
+    total_baskets = models.PositiveIntegerField(verbose_name="Total de Vendas")
+    built_at = models.DateTimeField(auto_now_add=True, verbose_name="Gerado em")
+
+    class Meta:
+        get_latest_by = "last_sale_id"
+        verbose_name = "Geração de Produtos Relacionados"
+        verbose_name_plural = "Gerações de Produtos Relacionados"
+
+
 class AutoPromotion(ProductLot):
     class Meta:
         proxy = True
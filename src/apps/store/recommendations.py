@@ -0,0 +1,91 @@
+"""
+Vectorized "frequently bought together" scoring.
+
+Baskets are handled as sparse co-occurrence counts in coordinate form:
+parallel arrays of ``(product_a, product_b, baskets)`` with
+``product_a <= product_b``. The diagonal (``product_a == product_b``) holds
+the number of baskets that contain each product.
+"""
+
+import numpy as np
+
+TOP_K = 10
+MIN_PAIR_BASKETS = 2
+
+
+def basket_pairs(
+    sale_ids: np.ndarray, product_ids: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Counts every product pair (diagonal included) over the given baskets.
+
+    ``sale_ids`` and ``product_ids`` are parallel arrays of distinct
+    ``(sale, product)`` items. Returns the upper-triangle coordinates and
+    counts of the co-occurrence matrix.
+    """
+    order = np.lexsort((product_ids, sale_ids))
+    sales, products = sale_ids[order], product_ids[order]
+
+    # Each item pairs with itself and every later item of its basket.
+    basket_ends = np.r_[np.flatnonzero(np.diff(sales)) + 1, len(sales)]
+    basket_sizes = np.diff(np.r_[0, basket_ends])
+    partners = np.repeat(basket_ends, basket_sizes) - np.arange(len(sales))
+
+    left = np.repeat(np.arange(len(sales)), partners)
+    offsets = np.arange(len(left)) - np.repeat(np.cumsum(partners) - partners, partners)
+    right = left + offsets
+
+    pairs = np.stack((products[left], products[right]), axis=1)
+    unique_pairs, counts = np.unique(pairs, axis=0, return_counts=True)
+    return unique_pairs[:, 0], unique_pairs[:, 1], counts
+
+
+def top_related(
+    product_a: np.ndarray,
+    product_b: np.ndarray,
+    baskets: np.ndarray,
+    product_baskets: dict[int, int],
+    total_baskets: int,
+    top_k: int = TOP_K,
+) -> tuple[np.ndarray, ...]:
+    """
+    Scores the off-diagonal pairs in both directions and keeps the ``top_k``
+    neighbours of every product, ranked by lift and then confidence.
+
+    Returns parallel arrays ``(product, related, rank, lift, confidence,
+    baskets)``; ranks start at 1.
+    """
+    keep = (product_a != product_b) & (baskets >= MIN_PAIR_BASKETS)
+    a, b, together = product_a[keep], product_b[keep], baskets[keep]
+
+    source = np.r_[a, b]
+    target = np.r_[b, a]
+    together = np.r_[together, together].astype(np.float64)
+
+    if len(source) == 0:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, empty, empty.astype(np.float64), empty, empty
+
+    lookup = np.vectorize(product_baskets.__getitem__, otypes=[np.float64])
+    source_baskets = lookup(source)
+    target_baskets = lookup(target)
+    confidence = together / source_baskets
+    lift = together * total_baskets / (source_baskets * target_baskets)
+
+    order = np.lexsort((-confidence, -lift, source))
+    source, target = source[order], target[order]
+    lift, confidence, together = lift[order], confidence[order], together[order]
+
+    starts = np.r_[0, np.flatnonzero(np.diff(source)) + 1]
+    group_sizes = np.diff(np.r_[starts, len(source)])
+    rank = np.arange(len(source)) - np.repeat(starts, group_sizes) + 1
+
+    best = rank <= top_k
+    return (
+        source[best],
+        target[best],
+        rank[best],
+        lift[best],
+        confidence[best],
+        together[best].astype(np.int64),
+    )
@@ -1,6 +1,6 @@
 from rest_framework import serializers
 
-from .models import Brand, Category, Product
+from .models import Brand, Category, Product, RelatedProduct, ReorderSuggestion
 from .services import ProductService
 
 
@@ -39,3 +39,35 @@ class ProductSerializer(serializers.ModelSerializer):
     def get_final_price(self, obj: Product) -> str:
         price = ProductService.calculate_product_final_price(obj)
         return f"{price:.2f}"
+
+
+class ReorderSuggestionSerializer(serializers.ModelSerializer):
+    product_name = serializers.CharField(source="product.name", read_only=True)
+
+    class Meta:
+        model = ReorderSuggestion
+        fields = [
+            "product",
+            "product_name",
+            "stock",
+            "daily_forecast",
+            "days_of_cover",
+            "reorder_point",
+            "suggested_quantity",
+            "stockout_date",
+            "computed_at",
+        ]
+        read_only_fields = fields
+
+
+class RelatedProductSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(source="related.id", read_only=True)
+    name = serializers.CharField(source="related.name", read_only=True)
+    price = serializers.DecimalField(
+        source="related.price", max_digits=10, decimal_places=2, read_only=True
+    )
+
+    class Meta:
+        model = RelatedProduct
+        fields = ["id", "name", "price", "rank", "lift", "confidence"]
+        read_only_fields = fields
@@ -1,23 +1,46 @@
 from __future__ import annotations
 
+from datetime import datetime, time, timedelta
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import structlog
-from django.db import transaction
-
-from .models import ProductLot, Sale, SaleItem
+from django.db import connection, transaction
+from django.db.models import F, Q, Sum
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from .forecasting import HISTORY_DAYS, MAX_COVER_DAYS, plan_reorders
+from .models import (
+    Product,
+    ProductLot,
+    ProductPairCount,
+    RelatedProduct,
+    RelatedProductsBuild,
+    ReorderSuggestion,
+    Sale,
+    SaleItem,
+)
+from .recommendations import TOP_K, basket_pairs, top_related
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import User
     from django.db.models.query import QuerySet
 
     from src.apps.accounts.models import Customer
-    from src.apps.store.models import Product
 
 
 logger = structlog.get_logger(__name__)
 
+# Adds a batch of pair counts to the running totals in one statement.
+PAIR_COUNT_UPSERT_SQL = """
+INSERT INTO store_productpaircount (product_a_id, product_b_id, baskets)
+SELECT * FROM unnest(%s::bigint[], %s::bigint[], %s::integer[])
+ON CONFLICT (product_a_id, product_b_id)
+DO UPDATE SET baskets = store_productpaircount.baskets + EXCLUDED.baskets
+"""
+
 
 class InsufficientStockError(Exception):
     """Custom exception for stock validation errors."""
@@ -140,3 +163,232 @@ class ProductService:
                 return first_lot.final_price
 
         return best_price
+
+
+class ReorderService:
+    BATCH_SIZE = 5000
+
+    @staticmethod
+    def compute_suggestions(history_days: int = HISTORY_DAYS) -> int:
+        """
+        Forecasts the daily demand of every product and stores its reorder
+        suggestion. Returns the number of products processed.
+
+        Units sold per product and local day over the last ``history_days``
+        complete days come from one grouped query and are scattered into a
+        ``products x days`` matrix, so the forecast runs as array operations
+        instead of a query per product. Expired lots do not count as stock.
+        """
+        today = timezone.localdate()
+        first_day = today - timedelta(days=history_days)
+        now = timezone.now()
+
+        products = list(
+            Product.objects.annotate(
+                on_hand=Coalesce(
+                    Sum(
+                        "lots__quantity",
+                        filter=Q(lots__expiration_date__isnull=True)
+                        | Q(lots__expiration_date__gte=today),
+                    ),
+                    0,
+                )
+            )
+            .order_by("pk")
+            .values_list("pk", "on_hand")
+        )
+        if not products:
+            return 0
+
+        product_ids = np.array([pk for pk, _ in products], dtype=np.int64)
+        stock = np.array([on_hand for _, on_hand in products], dtype=np.int64)
+
+        sales = (
+            SaleItem.objects.filter(
+                sale__created_at__gte=timezone.make_aware(
+                    datetime.combine(first_day, time.min)
+                ),
+                sale__created_at__lt=timezone.make_aware(
+                    datetime.combine(today, time.min)
+                ),
+            )
+            .annotate(day=TruncDate("sale__created_at"))
+            .values_list("lot__product_id", "day")
+            .annotate(units=Sum("quantity"))
+            .order_by()
+        )
+
+        demand = np.zeros((len(product_ids), history_days), dtype=np.float64)
+        rows = list(sales)
+        if rows:
+            sold_ids = np.array([row[0] for row in rows], dtype=np.int64)
+            days = np.array([(row[1] - first_day).days for row in rows])
+            units = np.array([row[2] for row in rows], dtype=np.float64)
+            np.add.at(demand, (np.searchsorted(product_ids, sold_ids), days), units)
+
+        forecast, cover, reorder_point, suggested = plan_reorders(demand, stock)
+
+        suggestions = []
+        for product_id, on_hand, daily, days, point, quantity in zip(
+            product_ids.tolist(),
+            stock.tolist(),
+            forecast.tolist(),
+            cover.tolist(),
+            reorder_point.tolist(),
+            suggested.tolist(),
+            strict=True,
+        ):
+            has_demand = not np.isnan(days)
+            suggestions.append(
+                ReorderSuggestion(
+                    product_id=product_id,
+                    daily_forecast=round(daily, 2),
+                    stock=on_hand,
+                    days_of_cover=round(days, 1) if has_demand else None,
+                    reorder_point=point,
+                    suggested_quantity=quantity,
+                    stockout_date=(
+                        today + timedelta(days=int(days))
+                        if has_demand and days <= MAX_COVER_DAYS
+                        else None
+                    ),
+                    computed_at=now,
+                )
+            )
+
+        ReorderSuggestion.objects.bulk_create(
+            suggestions,
+            batch_size=ReorderService.BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["product"],
+            update_fields=[
+                "daily_forecast",
+                "stock",
+                "days_of_cover",
+                "reorder_point",
+                "suggested_quantity",
+                "stockout_date",
+                "computed_at",
+            ],
+        )
+
+        logger.info(
+            "reorder_suggestions_computed",
+            products=len(suggestions),
+            to_reorder=int(np.count_nonzero(suggested)),
+        )
+        return len(suggestions)
+
+
+class RecommendationService:
+    BATCH_SIZE = 5000
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild_related_products(full: bool = False, top_k: int = TOP_K) -> int:
+        """
+        Folds the sales made since the last build into the co-occurrence
+        counts and re-ranks the neighbours of the products they touched.
+        Returns the number of new sales processed.
+
+        A product is re-ranked when one of its pair counts changed or when
+        one of its neighbours was sold, since both shift its lift scores.
+        Other products keep their ranking, which only scales with the total
+        number of sales. ``full`` drops everything and rebuilds from the
+        first sale.
+        """
+        if full:
+            RelatedProduct.objects.all().delete()
+            ProductPairCount.objects.all().delete()
+            RelatedProductsBuild.objects.all().delete()
+
+        build = RelatedProductsBuild.objects.order_by("-last_sale_id").first()
+        last_sale_id = build.last_sale_id if build else 0
+        total_baskets = build.total_baskets if build else 0
+
+        items = list(
+            SaleItem.objects.filter(sale_id__gt=last_sale_id)
+            .values_list("sale_id", "lot__product_id")
+            .distinct()
+            .order_by("sale_id")
+        )
+        if not items:
+            return 0
+
+        sale_ids = np.array([sale_id for sale_id, _ in items], dtype=np.int64)
+        product_ids = np.array([product_id for _, product_id in items], dtype=np.int64)
+        new_baskets = len(np.unique(sale_ids))
+        total_baskets += new_baskets
+
+        product_a, product_b, counts = basket_pairs(sale_ids, product_ids)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                PAIR_COUNT_UPSERT_SQL,
+                [product_a.tolist(), product_b.tolist(), counts.tolist()],
+            )
+        RelatedProductsBuild.objects.create(
+            last_sale_id=int(sale_ids.max()), total_baskets=total_baskets
+        )
+
+        touched = np.unique(product_ids).tolist()
+        affected = set(touched)
+        for a, b in ProductPairCount.objects.filter(
+            Q(product_a__in=touched) | Q(product_b__in=touched)
+        ).values_list("product_a", "product_b"):
+            affected.update((a, b))
+
+        pairs = list(
+            ProductPairCount.objects.filter(
+                Q(product_a__in=affected) | Q(product_b__in=affected)
+            ).values_list("product_a", "product_b", "baskets")
+        )
+        product_baskets = {a: n for a, b, n in pairs if a == b}
+        partners = {a for a, _, _ in pairs} | {b for _, b, _ in pairs}
+        product_baskets.update(
+            ProductPairCount.objects.filter(
+                product_a=F("product_b"),
+                product_a__in=partners - product_baskets.keys(),
+            ).values_list("product_a", "baskets")
+        )
+
+        source, target, rank, lift, confidence, together = top_related(
+            np.array([a for a, _, _ in pairs], dtype=np.int64),
+            np.array([b for _, b, _ in pairs], dtype=np.int64),
+            np.array([n for _, _, n in pairs], dtype=np.int64),
+            product_baskets,
+            total_baskets,
+            top_k=top_k,
+        )
+
+        RelatedProduct.objects.filter(product__in=affected).delete()
+        RelatedProduct.objects.bulk_create(
+            [
+                RelatedProduct(
+                    product_id=product_id,
+                    related_id=related_id,
+                    rank=position,
+                    lift=round(score, 4),
+                    confidence=round(share, 4),
+                    baskets=shared,
+                )
+                for product_id, related_id, position, score, share, shared in zip(
+                    source.tolist(),
+                    target.tolist(),
+                    rank.tolist(),
+                    lift.tolist(),
+                    confidence.tolist(),
+                    together.tolist(),
+                    strict=True,
+                )
+                if product_id in affected
+            ],
+            batch_size=RecommendationService.BATCH_SIZE,
+        )
+
+        logger.info(
+            "related_products_rebuilt",
+            new_sales=new_baskets,
+            reranked_products=len(affected),
+            full=full,
+        )
+        return new_baskets
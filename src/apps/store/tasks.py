@@ -24,6 +24,7 @@ from src.apps.store.models import (
     Sale,
     SaleItem,
 )
+from src.apps.store.services import RecommendationService, ReorderService
 
 logger = structlog.get_logger(__name__)
 
@@ -482,6 +483,25 @@ def apply_expiration_discounts() -> str:
     return f"{updated_count} lots had their expiration discount updated."
 
 
+@shared_task
+def compute_reorder_suggestions() -> str:
+    """
+    Rebuilds the demand forecast and reorder suggestion of every product.
+    """
+    processed = ReorderService.compute_suggestions()
+    return f"Reorder suggestions computed for {processed} products."
+
+
+@shared_task
+def rebuild_related_products(full: bool = False) -> str:
+    """
+    Adds the sales made since the last run to the "frequently bought
+    together" recommendations.
+    """
+    processed = RecommendationService.rebuild_related_products(full=full)
+    return f"Related products updated with {processed} new sales."
+
+
 @shared_task
 def generate_daily_sales_report() -> str:
     """
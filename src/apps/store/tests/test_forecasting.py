@@ -0,0 +1,123 @@
+from datetime import timedelta
+
+import numpy as np
+import pytest
+from django.utils import timezone
+from rest_framework import status
+
+from src.apps.store.forecasting import LEAD_TIME_DAYS, plan_reorders, smooth_demand
+from src.apps.store.models import ReorderSuggestion, Sale
+from src.apps.store.services import ReorderService
+from src.apps.store.tasks import compute_reorder_suggestions
+
+from .factories import ProductFactory, ProductLotFactory, SaleFactory, SaleItemFactory
+
+
+class TestForecasting:
+    def test_smooth_demand_weights_recent_days(self):
+        demand = np.array([[4.0, 4.0, 4.0], [0.0, 0.0, 10.0]])
+
+        level = smooth_demand(demand, alpha=0.5)
+
+        assert level.tolist() == [4.0, 5.0]
+
+    def test_plan_reorders_for_steady_demand(self):
+        demand = np.array([[5.0] * 10, [0.0] * 10])
+        stock = np.array([20, 10])
+
+        forecast, cover, reorder_point, suggested = plan_reorders(demand, stock)
+
+        assert forecast.tolist() == [5.0, 0.0]
+        assert cover[0] == 4.0
+        assert np.isnan(cover[1])
+        assert reorder_point.tolist() == [5 * LEAD_TIME_DAYS, 0]
+        assert suggested[0] > 0
+        assert suggested[1] == 0
+
+
+@pytest.mark.django_db
+class TestReorderService:
+    def _sell(self, lot, quantity, days_ago):
+        sale = SaleFactory()
+        SaleItemFactory(sale=sale, lot=lot, quantity=quantity)
+        moment = timezone.now() - timedelta(days=days_ago)
+        Sale.objects.filter(pk=sale.pk).update(created_at=moment)
+
+    def test_compute_suggestions(self):
+        today = timezone.localdate()
+        selling = ProductLotFactory(quantity=20, expiration_date=None)
+        for days_ago in range(1, 15):
+            self._sell(selling, 5, days_ago)
+        self._sell(selling, 50, 0)
+        idle = ProductLotFactory(quantity=10, expiration_date=None)
+        expired = ProductLotFactory(
+            quantity=50, expiration_date=today - timedelta(days=1)
+        )
+
+        processed = ReorderService.compute_suggestions(history_days=14)
+
+        assert processed == 3
+        suggestion = ReorderSuggestion.objects.get(product=selling.product)
+        assert suggestion.daily_forecast == 5.0
+        assert suggestion.stock == 20
+        assert suggestion.days_of_cover == 4.0
+        assert suggestion.stockout_date == today + timedelta(days=4)
+        assert suggestion.reorder_point == 5 * LEAD_TIME_DAYS
+        assert suggestion.suggested_quantity > 0
+
+        quiet = ReorderSuggestion.objects.get(product=idle.product)
+        assert quiet.days_of_cover is None
+        assert quiet.stockout_date is None
+        assert quiet.suggested_quantity == 0
+        assert ReorderSuggestion.objects.get(product=expired.product).stock == 0
+
+    def test_recompute_updates_rows(self):
+        lot = ProductLotFactory(quantity=3, expiration_date=None)
+        ReorderService.compute_suggestions(history_days=7)
+        self._sell(lot, 2, 1)
+
+        ReorderService.compute_suggestions(history_days=7)
+
+        assert ReorderSuggestion.objects.count() == 1
+        assert ReorderSuggestion.objects.get().daily_forecast > 0
+
+    def test_task_without_products(self):
+        assert compute_reorder_suggestions() == (
+            "Reorder suggestions computed for 0 products."
+        )
+
+
+@pytest.mark.django_db
+class TestReorderSuggestionAPI:
+    url = "/api/v1/store/reorder-suggestions/"
+
+    def test_lists_only_products_to_reorder(self, authenticated_client):
+        client, _ = authenticated_client
+        lot = ProductLotFactory(quantity=1, expiration_date=None)
+        sale = SaleFactory()
+        SaleItemFactory(sale=sale, lot=lot, quantity=4)
+        Sale.objects.filter(pk=sale.pk).update(
+            created_at=timezone.now() - timedelta(days=1)
+        )
+        ProductFactory()
+        ReorderService.compute_suggestions(history_days=3)
+
+        response = client.get(self.url, {"needs_reorder": "true"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 1
+        assert response.data["results"][0]["product"] == lot.product.pk
+
+    def test_dashboard_lists_reorder_suggestions(self, admin_client):
+        lot = ProductLotFactory(quantity=0, expiration_date=None)
+        sale = SaleFactory()
+        SaleItemFactory(sale=sale, lot=lot, quantity=3)
+        Sale.objects.filter(pk=sale.pk).update(
+            created_at=timezone.now() - timedelta(days=1)
+        )
+        ReorderService.compute_suggestions(history_days=3)
+
+        response = admin_client.get("/admin/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert lot.product.name in response.content.decode()
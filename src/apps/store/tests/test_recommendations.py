@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+from rest_framework import status
+
+from src.apps.store.models import ProductPairCount, RelatedProduct
+from src.apps.store.recommendations import basket_pairs, top_related
+from src.apps.store.services import RecommendationService
+
+from .factories import ProductLotFactory, SaleFactory, SaleItemFactory
+
+
+class TestCooccurrence:
+    def test_basket_pairs_counts_upper_triangle(self):
+        sale_ids = np.array([1, 1, 1, 2, 2, 3])
+        product_ids = np.array([30, 10, 20, 20, 10, 10])
+
+        a, b, counts = basket_pairs(sale_ids, product_ids)
+
+        assert list(zip(a.tolist(), b.tolist(), counts.tolist(), strict=True)) == [
+            (10, 10, 3),
+            (10, 20, 2),
+            (10, 30, 1),
+            (20, 20, 2),
+            (20, 30, 1),
+            (30, 30, 1),
+        ]
+
+    def test_top_related_ranks_by_lift(self):
+        a = np.array([1, 1, 1, 2, 3])
+        b = np.array([2, 3, 1, 2, 3])
+        counts = np.array([2, 4, 10, 2, 8])
+
+        product, related, rank, lift, confidence, _ = top_related(
+            a, b, counts, {1: 10, 2: 2, 3: 8}, total_baskets=20, top_k=1
+        )
+
+        assert product.tolist() == [1, 2, 3]
+        assert related.tolist() == [2, 1, 1]
+        assert rank.tolist() == [1, 1, 1]
+        assert lift[0] == pytest.approx(2.0)
+        assert confidence[1] == pytest.approx(1.0)
+
+
+@pytest.mark.django_db
+class TestRecommendationService:
+    def _basket(self, *lots):
+        sale = SaleFactory()
+        for lot in lots:
+            SaleItemFactory(sale=sale, lot=lot, quantity=1)
+        return sale
+
+    def test_incremental_rebuild(self):
+        food, treat, toy = (ProductLotFactory(quantity=100) for _ in range(3))
+        self._basket(food, treat)
+        self._basket(food, treat)
+        self._basket(food, toy)
+
+        assert RecommendationService.rebuild_related_products() == 3
+
+        related = RelatedProduct.objects.filter(product=food.product)
+        assert [r.related_id for r in related] == [treat.product_id]
+        assert related[0].baskets == 2
+
+        assert RecommendationService.rebuild_related_products() == 0
+
+        self._basket(food, toy)
+        assert RecommendationService.rebuild_related_products() == 1
+
+        assert (
+            ProductPairCount.objects.get(
+                product_a=min(food.product_id, toy.product_id),
+                product_b=max(food.product_id, toy.product_id),
+            ).baskets
+            == 2
+        )
+        assert list(
+            RelatedProduct.objects.filter(product=food.product).values_list(
+                "related", flat=True
+            )
+        ) == [treat.product_id, toy.product_id]
+
+    def test_full_rebuild_matches_incremental(self):
+        first, second = ProductLotFactory(quantity=100), ProductLotFactory(quantity=100)
+        self._basket(first, second)
+        RecommendationService.rebuild_related_products()
+        self._basket(first, second)
+        RecommendationService.rebuild_related_products()
+        incremental = list(RelatedProduct.objects.values_list("product", "related"))
+
+        assert RecommendationService.rebuild_related_products(full=True) == 2
+        assert (
+            list(RelatedProduct.objects.values_list("product", "related"))
+            == incremental
+        )
+
+    def test_related_endpoint(self, api_client, django_assert_num_queries):
+        first, second = ProductLotFactory(quantity=100), ProductLotFactory(quantity=100)
+        self._basket(first, second)
+        self._basket(first, second)
+        RecommendationService.rebuild_related_products()
+
+        url = f"/api/v1/store/products/{first.product_id}/related/"
+        with django_assert_num_queries(1):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["id"] == second.product_id
+        assert response.json()[0]["rank"] == 1
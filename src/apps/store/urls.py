@@ -6,6 +6,7 @@ from .views import (
     CategoryViewSet,
     LotPriceAPIView,
     ProductViewSet,
+    ReorderSuggestionListView,
 )
 
 router = DefaultRouter()
@@ -16,4 +17,9 @@ router.register(r"products", ProductViewSet, basename="product")
 urlpatterns = [
     path("", include(router.urls)),
     path("lots/<int:pk>/price/", LotPriceAPIView.as_view(), name="lot-price"),
+    path(
+        "reorder-suggestions/",
+        ReorderSuggestionListView.as_view(),
+        name="reorder-suggestions",
+    ),
 ]
@@ -2,7 +2,8 @@ from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import OpenApiParameter, extend_schema
-from rest_framework import status, viewsets
+from rest_framework import generics, status, viewsets
+from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.permissions import IsAdminUser
 from rest_framework.renderers import JSONRenderer
@@ -12,8 +13,21 @@ from rest_framework.views import APIView
 from src.apps.core.views import AutoSchemaModelNameMixin
 from src.petcare.permissions import IsAdminOrAnonReadOnly
 
-from .models import Brand, Category, Product, ProductLot
-from .serializers import BrandSerializer, CategorySerializer, ProductSerializer
+from .models import (
+    Brand,
+    Category,
+    Product,
+    ProductLot,
+    RelatedProduct,
+    ReorderSuggestion,
+)
+from .serializers import (
+    BrandSerializer,
+    CategorySerializer,
+    ProductSerializer,
+    RelatedProductSerializer,
+    ReorderSuggestionSerializer,
+)
 
 
 @extend_schema(
@@ -70,6 +84,19 @@ class ProductViewSet(AutoSchemaModelNameMixin, viewsets.ModelViewSet):
 
         return queryset
 
+    @extend_schema(
+        summary="Frequently bought together",
+        description=(
+            "Products most often sold together with this one, ranked by lift. "
+            "Empty when the product has no co-purchases yet."
+        ),
+        responses={200: RelatedProductSerializer(many=True)},
+    )
+    @action(detail=True, methods=["get"])
+    def related(self, request, pk=None):
+        related = RelatedProduct.objects.filter(product_id=pk).select_related("related")
+        return Response(RelatedProductSerializer(related, many=True).data)
+
 
 @extend_schema(
     tags=["Store - Lots"],
@@ -99,3 +126,30 @@ class LotPriceAPIView(APIView):
             )
         except ProductLot.DoesNotExist:
             return Response(status=status.HTTP_404_NOT_FOUND)
+
+
+@extend_schema(
+    tags=["Store - Reorder Suggestions"],
+    summary="List reorder suggestions",
+    description=(
+        "Nightly demand forecast, reorder point and predicted stock-out date "
+        "of every product, most urgent first."
+    ),
+    parameters=[
+        OpenApiParameter(
+            name="needs_reorder",
+            description="Only return products whose stock is at or below the reorder point.",
+            required=False,
+            type=bool,
+        )
+    ],
+)
+class ReorderSuggestionListView(generics.ListAPIView):
+    serializer_class = ReorderSuggestionSerializer
+    permission_classes = [IsAdminUser]
+
+    def get_queryset(self):
+        queryset = ReorderSuggestion.objects.select_related("product")
+        if self.request.query_params.get("needs_reorder") == "true":
+            return queryset.filter(suggested_quantity__gt=0)
+        return queryset
@@ -1,9 +1,25 @@
 import pytest
 from django.contrib.auth.models import Permission
+from django.core.cache import cache
 from django.test import Client
 from rest_framework.test import APIClient
 
 from src.apps.accounts.factories import UserFactory
+from src.apps.ai.clients import reset_clients
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Cached values must not leak between tests whose data is rolled back."""
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_ai_clients():
+    """Shared AI clients built under one test's patches must not leak."""
+    yield
+    reset_clients()
 
 
 @pytest.fixture
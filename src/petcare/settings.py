@@ -253,6 +253,14 @@ CACHES = {
     }
 }
 
+# Redis used for pub/sub fan-out of live dashboard events.
+DASHBOARD_EVENTS_URL = config(
+    "DASHBOARD_EVENTS_URL", default=config("CACHE_URL", default="redis://redis:6379/1")
+)
+
+if config("TESTING", default=False, cast=bool):
+    CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
 
 # ==============================================================================
 # EMAIL SETTINGS
@@ -284,10 +292,30 @@ CELERY_BEAT_SCHEDULE = {
         "task": "src.apps.schedule.tasks.generate_daily_appointments_report",
         "schedule": crontab(hour=1, minute=0),
     },
+    "appointment-reminders": {
+        "task": "src.apps.schedule.tasks.send_appointment_reminders",
+        "schedule": crontab(minute="*/15"),
+    },
+    "refresh-analytics-rollups": {
+        "task": "src.apps.analytics.tasks.refresh_analytics_rollups",
+        "schedule": crontab(minute="*/15"),
+    },
+    "compute-customer-segments": {
+        "task": "src.apps.analytics.tasks.compute_customer_segments",
+        "schedule": crontab(hour=3, minute=0),
+    },
     "apply-daily-expiration-discounts": {
         "task": "src.apps.store.tasks.apply_expiration_discounts",
         "schedule": crontab(hour=1, minute=30),
     },
+    "compute-reorder-suggestions": {
+        "task": "src.apps.store.tasks.compute_reorder_suggestions",
+        "schedule": crontab(hour=1, minute=45),
+    },
+    "rebuild-related-products": {
+        "task": "src.apps.store.tasks.rebuild_related_products",
+        "schedule": crontab(minute=20),
+    },
     "daily-sales-report": {
         "task": "src.apps.store.tasks.generate_daily_sales_report",
         "schedule": crontab(hour=1, minute=5),